@@ -2,6 +2,9 @@
 # tkinter GUI 환경에서 데이터베이스를 관리하기 위한 파일
 
 import sys
+import queue
+import threading
+from contextlib import contextmanager
 from pathlib import Path
 from datetime import datetime, timedelta
 import tkinter as tk
@@ -14,6 +17,7 @@ sys.path.insert(0, str(project_root))
 
 from mysql.connector import connect
 from config import DB_CONFIG
+from app.utils.reference_cache import bump_cache_version, REFERENCE_CACHE_NAME, ENROLLMENT_CACHE_NAME
 
 # 로컬 실행 시 Docker MySQL에 연결하기 위한 설정
 # Docker 컨테이너 내부에서는 'db'를 사용하고, 로컬에서는 'localhost:3307'을 사용
@@ -37,6 +41,137 @@ TABLES = [
     'checkin'
 ]
 
+# 변경 시 웹 애플리케이션의 메모리 캐시를 무효화해야 하는 테이블 (테이블 -> cache_version.name)
+CACHE_VERSION_TABLES = {
+    'professor': REFERENCE_CACHE_NAME,
+    'subject': REFERENCE_CACHE_NAME,
+    'subject_schedule': REFERENCE_CACHE_NAME,
+    'enrollment': ENROLLMENT_CACHE_NAME
+}
+
+# Treeview 페이지 조회 설정
+# 테이블 전체를 읽지 않고 스크롤 위치에 따라 기본 키 순서로 한 페이지씩 불러오며,
+# 위젯에는 최대 ADMIN_MAX_LOADED_ROWS행만 유지합니다. (반대쪽 끝의 행은 제거)
+ADMIN_PAGE_SIZE = 200
+ADMIN_MAX_LOADED_ROWS = 1000
+ADMIN_SCROLL_THRESHOLD = 0.1  # 스크롤이 위/아래 끝에서 이 비율 안에 들어오면 다음 페이지 조회
+
+# 작업자 스레드 결과 확인 주기 (밀리초)
+WORKER_POLL_MS = 100
+
+
+def bump_table_cache_version(cursor, table_name):
+    """
+    캐시 대상 테이블을 변경한 경우 cache_version을 올려 웹 애플리케이션 캐시를 무효화합니다.
+    (웹 애플리케이션과 같은 app/utils/reference_cache.py의 bump_cache_version() 사용)
+    변경 작업과 같은 트랜잭션에서 호출하고 함께 커밋합니다.
+    """
+    cache_name = CACHE_VERSION_TABLES.get(table_name)
+    if cache_name:
+        bump_cache_version(cursor, cache_name)
+
+
+class AdminTaskCancelled(Exception):
+    """작업자 스레드의 작업이 사용자 요청으로 취소된 경우 발생합니다."""
+
+
+@contextmanager
+def open_admin_connection(connection=None):
+    """
+    DB 연결을 사용하는 컨텍스트 매니저입니다.
+    connection이 주어지면 그대로 사용하고(닫지 않음), 없으면 새로 연결한 뒤 블록이 끝나면 닫습니다.
+    """
+    if connection is not None:
+        yield connection
+    else:
+        with connect(**LOCAL_DB_CONFIG) as new_connection:
+            yield new_connection
+
+
+class AdminDBWorker:
+    """
+    GUI의 DB 작업을 tkinter 메인 스레드 밖에서 실행하는 작업자 스레드입니다.
+    
+    - 작업은 submit() 순서대로 하나씩 실행되며, 모든 작업이 하나의 연결을 재사용합니다.
+      (연결은 이 스레드에서만 사용하고, 끊어진 경우에만 다시 연결)
+    - 작업 함수는 func(connection, progress) 형태이며, progress(메시지)로 진행 상황을 알립니다.
+      취소가 요청된 뒤 progress()를 호출하면 AdminTaskCancelled가 발생합니다.
+    - 결과는 (작업 ID, 종류, 값) 튜플로 result_queue에 넣으며, GUI가 root.after로 주기적으로 꺼내 처리합니다.
+      종류: 'progress'(메시지), 'done'(반환값), 'cancelled'(None), 'error'(예외)
+    """
+    def __init__(self):
+        self.task_queue = queue.Queue()
+        self.result_queue = queue.Queue()
+        self.cancel_event = threading.Event()
+        self.connection = None
+        self.thread = threading.Thread(target=self.run, name="admin-db-worker", daemon=True)
+        self.thread.start()
+    
+    def submit(self, task_id, func):
+        """작업을 대기열에 추가합니다."""
+        self.cancel_event.clear()
+        self.task_queue.put((task_id, func))
+    
+    def cancel(self):
+        """실행 중인 작업의 취소를 요청합니다. (다음 progress() 호출 시점에 중단)"""
+        self.cancel_event.set()
+    
+    def stop(self):
+        """남은 작업을 마친 뒤 스레드를 종료하고 연결을 닫습니다."""
+        self.task_queue.put(None)
+    
+    def get_connection(self):
+        """재사용하는 연결을 반환합니다. (처음 사용하거나 끊어진 경우 새로 연결)"""
+        if self.connection is None or not self.connection.is_connected():
+            self.close_connection()
+            self.connection = connect(**LOCAL_DB_CONFIG)
+        return self.connection
+    
+    def close_connection(self):
+        if self.connection is not None:
+            try:
+                self.connection.close()
+            except Exception:
+                pass
+            self.connection = None
+    
+    def end_transaction(self):
+        """
+        작업이 남긴 트랜잭션을 롤백합니다.
+        연결을 재사용하므로, 조회만 한 작업이라도 트랜잭션을 끝내야 다음 작업이 최신 데이터를 읽습니다.
+        """
+        try:
+            if self.connection is not None and self.connection.in_transaction:
+                self.connection.rollback()
+        except Exception:
+            # 롤백할 수 없는 연결은 버리고 다음 작업에서 다시 연결
+            self.close_connection()
+    
+    def run(self):
+        while True:
+            task = self.task_queue.get()
+            if task is None:
+                break
+            task_id, func = task
+            
+            def progress(message, task_id=task_id):
+                if self.cancel_event.is_set():
+                    raise AdminTaskCancelled()
+                self.result_queue.put((task_id, 'progress', message))
+            
+            try:
+                progress(None)
+                result = func(self.get_connection(), progress)
+                self.result_queue.put((task_id, 'done', result))
+            except AdminTaskCancelled:
+                self.result_queue.put((task_id, 'cancelled', None))
+            except Exception as e:
+                self.result_queue.put((task_id, 'error', e))
+            finally:
+                self.end_transaction()
+        self.close_connection()
+
+
 class DatabaseAdminGUI:
     def __init__(self, root):
         self.root = root
@@ -44,12 +179,24 @@ class DatabaseAdminGUI:
         self.root.geometry("1200x700")
         
         self.current_table = None
-        self.table_data = []
+        self.table_data = []  # 현재 Treeview에 표시 중인 행 (기본 키 순서, 최대 ADMIN_MAX_LOADED_ROWS행)
         self.table_columns = []
         self.column_types = {}  # 컬럼 타입 정보
+        self.key_columns = []  # 기본 키 컬럼 (복합 키 포함)
         self.row_data_map = {}  # Treeview item_id -> row_data 매핑
+        self.has_more_before = False  # 표시 중인 범위 앞에 행이 더 있는지
+        self.has_more_after = False  # 표시 중인 범위 뒤에 행이 더 있는지
+        self.estimated_rows = None  # 전체 행 수 추정값 (information_schema)
+        self.page_loading = False  # 페이지 조회 중복 방지
+        
+        # DB 작업은 작업자 스레드에서 실행 (한 번에 하나, current_task가 실행 중인 작업)
+        self.worker = AdminDBWorker()
+        self.current_task = None
+        self.task_counter = 0
         
         self.setup_ui()
+        self.root.protocol("WM_DELETE_WINDOW", self.on_close)
+        self.root.after(WORKER_POLL_MS, self.poll_worker)
         self.load_table_list()
         
     def setup_ui(self):
@@ -65,6 +212,10 @@ class DatabaseAdminGUI:
         
         ttk.Button(top_frame, text="새로고침", command=self.refresh_data).pack(side=tk.LEFT, padx=5)
         
+        # 불러온 행 수 / 전체 행 수 추정값 표시
+        self.status_label = ttk.Label(top_frame, text="", font=("Arial", 10))
+        self.status_label.pack(side=tk.LEFT, padx=15)
+        
         # 중간 프레임: 데이터 표시
         middle_frame = ttk.Frame(self.root, padding="10")
         middle_frame.pack(fill=tk.BOTH, expand=True)
@@ -73,16 +224,17 @@ class DatabaseAdminGUI:
         tree_frame = ttk.Frame(middle_frame)
         tree_frame.pack(fill=tk.BOTH, expand=True)
         
-        scrollbar_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
-        scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
+        self.scrollbar_y = ttk.Scrollbar(tree_frame, orient=tk.VERTICAL)
+        self.scrollbar_y.pack(side=tk.RIGHT, fill=tk.Y)
         
         scrollbar_x = ttk.Scrollbar(tree_frame, orient=tk.HORIZONTAL)
         scrollbar_x.pack(side=tk.BOTTOM, fill=tk.X)
         
-        self.tree = ttk.Treeview(tree_frame, yscrollcommand=scrollbar_y.set, xscrollcommand=scrollbar_x.set)
+        # 세로 스크롤 위치가 바뀔 때마다 on_tree_scroll에서 다음/이전 페이지 조회 여부를 확인
+        self.tree = ttk.Treeview(tree_frame, yscrollcommand=self.on_tree_scroll, xscrollcommand=scrollbar_x.set)
         self.tree.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
-        scrollbar_y.config(command=self.tree.yview)
+        self.scrollbar_y.config(command=self.tree.yview)
         scrollbar_x.config(command=self.tree.xview)
         
         # 하단 프레임: 버튼
@@ -98,6 +250,14 @@ class DatabaseAdminGUI:
         ttk.Button(bottom_frame, text="DB 리셋", command=self.reset_database).pack(side=tk.LEFT, padx=5)
         ttk.Button(bottom_frame, text="테스트 데이터 삽입", command=self.insert_test_data).pack(side=tk.LEFT, padx=5)
         
+        # 작업 진행 표시 및 취소
+        self.cancel_button = ttk.Button(bottom_frame, text="취소", command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.RIGHT, padx=5)
+        self.progress_bar = ttk.Progressbar(bottom_frame, mode='indeterminate', length=150)
+        self.progress_bar.pack(side=tk.RIGHT, padx=5)
+        self.progress_label = ttk.Label(bottom_frame, text="", font=("Arial", 10))
+        self.progress_label.pack(side=tk.RIGHT, padx=5)
+        
     def load_table_list(self):
         """Combobox에 테이블 목록 로드"""
         self.table_combo['values'] = TABLES
@@ -105,52 +265,265 @@ class DatabaseAdminGUI:
             self.table_combo.current(0)
             self.on_table_selected()
     
+    def run_db_task(self, description, func, on_success=None):
+        """
+        DB 작업을 작업자 스레드에서 실행합니다.
+        다른 작업이 실행 중이면 실행하지 않고 False를 반환합니다.
+        
+        Args:
+            description: 진행 표시와 메시지에 사용할 작업 이름
+            func: func(connection, progress) 형태의 작업 함수 (작업자 스레드에서 실행, 위젯 접근 금지)
+            on_success: 작업 결과를 받아 메인 스레드에서 호출할 함수
+        """
+        if self.current_task is not None:
+            messagebox.showwarning("경고", f"'{self.current_task['description']}' 작업이 진행 중입니다.")
+            return False
+        
+        self.task_counter += 1
+        self.current_task = {'id': self.task_counter, 'description': description, 'on_success': on_success}
+        self.progress_label.config(text=f"{description} 중...")
+        self.progress_bar.start(10)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.worker.submit(self.task_counter, func)
+        return True
+    
+    def poll_worker(self):
+        """작업자 스레드의 결과 큐를 확인하여 진행 메시지와 완료 결과를 처리합니다. (WORKER_POLL_MS마다 호출)"""
+        try:
+            while True:
+                try:
+                    task_id, kind, payload = self.worker.result_queue.get_nowait()
+                except queue.Empty:
+                    break
+                task = self.current_task
+                if task is None or task['id'] != task_id:
+                    continue
+                
+                if kind == 'progress':
+                    if payload:
+                        self.progress_label.config(text=payload)
+                    continue
+                
+                # 작업 종료: 다음 작업을 받을 수 있도록 먼저 상태를 정리
+                self.current_task = None
+                self.page_loading = False
+                self.progress_bar.stop()
+                self.cancel_button.config(state=tk.DISABLED)
+                self.progress_label.config(text="")
+                
+                if kind == 'done':
+                    if task['on_success']:
+                        task['on_success'](payload)
+                elif kind == 'cancelled':
+                    messagebox.showinfo("알림", f"{task['description']} 작업이 취소되었습니다.")
+                else:
+                    messagebox.showerror("오류", f"{task['description']} 중 오류 발생: {payload}")
+        finally:
+            self.root.after(WORKER_POLL_MS, self.poll_worker)
+    
+    def cancel_task(self):
+        """실행 중인 작업 취소 요청"""
+        if self.current_task is not None:
+            self.worker.cancel()
+            self.progress_label.config(text="취소하는 중...")
+    
+    def on_close(self):
+        """창을 닫을 때 실행 중인 작업을 취소하고 작업자 스레드를 종료"""
+        self.worker.cancel()
+        self.worker.stop()
+        self.root.destroy()
+    
     def on_table_selected(self, event=None):
         """테이블 선택 시 데이터 로드"""
         selected_table = self.table_combo.get()
+        if self.current_task is not None:
+            # 작업 중에는 테이블을 바꾸지 않음
+            messagebox.showwarning("경고", f"'{self.current_task['description']}' 작업이 진행 중입니다.")
+            if self.current_table:
+                self.table_combo.set(self.current_table)
+            return
         if selected_table:
             self.current_table = selected_table
             self.load_table_data()
     
-    def load_table_data(self):
-        """선택된 테이블의 데이터 로드 및 표시"""
+    def load_table_data(self, on_loaded=None):
+        """
+        선택된 테이블의 컬럼 정보, 전체 행 수 추정값, 첫 페이지를 로드하여 표시합니다.
+        나머지 행은 스크롤할 때 load_next_page() / load_prev_page()가 불러옵니다.
+        """
         if not self.current_table:
             return
+        table_name = self.current_table
         
-        try:
-            with connect(**LOCAL_DB_CONFIG) as connection:
-                with connection.cursor(dictionary=True) as cursor:
-                    cursor.execute("USE wcheck")
-                    
-                    # 컬럼 정보 가져오기 (타입 정보 포함)
-                    cursor.execute(f"DESCRIBE {self.current_table}")
-                    columns_info = cursor.fetchall()
-                    self.table_columns = [col['Field'] for col in columns_info]
-                    # 컬럼 타입 정보 저장 (타입 변환에 사용)
-                    # Type과 Null 정보를 함께 저장
-                    self.column_types = {}
-                    for col in columns_info:
-                        field_name = col['Field']
-                        self.column_types[field_name] = {
-                            'type': col['Type'],
-                            'null': col['Null']
-                        }
-                    
-                    # 데이터 가져오기
-                    cursor.execute(f"SELECT * FROM {self.current_table}")
-                    self.table_data = cursor.fetchall()
+        def task(connection, progress):
+            with connection.cursor(dictionary=True) as cursor:
+                cursor.execute("USE wcheck")
+                
+                # 컬럼 정보 가져오기 (타입 정보 포함)
+                cursor.execute(f"DESCRIBE {table_name}")
+                columns_info = cursor.fetchall()
+                # 기본 키 컬럼 (페이지 경계 조건과 Treeview iid에 사용)
+                key_columns = [col['Field'] for col in columns_info if col['Key'] == 'PRI']
+                
+                # 전체 행 수는 COUNT(*) 대신 통계 정보의 추정값 사용 (큰 테이블도 즉시 조회)
+                cursor.execute("""
+                    SELECT TABLE_ROWS
+                    FROM information_schema.TABLES
+                    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = %s
+                """, (table_name,))
+                estimate = cursor.fetchone()
+                
+                # 첫 페이지 가져오기
+                progress(f"{table_name} 첫 페이지 조회 중...")
+                rows, has_more = self.fetch_page(cursor, table_name, key_columns)
+            return columns_info, key_columns, estimate['TABLE_ROWS'] if estimate else None, rows, has_more
+        
+        def apply(result):
+            columns_info, self.key_columns, self.estimated_rows, rows, has_more = result
+            self.table_columns = [col['Field'] for col in columns_info]
+            # 컬럼 타입 정보 저장 (타입 변환에 사용)
+            # Type과 Null 정보를 함께 저장
+            self.column_types = {}
+            for col in columns_info:
+                field_name = col['Field']
+                self.column_types[field_name] = {
+                    'type': col['Type'],
+                    'null': col['Null']
+                }
+            self.table_data = rows
+            self.has_more_before = False
+            self.has_more_after = has_more
             
             # Treeview 업데이트
             self.update_treeview()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"데이터 로드 중 오류 발생: {e}")
+            if on_loaded:
+                on_loaded()
+        
+        self.run_db_task("데이터 로드", task, apply)
+    
+    @staticmethod
+    def fetch_page(cursor, table_name, key_columns, after_row=None, before_row=None):
+        """
+        테이블의 한 페이지를 기본 키 순서로 조회합니다. (키셋 페이지네이션)
+        
+        - after_row: 이 행 다음 행부터 ADMIN_PAGE_SIZE행
+        - before_row: 이 행 앞의 ADMIN_PAGE_SIZE행 (기본 키 오름차순으로 반환)
+        - 기본 키가 없는 테이블은 첫 페이지만 조회 (다음 페이지를 지정할 수 없으므로 has_more는 항상 False)
+        
+        Returns:
+            (rows, has_more) 튜플 - 행 리스트와 같은 방향으로 행이 더 있는지 여부
+        """
+        key_list = ', '.join(key_columns)
+        key_row = f"({key_list})" if len(key_columns) > 1 else key_list
+        boundary_row = after_row or before_row
+        
+        where = ''
+        params = []
+        if key_columns and boundary_row:
+            params = [boundary_row[col] for col in key_columns]
+            placeholders = ', '.join(['%s'] * len(params))
+            boundary = f"({placeholders})" if len(params) > 1 else placeholders
+            where = f"WHERE {key_row} {'>' if after_row else '<'} {boundary}"
+        
+        order = ''
+        if key_columns:
+            sort = 'DESC' if before_row else 'ASC'
+            order = 'ORDER BY ' + ', '.join(f"{col} {sort}" for col in key_columns)
+        
+        # 한 행을 더 조회하여 다음 페이지가 있는지 확인
+        cursor.execute(f"SELECT * FROM {table_name} {where} {order} LIMIT %s", (*params, ADMIN_PAGE_SIZE + 1))
+        rows = cursor.fetchall()
+        # 기본 키가 없으면 같은 첫 페이지를 다시 불러와 중복 표시하지 않도록 더 불러오지 않음
+        has_more = bool(key_columns) and len(rows) > ADMIN_PAGE_SIZE
+        rows = rows[:ADMIN_PAGE_SIZE]
+        if before_row:
+            # 역순으로 조회했으므로 다시 기본 키 오름차순으로 정렬
+            rows.reverse()
+        return rows, has_more
+    
+    def on_tree_scroll(self, first, last):
+        """
+        Treeview 세로 스크롤 위치가 바뀔 때 호출됩니다.
+        스크롤바를 갱신하고, 표시 범위의 끝에 가까워지면 다음/이전 페이지를 불러옵니다.
+        """
+        self.scrollbar_y.set(first, last)
+        if self.page_loading or self.current_task is not None or not self.table_data:
+            return
+        
+        # 위젯 갱신 중에 호출되므로 실제 조회는 유휴 시점에 실행
+        if float(last) >= 1 - ADMIN_SCROLL_THRESHOLD and self.has_more_after:
+            self.page_loading = True
+            self.root.after_idle(self.load_next_page)
+        elif float(first) <= ADMIN_SCROLL_THRESHOLD and self.has_more_before:
+            self.page_loading = True
+            self.root.after_idle(self.load_prev_page)
+    
+    def load_next_page(self):
+        """표시 중인 마지막 행 다음 페이지를 불러와 뒤에 추가합니다. (앞쪽 행은 최대 행 수를 넘으면 제거)"""
+        self.load_page(after_row=self.table_data[-1])
+    
+    def load_prev_page(self):
+        """표시 중인 첫 행 앞 페이지를 불러와 앞에 추가합니다. (뒤쪽 행은 최대 행 수를 넘으면 제거)"""
+        self.load_page(before_row=self.table_data[0])
+    
+    def load_page(self, after_row=None, before_row=None):
+        """다음/이전 페이지를 작업자 스레드에서 조회합니다."""
+        if self.current_task is not None:
+            # 스크롤 예약 후 다른 작업이 시작된 경우 다음 스크롤 때 다시 시도
+            self.page_loading = False
+            return
+        table_name = self.current_table
+        key_columns = list(self.key_columns)
+        
+        def task(connection, progress):
+            with connection.cursor(dictionary=True) as cursor:
+                cursor.execute("USE wcheck")
+                return self.fetch_page(cursor, table_name, key_columns, after_row=after_row, before_row=before_row)
+        
+        def apply(result):
+            # 조회하는 동안 다른 테이블로 바뀌었으면 무시
+            if table_name == self.current_table:
+                self.apply_page(*result, append=after_row is not None)
+        
+        self.run_db_task("페이지 조회", task, apply)
+    
+    def apply_page(self, rows, has_more, append):
+        """조회한 페이지를 Treeview에 반영하고, 표시 행 수를 ADMIN_MAX_LOADED_ROWS 이하로 유지합니다."""
+        # 현재 화면 맨 위에 보이는 행을 기억해 두었다가, 행을 추가/제거한 뒤 같은 위치로 되돌림
+        children = self.tree.get_children()
+        top_index = min(int(self.tree.yview()[0] * len(children)), len(children) - 1)
+        anchor_item = children[top_index] if children else None
+        
+        if append:
+            self.has_more_after = has_more
+            for row in rows:
+                self.insert_row(row, tk.END)
+            self.table_data = self.table_data + rows
+            overflow = len(self.table_data) - ADMIN_MAX_LOADED_ROWS
+            if overflow > 0:
+                self.remove_rows(self.tree.get_children()[:overflow])
+                self.table_data = self.table_data[overflow:]
+                self.has_more_before = True
+        else:
+            self.has_more_before = has_more
+            for row in reversed(rows):
+                self.insert_row(row, 0)
+            self.table_data = rows + self.table_data
+            overflow = len(self.table_data) - ADMIN_MAX_LOADED_ROWS
+            if overflow > 0:
+                self.remove_rows(self.tree.get_children()[-overflow:])
+                self.table_data = self.table_data[:-overflow]
+                self.has_more_after = True
+        
+        if anchor_item and self.tree.exists(anchor_item):
+            self.tree.yview_moveto(self.tree.index(anchor_item) / len(self.table_data))
+        self.update_status()
     
     def update_treeview(self):
         """Treeview에 데이터 표시"""
         # 기존 항목 삭제
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        self.tree.delete(*self.tree.get_children())
+        self.row_data_map = {}  # iid -> row_data 매핑
         
         if not self.table_columns:
             return
@@ -164,30 +537,45 @@ class DatabaseAdminGUI:
             self.tree.heading(col, text=col)
             self.tree.column(col, width=120, anchor=tk.W)
         
-        # PRIMARY KEY 찾기
-        pk_column = self.get_primary_key_column()
-        
         # 데이터 삽입 (PK를 iid로 사용)
-        self.row_data_map = {}  # iid -> row_data 매핑
         for row in self.table_data:
-            values = [str(row.get(col, '')) if row.get(col) is not None else '' for col in self.table_columns]
-            
-            # PK를 iid로 사용 (enrollment는 복합 키)
-            if self.current_table == 'enrollment':
-                iid = f"{row.get('student_id', '')}_{row.get('subject_id', '')}"
-            elif pk_column and pk_column in row:
-                iid = str(row[pk_column])
-            else:
-                iid = ''
-            
-            item_id = self.tree.insert('', tk.END, iid=iid, values=values)
-            self.row_data_map[item_id] = row
+            self.insert_row(row, tk.END)
+        self.tree.yview_moveto(0)
+        self.update_status()
+    
+    def insert_row(self, row, index):
+        """행 하나를 Treeview의 index 위치에 삽입합니다. (기본 키 값을 iid로 사용, 복합 키는 '_'로 연결)"""
+        values = [str(row.get(col, '')) if row.get(col) is not None else '' for col in self.table_columns]
+        iid = '_'.join(str(row[col]) for col in self.key_columns) if self.key_columns else None
+        item_id = self.tree.insert('', index, iid=iid, values=values)
+        self.row_data_map[item_id] = row
+    
+    def remove_rows(self, item_ids):
+        """Treeview에서 행들을 제거합니다."""
+        self.tree.delete(*item_ids)
+        for item_id in item_ids:
+            self.row_data_map.pop(item_id, None)
+    
+    def update_status(self):
+        """불러온 행 수와 전체 행 수 추정값을 표시합니다."""
+        text = f"표시 중: {len(self.table_data):,}행"
+        if self.estimated_rows is not None:
+            text += f" / 전체 약 {self.estimated_rows:,}행"
+        if self.has_more_before or self.has_more_after:
+            text += " (스크롤하면 더 불러옴)"
+        elif not self.key_columns and len(self.table_data) >= ADMIN_PAGE_SIZE:
+            text += f" (기본 키가 없어 처음 {ADMIN_PAGE_SIZE:,}행만 표시)"
+        self.status_label.config(text=text)
     
     def get_primary_key_column(self):
         """PRIMARY KEY 컬럼 찾기"""
         if not self.table_columns:
             return None
         
+        # DESCRIBE로 확인한 기본 키가 있으면 첫 번째 컬럼 사용 (복합 키인 enrollment는 호출부에서 따로 처리)
+        if self.key_columns:
+            return self.key_columns[0]
+        
         # 일반적인 PK 패턴 확인
         for col in self.table_columns:
             if col.endswith('_id') or col in ['student_id', 'professor_id', 'subject_id', 
@@ -200,8 +588,7 @@ class DatabaseAdminGUI:
     def refresh_data(self):
         """데이터 새로고침"""
         if self.current_table:
-            self.load_table_data()
-            messagebox.showinfo("알림", "데이터가 새로고침되었습니다.")
+            self.load_table_data(on_loaded=lambda: messagebox.showinfo("알림", "데이터가 새로고침되었습니다."))
     
     def add_record(self):
         """레코드 추가"""
@@ -213,26 +600,26 @@ class DatabaseAdminGUI:
         self.root.wait_window(dialog.dialog)
         
         if dialog.result:
-            try:
-                with connect(**LOCAL_DB_CONFIG) as connection:
-                    with connection.cursor() as cursor:
-                        cursor.execute("USE wcheck")
-                        
-                        # INSERT 쿼리 생성
-                        columns = [col for col in self.table_columns if col not in ['created_at'] and dialog.result.get(col) is not None]
-                        values = [dialog.result[col] for col in columns]
-                        placeholders = ', '.join(['%s'] * len(values))
-                        columns_str = ', '.join(columns)
-                        
-                        query = f"INSERT INTO {self.current_table} ({columns_str}) VALUES ({placeholders})"
-                        cursor.execute(query, values)
-                        connection.commit()
-                
+            table_name = self.current_table
+            # INSERT 쿼리 생성
+            columns = [col for col in self.table_columns if col not in ['created_at'] and dialog.result.get(col) is not None]
+            values = [dialog.result[col] for col in columns]
+            placeholders = ', '.join(['%s'] * len(values))
+            columns_str = ', '.join(columns)
+            query = f"INSERT INTO {table_name} ({columns_str}) VALUES ({placeholders})"
+            
+            def task(connection, progress):
+                with connection.cursor() as cursor:
+                    cursor.execute("USE wcheck")
+                    cursor.execute(query, values)
+                    bump_table_cache_version(cursor, table_name)
+                    connection.commit()
+            
+            def done(result):
                 messagebox.showinfo("성공", "레코드가 추가되었습니다.")
                 self.load_table_data()
-                
-            except Exception as e:
-                messagebox.showerror("오류", f"레코드 추가 중 오류 발생: {e}")
+            
+            self.run_db_task("레코드 추가", task, done)
     
     def update_record(self):
         """레코드 수정"""
@@ -257,40 +644,38 @@ class DatabaseAdminGUI:
         self.root.wait_window(dialog.dialog)
         
         if dialog.result:
-            try:
-                with connect(**LOCAL_DB_CONFIG) as connection:
-                    with connection.cursor() as cursor:
-                        cursor.execute("USE wcheck")
-                        
-                        # PRIMARY KEY 찾기
-                        pk_column = self.get_primary_key_column()
-                        
-                        # enrollment 테이블은 복합 PRIMARY KEY 처리
-                        if self.current_table == 'enrollment':
-                            update_cols = [col for col in self.table_columns if col not in ['student_id', 'subject_id', 'registered_at'] and dialog.result.get(col) is not None]
-                            if update_cols:
-                                update_values = [dialog.result[col] for col in update_cols]
-                                set_clause = ', '.join([f"{col} = %s" for col in update_cols])
-                                query = f"UPDATE {self.current_table} SET {set_clause} WHERE student_id = %s AND subject_id = %s"
-                                update_values.extend([original_data['student_id'], original_data['subject_id']])
-                                cursor.execute(query, update_values)
-                        else:
-                            # UPDATE 쿼리 생성
-                            update_cols = [col for col in self.table_columns if col != pk_column and col not in ['created_at'] and dialog.result.get(col) is not None]
-                            update_values = [dialog.result[col] for col in update_cols]
-                            set_clause = ', '.join([f"{col} = %s" for col in update_cols])
-                            
-                            query = f"UPDATE {self.current_table} SET {set_clause} WHERE {pk_column} = %s"
-                            update_values.append(original_data[pk_column])
-                            cursor.execute(query, update_values)
-                        
-                        connection.commit()
-                
+            table_name = self.current_table
+            # PRIMARY KEY 찾기
+            pk_column = self.get_primary_key_column()
+            
+            # enrollment 테이블은 복합 PRIMARY KEY 처리
+            if table_name == 'enrollment':
+                update_cols = [col for col in self.table_columns if col not in ['student_id', 'subject_id', 'registered_at'] and dialog.result.get(col) is not None]
+                update_values = [dialog.result[col] for col in update_cols]
+                set_clause = ', '.join([f"{col} = %s" for col in update_cols])
+                query = f"UPDATE {table_name} SET {set_clause} WHERE student_id = %s AND subject_id = %s"
+                update_values.extend([original_data['student_id'], original_data['subject_id']])
+            else:
+                # UPDATE 쿼리 생성
+                update_cols = [col for col in self.table_columns if col != pk_column and col not in ['created_at'] and dialog.result.get(col) is not None]
+                update_values = [dialog.result[col] for col in update_cols]
+                set_clause = ', '.join([f"{col} = %s" for col in update_cols])
+                query = f"UPDATE {table_name} SET {set_clause} WHERE {pk_column} = %s"
+                update_values.append(original_data[pk_column])
+            
+            def task(connection, progress):
+                with connection.cursor() as cursor:
+                    cursor.execute("USE wcheck")
+                    if update_cols:
+                        cursor.execute(query, update_values)
+                    bump_table_cache_version(cursor, table_name)
+                    connection.commit()
+            
+            def done(result):
                 messagebox.showinfo("성공", "레코드가 수정되었습니다.")
                 self.load_table_data()
-                
-            except Exception as e:
-                messagebox.showerror("오류", f"레코드 수정 중 오류 발생: {e}")
+            
+            self.run_db_task("레코드 수정", task, done)
     
     def delete_record(self):
         """레코드 삭제"""
@@ -314,58 +699,59 @@ class DatabaseAdminGUI:
             return
         
         original_data = self.row_data_map[item_id]
+        table_name = self.current_table
+        # PRIMARY KEY 찾기
+        pk_column = self.get_primary_key_column()
         
-        try:
-            with connect(**LOCAL_DB_CONFIG) as connection:
-                with connection.cursor() as cursor:
-                    cursor.execute("USE wcheck")
-                    
-                    # PRIMARY KEY 찾기
-                    pk_column = self.get_primary_key_column()
-                    
-                    # enrollment 테이블은 복합 PRIMARY KEY 처리
-                    if self.current_table == 'enrollment':
-                        query = f"DELETE FROM {self.current_table} WHERE student_id = %s AND subject_id = %s"
-                        cursor.execute(query, (original_data['student_id'], original_data['subject_id']))
-                    else:
-                        # DELETE 쿼리 실행
-                        query = f"DELETE FROM {self.current_table} WHERE {pk_column} = %s"
-                        cursor.execute(query, (original_data[pk_column],))
-                    
-                    connection.commit()
-            
+        # enrollment 테이블은 복합 PRIMARY KEY 처리
+        if table_name == 'enrollment':
+            query = f"DELETE FROM {table_name} WHERE student_id = %s AND subject_id = %s"
+            params = (original_data['student_id'], original_data['subject_id'])
+        else:
+            # DELETE 쿼리 실행
+            query = f"DELETE FROM {table_name} WHERE {pk_column} = %s"
+            params = (original_data[pk_column],)
+        
+        def task(connection, progress):
+            with connection.cursor() as cursor:
+                cursor.execute("USE wcheck")
+                cursor.execute(query, params)
+                bump_table_cache_version(cursor, table_name)
+                connection.commit()
+        
+        def done(result):
             messagebox.showinfo("성공", "레코드가 삭제되었습니다.")
             self.load_table_data()
-            
-        except Exception as e:
-            messagebox.showerror("오류", f"레코드 삭제 중 오류 발생: {e}")
+        
+        self.run_db_task("레코드 삭제", task, done)
     
     def reset_database(self):
         """데이터베이스 리셋"""
         if not messagebox.askyesno("확인", "정말로 데이터베이스를 리셋하시겠습니까?\n모든 데이터가 삭제됩니다."):
             return
         
-        try:
-            reset_database()
-            messagebox.showinfo("성공", "데이터베이스가 리셋되었습니다.")
-            self.load_table_data()
-        except Exception as e:
-            messagebox.showerror("오류", f"데이터베이스 리셋 중 오류 발생: {e}")
+        def done(result):
+            if result == 0:
+                messagebox.showinfo("성공", "데이터베이스가 리셋되었습니다.")
+                self.load_table_data()
+            else:
+                messagebox.showerror("오류", "데이터베이스 리셋에 실패했습니다.")
+        
+        self.run_db_task("DB 리셋", lambda connection, progress: reset_database(connection, progress), done)
     
     def insert_test_data(self):
         """테스트 데이터 삽입"""
         if not messagebox.askyesno("확인", "테스트 데이터를 삽입하시겠습니까?\n기존 데이터가 삭제됩니다."):
             return
         
-        try:
-            result = test_database()
+        def done(result):
             if result == 0:
                 messagebox.showinfo("성공", "테스트 데이터가 삽입되었습니다.")
                 self.load_table_data()
             else:
                 messagebox.showerror("오류", "테스트 데이터 삽입에 실패했습니다.")
-        except Exception as e:
-            messagebox.showerror("오류", f"테스트 데이터 삽입 중 오류 발생: {e}")
+        
+        self.run_db_task("테스트 데이터 삽입", lambda connection, progress: test_database(connection, progress), done)
 
 
 class RecordDialog:
@@ -539,12 +925,19 @@ class RecordDialog:
 
 
 # 데이터베이스 리셋 함수
-def reset_database():
+def reset_database(connection=None, progress=print):
+    """
+    데이터베이스를 삭제하고 테이블을 다시 생성합니다.
+    
+    Args:
+        connection: 사용할 연결 (없으면 새로 연결, GUI는 작업자 스레드의 연결을 전달)
+        progress: 진행 메시지 출력 함수 (GUI 작업자는 취소 요청 시 AdminTaskCancelled 발생)
+    """
     try:
-        with connect(**LOCAL_DB_CONFIG) as connection:
+        with open_admin_connection(connection) as connection:
             with connection.cursor() as cursor:
                 # wcheck 데이터베이스 사용
-                cursor.execute("USE wcheck")
+                progress("DB 리셋 중...")
                 cursor.execute("DROP DATABASE IF EXISTS wcheck")
                 cursor.execute("CREATE DATABASE wcheck")
                 cursor.execute("USE wcheck")
@@ -555,28 +948,42 @@ def reset_database():
                 cursor.execute("CREATE TABLE enrollment (student_id INT UNSIGNED NOT NULL, subject_id INT UNSIGNED NOT NULL, registered_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP, PRIMARY KEY (student_id, subject_id), FOREIGN KEY (student_id) REFERENCES student(student_id) ON DELETE CASCADE, FOREIGN KEY (subject_id) REFERENCES subject(subject_id) ON DELETE CASCADE)")
                 cursor.execute("CREATE TABLE class_session (session_id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY, schedule_id INT UNSIGNED NOT NULL, class_date DATE NOT NULL, is_cancelled BOOLEAN DEFAULT FALSE, UNIQUE KEY (schedule_id, class_date), FOREIGN KEY (schedule_id) REFERENCES subject_schedule(schedule_id) ON DELETE CASCADE)")
                 cursor.execute("CREATE TABLE checkin (checkin_id INT UNSIGNED AUTO_INCREMENT PRIMARY KEY, session_id INT UNSIGNED NOT NULL, student_id INT UNSIGNED NOT NULL, check_time TIMESTAMP DEFAULT CURRENT_TIMESTAMP, status ENUM('PRESENT', 'LATE', 'ABSENT') DEFAULT 'PRESENT', UNIQUE KEY (session_id, student_id), FOREIGN KEY (session_id) REFERENCES class_session(session_id) ON DELETE CASCADE, FOREIGN KEY (student_id) REFERENCES student(student_id) ON DELETE CASCADE)")
+                cursor.execute("CREATE TABLE attendance_summary (student_id INT UNSIGNED NOT NULL, subject_id INT UNSIGNED NOT NULL, present_count INT UNSIGNED NOT NULL DEFAULT 0, late_count INT UNSIGNED NOT NULL DEFAULT 0, absent_count INT UNSIGNED NOT NULL DEFAULT 0, cancelled_count INT UNSIGNED NOT NULL DEFAULT 0, held_count INT UNSIGNED NOT NULL DEFAULT 0, as_of_date DATE NOT NULL, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP, PRIMARY KEY (student_id, subject_id), FOREIGN KEY (student_id) REFERENCES student(student_id) ON DELETE CASCADE, FOREIGN KEY (subject_id) REFERENCES subject(subject_id) ON DELETE CASCADE)")
+                cursor.execute("CREATE TABLE auto_absent_progress (target_date DATE PRIMARY KEY, status ENUM('RUNNING', 'DONE') NOT NULL DEFAULT 'RUNNING', processed_count INT UNSIGNED NOT NULL DEFAULT 0, absent_count INT UNSIGNED NOT NULL DEFAULT 0, worker VARCHAR(100), started_at TIMESTAMP NULL, finished_at TIMESTAMP NULL)")
+                cursor.execute("CREATE TABLE cache_version (name VARCHAR(50) PRIMARY KEY, version BIGINT UNSIGNED NOT NULL DEFAULT 0, updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP)")
+                cursor.execute("INSERT INTO cache_version (name, version) VALUES ('reference', UNIX_TIMESTAMP()), ('enrollment', UNIX_TIMESTAMP())")
                 # commit
-                print("DB 리셋 완료")
+                connection.commit()
+                progress("DB 리셋 완료")
                 return 0;
+    except AdminTaskCancelled:
+        raise
     except Exception as e:
         print("DB 리셋 과정 중 오류 발생 : ", e)
         return 1;
 
 # 테스트 데이터 삽입 함수
-def test_database():
+def test_database(connection=None, progress=print):
+    """
+    DB를 리셋한 뒤 테스트 데이터(교수, 학생, 과목, 스케줄, 수강, 수업 세션, 출석)를 삽입합니다.
+    
+    Args:
+        connection: 사용할 연결 (없으면 새로 연결, GUI는 작업자 스레드의 연결을 전달)
+        progress: 진행 메시지 출력 함수 (GUI 작업자는 취소 요청 시 AdminTaskCancelled 발생)
+    """
     try:
         # 먼저 데이터베이스 리셋
-        reset_result = reset_database()
+        reset_result = reset_database(connection, progress)
         if reset_result != 0:
-            print("데이터베이스 리셋 실패")
+            progress("데이터베이스 리셋 실패")
             return 1
         
-        with connect(**LOCAL_DB_CONFIG) as connection:
+        with open_admin_connection(connection) as connection:
             with connection.cursor() as cursor:
                 cursor.execute("USE wcheck")
                 
                 # 교수 3명 추가
-                print("교수 데이터 삽입 중...")
+                progress("교수 데이터 삽입 중...")
                 cursor.execute("INSERT INTO professor (name, major, email, office_location) VALUES (%s, %s, %s, %s)", 
                               ("김교수", "컴퓨터공학", "kim@university.ac.kr", "301호"))
                 cursor.execute("INSERT INTO professor (name, major, email, office_location) VALUES (%s, %s, %s, %s)", 
@@ -585,7 +992,7 @@ def test_database():
                               ("박교수", "정보통신공학", "park@university.ac.kr", "203호"))
                 
                 # 학생 10명 추가
-                print("학생 데이터 삽입 중...")
+                progress("학생 데이터 삽입 중...")
                 cursor.execute("INSERT INTO student (name, student_number, student_major, student_grade) VALUES (%s, %s, %s, %s)", 
                               ("홍길동", "2021001", "컴퓨터공학", 1))
                 cursor.execute("INSERT INTO student (name, student_number, student_major, student_grade) VALUES (%s, %s, %s, %s)", 
@@ -608,7 +1015,7 @@ def test_database():
                               ("한소미", "2021010", "정보통신공학", 2))
                 
                 # 과목 6개 추가 (기존 4개 + 2개 추가)
-                print("과목 데이터 삽입 중...")
+                progress("과목 데이터 삽입 중...")
                 cursor.execute("INSERT INTO subject (name, subject_year, subject_semester, professor_id) VALUES (%s, %s, %s, %s)", 
                               ("데이터베이스", 2025, 2, 1))
                 cursor.execute("INSERT INTO subject (name, subject_year, subject_semester, professor_id) VALUES (%s, %s, %s, %s)", 
@@ -623,7 +1030,7 @@ def test_database():
                               ("컴퓨터구조", 2025, 2, 2))
                 
                 # 과목 스케줄 추가 (시간표가 겹치지 않도록 배치)
-                print("과목 스케줄 데이터 삽입 중...")
+                progress("과목 스케줄 데이터 삽입 중...")
                 # 과목 1: 데이터베이스 (월/수/화) - 홍길동이 화요일에 수강
                 cursor.execute("INSERT INTO subject_schedule (subject_id, day_of_week, start_time, end_time, location) VALUES (%s, %s, %s, %s, %s)", 
                               (1, "MON", "09:00:00", "10:30:00", "101호"))
@@ -660,7 +1067,7 @@ def test_database():
                               (6, "THU", "15:30:00", "17:00:00", "203호"))
                 
                 # 수강 등록 추가 - 각 학생이 5개 과목을 수강하도록 설정
-                print("수강 등록 데이터 삽입 중...")
+                progress("수강 등록 데이터 삽입 중...")
                 # 각 학생별로 5개 과목 수강
                 # 학생 1 (홍길동): 과목 1, 2, 3, 5, 6 (화요일에 5개 모두 수강)
                 for subject_id in [1, 2, 3, 5, 6]:
@@ -696,7 +1103,7 @@ def test_database():
                     cursor.execute("INSERT INTO enrollment (student_id, subject_id) VALUES (%s, %s)", (10, subject_id))
                 
                 # 수업 세션 추가 (2025년 2학기: 9월 1일 ~ 11월 25일까지)
-                print("수업 세션 데이터 삽입 중...")
+                progress("수업 세션 데이터 삽입 중...")
                 
                 semester_start = datetime(2025, 9, 1).date()
                 # 11월 25일까지 생성 (테스트용)
@@ -756,10 +1163,10 @@ def test_database():
                         
                         class_date += timedelta(days=7)  # 다음 주 같은 요일
                 
-                print(f"총 {len(all_sessions)}개의 수업 세션이 생성되었습니다.")
+                progress(f"총 {len(all_sessions)}개의 수업 세션이 생성되었습니다.")
                 
                 # 출석 정보 추가 (11월 24일까지의 모든 수업 + 11월 25일 13시 30분까지의 수업)
-                print("출석 데이터 삽입 중...")
+                progress("출석 데이터 삽입 중...")
                 
                 # 수강생 정보: 각 과목별 수강생 리스트
                 enrolled_students = {
@@ -791,7 +1198,10 @@ def test_database():
                 nov_25_date = datetime(2025, 11, 25).date()
                 
                 # 각 세션에 대해 출석 데이터 생성
-                for session_id, schedule_id, class_date, is_cancelled in all_sessions:
+                for index, (session_id, schedule_id, class_date, is_cancelled) in enumerate(all_sessions, 1):
+                    if index % 50 == 0:
+                        progress(f"출석 데이터 삽입 중... ({index}/{len(all_sessions)} 세션)")
+                    
                     # 11월 25일 13시 30분까지의 수업은 나중에 별도로 처리하므로 건너뛰기
                     if class_date == nov_25_date and schedule_id in nov_25_schedules:
                         continue
@@ -1121,7 +1531,7 @@ def test_database():
                                 checkin_count += 1
                 
                 # 11월 25일 13시 30분까지의 수업에 대한 출석 데이터 추가 (수동으로 일일이 집어넣기)
-                print("11월 25일 13시 30분까지의 출석 데이터 삽입 중...")
+                progress("11월 25일 13시 30분까지의 출석 데이터 삽입 중...")
                 nov_25_checkin_count = 0
                 
                 # 11월 25일의 해당 스케줄 세션 조회
@@ -1200,13 +1610,18 @@ def test_database():
                         nov_25_checkin_count += 8
                         checkin_count += 8
                 
-                print(f"11월 25일 출석 데이터 {nov_25_checkin_count}개 추가 완료")
+                progress(f"11월 25일 출석 데이터 {nov_25_checkin_count}개 추가 완료")
                 
-                print(f"총 {checkin_count}개의 출석 기록이 생성되었습니다.")
+                progress(f"총 {checkin_count}개의 출석 기록이 생성되었습니다.")
                 
+                # 과목/교수/스케줄과 수강 정보가 모두 바뀌었으므로 캐시 무효화
+                bump_table_cache_version(cursor, 'subject')
+                bump_table_cache_version(cursor, 'enrollment')
                 connection.commit()
-                print("테스트 데이터 삽입 완료")
+                progress("테스트 데이터 삽입 완료")
                 return 0
+    except AdminTaskCancelled:
+        raise
     except Exception as e:
         print("테스트 데이터 삽입 과정 중 오류 발생: ", e)
         return 1
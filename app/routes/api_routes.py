@@ -0,0 +1,150 @@
+from flask import Blueprint, jsonify, request, current_app
+from app.utils.db_helpers import get_db_connection, format_time_to_str
+from app.utils.session_helpers import get_current_user
+from app.utils.timetable_cache import (
+    get_user_timetable, load_today_classes, TIMETABLE_COMPACT_FIELDS, TIMETABLE_SLOTS, TIMETABLE_SLOT_MINUTES
+)
+from mysql.connector import Error
+from datetime import datetime, date
+import hashlib
+import json
+
+
+api_bp = Blueprint('api', __name__)
+
+# JSON API 응답 형식 버전 (형식이 바뀌면 올리며, ETag에도 포함됨)
+API_VERSION = 1
+
+# 압축 배열 형식(/api/today)의 열 순서
+TODAY_COMPACT_FIELDS = [
+    'schedule_id', 'subject_id', 'subject_name', 'professor_name', 'location',
+    'start', 'end', 'session_id', 'cancelled', 'status'
+]
+
+
+def _make_etag(*parts):
+    """응답 형식 버전과 내용을 구분하는 값들로 ETag를 만듭니다."""
+    return hashlib.sha1(':'.join(str(part) for part in (API_VERSION, *parts)).encode('utf-8')).hexdigest()
+
+
+def _conditional_json(etag, body=None):
+    """
+    ETag가 요청의 If-None-Match와 같으면 304, 아니면 JSON 본문으로 응답합니다.
+    사용자별 응답이므로 공유 캐시에는 저장하지 않고 브라우저/앱이 매번 재검증하도록 합니다.
+    """
+    if request.if_none_match.contains(etag):
+        response = current_app.response_class(status=304)
+    else:
+        response = current_app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = 'private, no-cache'
+    return response
+
+
+def _dump_compact(payload):
+    """공백 없는 JSON 문자열로 변환합니다."""
+    return json.dumps(payload, ensure_ascii=False, separators=(',', ':'))
+
+
+@api_bp.route('/server_time')
+def server_time():
+    """
+    서버 시간을 반환합니다.
+    출석 페이지의 시계가 서버 시간과의 차이(offset)를 계산할 때 사용합니다.
+    DB와 세션을 사용하지 않으며 응답은 캐시되지 않습니다.
+
+    Returns:
+        JSON: server_time_iso (서버 현지 시각, 밀리초 포함), epoch_ms (Unix 시간, 밀리초)
+    """
+    now = datetime.now()
+    response = jsonify(
+        server_time_iso=now.isoformat(timespec='milliseconds'),
+        epoch_ms=int(now.timestamp() * 1000)
+    )
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@api_bp.route('/timetable')
+def timetable():
+    """
+    로그인한 사용자의 주간 시간표를 압축 배열 형식으로 반환합니다.
+    시간표 페이지와 같은 사용자별 시간표 캐시를 사용하며, 시간표 버전이 같으면 304로 응답합니다.
+
+    Returns:
+        JSON:
+            - v: 응답 형식 버전
+            - version: 시간표 버전 (기준 정보 버전.수강 정보 버전)
+            - slot_start, slot_minutes: slot 열의 기준 시각과 슬롯 길이 (분)
+            - fields: classes 배열의 열 이름
+            - classes: 수업마다 하나의 배열 (요일, 시작 시간 순)
+    """
+    user = get_current_user()
+    if user is None:
+        return jsonify({'result': 'unauthorized', 'message': "로그인이 필요합니다."}), 401
+
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                user_timetable = get_user_timetable(cursor, user['role'], user['id'])
+    except Error as e:
+        return jsonify({'result': 'error', 'message': f"시간표 조회 중 오류가 발생했습니다: {e}"}), 500
+
+    etag = _make_etag('timetable', user_timetable['etag_base'])
+    if request.if_none_match.contains(etag):
+        return _conditional_json(etag)
+
+    reference_version, enrollment_version = user_timetable['version']
+    first_hour, first_minute = TIMETABLE_SLOTS[0]
+    return _conditional_json(etag, _dump_compact({
+        'v': API_VERSION,
+        'version': f"{reference_version}.{enrollment_version or 0}",
+        'slot_start': f"{first_hour:02d}:{first_minute:02d}",
+        'slot_minutes': TIMETABLE_SLOT_MINUTES,
+        'fields': TIMETABLE_COMPACT_FIELDS,
+        'classes': user_timetable['compact']
+    }))
+
+
+@api_bp.route('/today')
+def today():
+    """
+    로그인한 사용자의 오늘 수업 목록을 압축 배열 형식으로 반환합니다.
+    메인/출석/시간표 페이지와 같은 기준(load_today_classes)으로 계산하며, 내용이 같으면 304로 응답합니다.
+
+    Returns:
+        JSON:
+            - v: 응답 형식 버전
+            - date: 오늘 날짜 (YYYY-MM-DD)
+            - fields: classes 배열의 열 이름
+            - classes: 수업마다 하나의 배열 (시작 시간 순)
+              cancelled/session_id는 세션이 아직 없으면 null, status는 학생의 출석 상태 코드(없으면 null)
+    """
+    user = get_current_user()
+    if user is None:
+        return jsonify({'result': 'unauthorized', 'message': "로그인이 필요합니다."}), 401
+
+    class_date = date.today()
+    try:
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                classes = load_today_classes(cursor, user['role'], user['id'], class_date)
+    except Error as e:
+        return jsonify({'result': 'error', 'message': f"오늘 수업 조회 중 오류가 발생했습니다: {e}"}), 500
+
+    body = _dump_compact({
+        'v': API_VERSION,
+        'date': class_date.isoformat(),
+        'fields': TODAY_COMPACT_FIELDS,
+        'classes': [
+            [
+                cls['schedule_id'], cls['subject_id'], cls['subject_name'], cls['professor_name'], cls['location'],
+                format_time_to_str(cls['start_time']), format_time_to_str(cls['end_time']),
+                cls['session_id'],
+                None if cls['is_cancelled'] is None else bool(cls['is_cancelled']),
+                cls['checkin_status']
+            ]
+            for cls in classes
+        ]
+    })
+    return _conditional_json(_make_etag('today', user['role'], user['id'], body), body)
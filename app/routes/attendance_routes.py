@@ -1,14 +1,30 @@
-from flask import Blueprint, render_template, session, flash, redirect, url_for, request
+from flask import Blueprint, render_template, session, flash, redirect, url_for, request, jsonify, Response
+from config import ATTENDANCE_STREAM_CONFIG
 from app.utils.auth import login_required
 from app.utils.db_helpers import (
-    get_db_connection, to_time, format_time_to_str, get_student_id_by_number,
-    get_or_create_session, get_subject_info, get_student_enrolled_subjects
+    get_db_connection, to_time, format_time_to_str,
+    get_subject_info, get_student_subject_checkins
+)
+from app.utils.timetable_cache import load_today_classes
+from app.utils.session_helpers import get_student_session_info, get_current_user
+from app.utils.checkin_engine import (
+    record_checkin, record_checkin_for_session, is_checkin_target,
+    CHECKIN_RECORDED, CHECKIN_ALREADY, CHECKIN_NOT_FOUND
+)
+from app.utils.attendance_window_index import (
+    get_attendance_window_index,
+    WINDOW_OPEN, WINDOW_NOT_OPEN, WINDOW_CANCELLED, WINDOW_UNKNOWN
+)
+from app.utils.checkin_batcher import get_checkin_batcher
+from app.utils.attendance_summary import apply_checkin_to_summary, get_student_attendance_summary
+from app.utils.attendance_events import (
+    get_attendance_event_hub, publish_attendance_status, stream_attendance_events
 )
-from app.utils.session_helpers import get_student_session_info
 from app.utils.attendance_test import now #테스트 추가
 from app.utils.constants import (
     ATTENDANCE_WINDOW_MINUTES,
     ATTENDANCE_STATUS_DISPLAY,
+    ATTENDANCE_STATUS_MAP,
     WEEKDAY_MAP,
     WEEKDAY_TO_STR,
     get_semester_dates,
@@ -21,7 +37,7 @@ from app.utils.attendance_helpers import (
     build_session_map,
     calculate_weeks_info
 )
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, date
 
 attendance_bp = Blueprint('attendance', __name__, url_prefix='/attendance')
 
@@ -54,73 +70,15 @@ def show_attendance():
             error="오늘은 주말입니다. 수업이 없습니다."
         )
 
-    # 요일 인덱스를 DB 형식으로 변환
-    today_weekday = WEEKDAY_TO_STR.get(today_index)
     today_classes = []
 
     try:
         with get_db_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
-                # 학생 역할인 경우에만 학생 ID 조회
-                student_id = None
-                if role == 'student':
-                    student_id = get_student_id_by_number(cursor, student_number)
-                    # 학생 정보가 없으면 로그인 페이지로 리다이렉트
-                    if not student_id:
-                        flash("학생 정보를 찾을 수 없습니다.", "error")
-                        return redirect(url_for('auth.login'))
-
-                # 오늘 수업 스케줄 조회
-                cursor.execute("""
-                    SELECT ss.schedule_id, s.name AS subject_name, p.name AS professor_name,
-                           ss.location, ss.start_time, ss.end_time, s.subject_id
-                    FROM subject_schedule ss
-                    JOIN subject s ON ss.subject_id = s.subject_id
-                    LEFT JOIN professor p ON s.professor_id = p.professor_id
-                    JOIN enrollment e ON e.subject_id = s.subject_id   -- ★ 필수
-                    WHERE UPPER(ss.day_of_week) = %s
-                      AND e.student_id = %s                            -- ★ 필수
-                    ORDER BY ss.start_time
-
-                """, (today_weekday.upper(),student_id))
-                rows = cursor.fetchall()
-
-                # 각 수업에 대해 출석 정보 처리
-                for row in rows:
-                    # DB에서 가져온 시간 값을 time 객체로 변환
-                    row['start_time'] = to_time(row['start_time'])
-                    row['end_time'] = to_time(row['end_time'])
-
-                    # 오늘 날짜의 수업 세션이 없으면 생성
-                    session_id = get_or_create_session(cursor, conn, row['schedule_id'], server_now.date())
-
-                    # 출석 가능 시간 범위 계산 (수업 시작 전후 10분)
-                    window_from, window_to, within_window = get_attendance_window(
-                        row['start_time'], server_now.date()
-                    )
+                # 학생 역할인 경우에만 로그인 시 세션에 저장된 학생 ID 사용 (학번 조회 쿼리 없음)
+                student_id = get_current_user()['id'] if role == 'student' else None
 
-                    # 학생의 출석 상태 확인
-                    current_status = '미출석'
-                    if student_id:
-                        checkin_result = _get_checkin_status(cursor, session_id, student_id)
-                        # 출석 기록이 있으면 상태 표시명으로 변환
-                        if checkin_result:
-                            current_status = format_attendance_status(checkin_result['status'])
-
-                    today_classes.append({
-                        'schedule_id': row['schedule_id'],
-                        'session_id': session_id,
-                        'subject_id': row['subject_id'],
-                        'subject_name': row['subject_name'],
-                        'professor_name': row['professor_name'],
-                        'location': row['location'],
-                        'start_time_str': format_time_to_str(row['start_time']),
-                        'end_time_str': format_time_to_str(row['end_time']),
-                        'window_from_str': window_from.strftime("%H:%M"),
-                        'window_to_str': window_to.strftime("%H:%M"),
-                        'window_open': within_window,
-                        'status': current_status
-                    })
+                today_classes = _load_today_classes(cursor, student_id, server_now)
 
     except Exception as e:
         # 사용자에게는 일반적인 에러 메시지만 표시
@@ -137,27 +95,180 @@ def show_attendance():
         current_page='출석체크',
         server_now_iso=server_now.isoformat(),
         server_now_fmt=server_now.strftime("%Y-%m-%d %H:%M:%S"),
-        today_classes=today_classes
+        today_classes=today_classes,
+        stream_enabled=ATTENDANCE_STREAM_CONFIG['enabled']
     )
 
 
-def _get_checkin_status(cursor, session_id, student_id):
+def _load_today_classes(cursor, student_id, server_now):
     """
-    특정 학생의 특정 세션에 대한 출석 상태를 조회합니다.
-    
+    학생의 오늘 수업 목록과 출석 가능 시간, 출석 상태를 조회합니다.
+    출석 페이지, 상태 조회 API, 실시간 알림 스트림에서 같은 기준으로 사용합니다.
+
+    조회만 하며, 아직 세션이 생성되지 않은 수업은 session_id가 None인 채로 반환합니다.
+    (세션은 scripts/materialize_sessions.py cron 작업이 미리 생성)
+
     Args:
-        cursor: 데이터베이스 커서
-        session_id: 수업 세션 ID
+        cursor: 데이터베이스 커서 (dictionary=True)
         student_id: 학생 ID
-        
+        server_now: 기준 시각 (datetime 객체)
+
+    Returns:
+        list: 오늘 수업 딕셔너리 리스트 (window_from/window_to는 datetime 객체)
+    """
+    # 오늘 수업(시간표 캐시)에 수업 세션, 출석 상태를 한 번의 쿼리로 더함
+    # (세션은 미리 생성되어 있으므로 읽기만 함)
+    rows = load_today_classes(cursor, 'student', student_id, server_now.date())
+
+    today_classes = []
+    # 각 수업에 대해 출석 정보 처리
+    for row in rows:
+        # DB에서 가져온 시간 값을 time 객체로 변환
+        row['start_time'] = to_time(row['start_time'])
+        row['end_time'] = to_time(row['end_time'])
+
+        # 출석 가능 시간 범위 계산 (수업 시작 전후 10분)
+        window_from, window_to, within_window = get_attendance_window(
+            row['start_time'], server_now.date()
+        )
+
+        # 학생의 출석 상태 (조인 결과에 포함됨)
+        current_status = '미출석'
+        if row['checkin_status']:
+            current_status = format_attendance_status(row['checkin_status'])
+
+        today_classes.append({
+            'schedule_id': row['schedule_id'],
+            'session_id': row['session_id'],
+            'subject_id': row['subject_id'],
+            'subject_name': row['subject_name'],
+            'professor_name': row['professor_name'],
+            'location': row['location'],
+            'start_time_str': format_time_to_str(row['start_time']),
+            'end_time_str': format_time_to_str(row['end_time']),
+            'window_from': window_from,
+            'window_to': window_to,
+            'window_from_str': window_from.strftime("%H:%M"),
+            'window_to_str': window_to.strftime("%H:%M"),
+            'window_open': within_window,
+            'status': current_status
+        })
+    return today_classes
+
+
+def _today_status_snapshot(today_classes, server_now):
+    """
+    오늘 수업의 출석 가능 여부와 출석 상태를 JSON 응답용으로 정리합니다.
+
+    Args:
+        today_classes: _load_today_classes()의 결과
+        server_now: 기준 시각 (datetime 객체)
+
+    Returns:
+        dict: server_time_iso와 수업별 schedule_id, window_open, window_from, window_to, status
+    """
+    return {
+        'server_time_iso': server_now.isoformat(timespec='seconds'),
+        'classes': [
+            {
+                'schedule_id': cls['schedule_id'],
+                'window_open': cls['window_open'],
+                'window_from': cls['window_from'].isoformat(timespec='seconds'),
+                'window_to': cls['window_to'].isoformat(timespec='seconds'),
+                'status': cls['status']
+            }
+            for cls in today_classes
+        ]
+    }
+
+
+def _load_student_today_classes(student_id, server_now):
+    """
+    학생의 오늘 수업 목록을 조회합니다. (상태 조회 API/실시간 알림용, 주말이면 빈 리스트)
+
+    Args:
+        student_id: 학생 ID
+        server_now: 기준 시각 (datetime 객체)
+
     Returns:
-        출석 기록 딕셔너리 또는 None
+        list: 오늘 수업 리스트
+    """
+    if server_now.weekday() > 4:
+        return []
+    with get_db_connection() as conn:
+        with conn.cursor(dictionary=True) as cursor:
+            return _load_today_classes(cursor, student_id, server_now)
+
+
+@attendance_bp.route('/status')
+@login_required
+def attendance_status():
+    """
+    오늘 수업의 출석 가능 여부와 출석 상태를 JSON으로 반환합니다.
+    실시간 알림 스트림을 사용할 수 없을 때 출석 페이지가 페이지 전체 대신 이 API를 주기적으로 조회합니다.
     """
-    cursor.execute(
-        "SELECT status FROM checkin WHERE session_id = %s AND student_id = %s",
-        (session_id, student_id)
+    user = get_current_user()
+    if user is None or user['role'] != 'student':
+        return jsonify({'result': 'unauthorized', 'message': "학생만 사용할 수 있습니다."}), 403
+
+    server_now = datetime.now()
+    try:
+        today_classes = _load_student_today_classes(user['id'], server_now)
+    except Exception as e:
+        return jsonify({'result': 'error', 'message': f"출석 정보 조회 중 오류가 발생했습니다: {e}"}), 500
+
+    response = jsonify(_today_status_snapshot(today_classes, server_now))
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@attendance_bp.route('/stream')
+@login_required
+def attendance_stream():
+    """
+    학생별 출석 실시간 알림 스트림(SSE)입니다.
+    연결 시 오늘 수업 상태 스냅샷을 보내고, 이후 출석 가능 시간 시작/종료와 출석 상태 변경을 보냅니다.
+
+    - 실시간 알림이 꺼져 있거나 오늘 수업이 없으면 204 (브라우저는 재연결하지 않고 상태 조회 API 사용)
+    - 연결 수 제한을 넘으면 503과 Retry-After 헤더 반환
+    - DB 조회는 연결 시 한 번만 하고, 스트리밍 중에는 DB 연결을 사용하지 않음
+    """
+    hub = get_attendance_event_hub()
+    user = get_current_user()
+    if hub is None or user is None or user['role'] != 'student' or not user['number']:
+        return '', 204
+    student_number = user['number']
+
+    server_now = datetime.now()
+    try:
+        today_classes = _load_student_today_classes(user['id'], server_now)
+    except Exception:
+        response = Response(status=503)
+        response.headers['Retry-After'] = str(ATTENDANCE_STREAM_CONFIG['retry_seconds'])
+        return response
+    if not today_classes:
+        return '', 204
+
+    event_queue = hub.subscribe(student_number)
+    if event_queue is None:
+        response = Response(status=503)
+        response.headers['Retry-After'] = str(ATTENDANCE_STREAM_CONFIG['retry_seconds'])
+        return response
+
+    events = stream_attendance_events(
+        hub, student_number, event_queue,
+        [{'schedule_id': cls['schedule_id'], 'window_from': cls['window_from'], 'window_to': cls['window_to']}
+         for cls in today_classes],
+        _today_status_snapshot(today_classes, server_now),
+        heartbeat_seconds=ATTENDANCE_STREAM_CONFIG['heartbeat_seconds'],
+        max_stream_seconds=ATTENDANCE_STREAM_CONFIG['max_stream_seconds'],
+        retry_seconds=ATTENDANCE_STREAM_CONFIG['retry_seconds']
     )
-    return cursor.fetchone()
+    response = Response(events, mimetype='text/event-stream')
+    response.headers['Cache-Control'] = 'no-cache'
+    # 리버스 프록시가 이벤트를 모아서 보내지 않도록 버퍼링 해제
+    response.headers['X-Accel-Buffering'] = 'no'
+    return response
 
 
 @attendance_bp.route('/check', methods=['POST'])
@@ -166,59 +277,127 @@ def check_attendance():
     """
     출석 체크 버튼을 눌렀을 때 호출되는 POST 엔드포인트입니다.
     학생의 출석을 기록합니다.
+    
+    폼 제출은 결과를 flash로 표시한 뒤 출석 페이지로 리다이렉트하고,
+    fetch 클라이언트(Accept: application/json)에는 페이지 재조회 없이 JSON 결과를 반환합니다.
+    'Prefer: return=minimal' 헤더가 있으면 출석 성공 시 본문 없이 204를 반환합니다.
+    배치 모드(CHECKIN_BATCH_ENABLED)에서는 요청을 로그에 기록한 뒤 202(accepted)로 응답합니다.
+    출석 가능 시간 인덱스가 켜져 있으면 출석 가능 시간 밖의 요청은 DB 조회 없이 403(not_open/closed)으로 거절합니다.
     """
-    schedule_id = request.form.get('schedule_id')
+    schedule_id = request.form.get('schedule_id', type=int)
     session_info = get_student_session_info()
     student_number = session_info['student_number']
 
     # 세션에 학번이 없으면 로그인 페이지로 리다이렉트
     if not student_number:
+        if _wants_json():
+            return jsonify({'result': 'unauthorized', 'message': "로그인 정보가 없습니다."}), 401
         flash("로그인 정보가 없습니다.", "error")
         return redirect(url_for('auth.login'))
 
+    if schedule_id is None:
+        return _checkin_response('bad_request', "잘못된 출석 요청입니다.", 'error', 400)
+
+    # 출석 가능 시간 확인과 세션 조회를 메모리 인덱스에서 처리 (DB 조회 없음)
+    window_index = get_attendance_window_index()
+    window_entry = None
+    if window_index is not None:
+        try:
+            window_result, window_entry = window_index.lookup(schedule_id)
+        except Exception as e:
+            return _checkin_response('error', f"출석 처리 중 오류가 발생했습니다: {e}", 'error', 500)
+        if window_result == WINDOW_UNKNOWN:
+            return _checkin_response(
+                CHECKIN_NOT_FOUND, "해당 수업 세션을 찾을 수 없습니다. 관리자에게 문의하세요.", 'error', 404
+            )
+        if window_result == WINDOW_CANCELLED:
+            return _checkin_response(window_result, "휴강된 수업은 출석할 수 없습니다.", 'error', 403)
+        if window_result != WINDOW_OPEN:
+            window_range = (
+                f"{window_entry['window_from'].strftime('%H:%M')} ~ {window_entry['window_to'].strftime('%H:%M')}"
+            )
+            if window_result == WINDOW_NOT_OPEN:
+                message = f"아직 출석 가능 시간이 아닙니다. (출석 가능: {window_range})"
+            else:
+                message = f"출석 가능 시간이 지났습니다. (출석 가능: {window_range})"
+            return _checkin_response(window_result, message, 'error', 403)
+
+    # 배치 모드: 로그에 기록 후 바로 응답하고 DB 반영은 백그라운드에서 일괄 처리
+    batcher = get_checkin_batcher()
+    if batcher is not None:
+        class_date = datetime.now().date()
+        try:
+            # 접수 전에 오늘 세션과 수강 여부를 확인해 기록될 수 없는 요청은 바로 거부
+            with get_db_connection() as conn:
+                with conn.cursor() as cursor:
+                    is_target = is_checkin_target(
+                        cursor, schedule_id, class_date, get_current_user()['id'],
+                        subject_id=window_entry['subject_id'] if window_entry is not None else None
+                    )
+            if not is_target:
+                return _checkin_response(
+                    CHECKIN_NOT_FOUND, "해당 수업 세션을 찾을 수 없습니다. 관리자에게 문의하세요.", 'error', 404
+                )
+            batcher.submit(schedule_id, class_date, student_number)
+        except Exception as e:
+            return _checkin_response('error', f"출석 처리 중 오류가 발생했습니다: {e}", 'error', 500)
+        # '출석완료' 알림은 배처가 기록을 커밋한 뒤에 보냄
+        return _checkin_response('accepted', "출석 요청이 접수되었습니다!", 'success', 202)
+
     try:
         with get_db_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
-                # 학생 ID 조회
-                student_id = get_student_id_by_number(cursor, student_number)
-                # 학생 정보가 없으면 에러 처리
-                if not student_id:
-                    flash("학생 정보를 찾을 수 없습니다.", "error")
-                    return redirect(url_for('attendance.show_attendance'))
-
-                # 오늘 날짜의 수업 세션 ID 조회
-                server_now = datetime.now()
-                cursor.execute(
-                    "SELECT session_id FROM class_session WHERE schedule_id = %s AND class_date = %s",
-                    (schedule_id, server_now.date())
-                )
-                session_result = cursor.fetchone()
-                # 세션이 없으면 에러 처리
-                if not session_result:
-                    flash("해당 수업 세션을 찾을 수 없습니다. 관리자에게 문의하세요.", "error")
-                    return redirect(url_for('attendance.show_attendance'))
-                session_id = session_result['session_id']
-
-                # 중복 출석 체크 방지
-                cursor.execute(
-                    "SELECT checkin_id FROM checkin WHERE session_id = %s AND student_id = %s",
-                    (session_id, student_id)
-                )
-                # 이미 출석 기록이 있으면 처리하지 않음
-                if cursor.fetchone():
-                    flash("이미 출석 처리되었습니다.", "info")
-                    return redirect(url_for('attendance.show_attendance'))
-
-                # 출석 기록 삽입
-                cursor.execute("""
-                    INSERT INTO checkin (session_id, student_id, check_time, status)
-                    VALUES (%s, %s, NOW(), 'PRESENT')
-                """, (session_id, student_id))
-                conn.commit()
-        flash("출석이 완료되었습니다!", "success")
+                if window_entry is not None:
+                    # 인덱스에서 찾은 세션에 수강 여부 확인과 출석 기록을 한 번의 쿼리로 처리
+                    result, checkin_id = record_checkin_for_session(
+                        cursor, window_entry['session_id'], window_entry['subject_id'], get_current_user()['id']
+                    )
+                else:
+                    # 세션 조회와 출석 기록을 한 번의 쿼리로 처리
+                    result, checkin_id = record_checkin(cursor, schedule_id, datetime.now().date(), student_number)
+                if result == CHECKIN_RECORDED:
+                    # 출석 통계 요약에 같은 트랜잭션으로 반영
+                    apply_checkin_to_summary(cursor, checkin_id)
+                    conn.commit()
     except Exception as e:
-        flash(f"출석 처리 중 오류가 발생했습니다: {e}", "error")
+        return _checkin_response('error', f"출석 처리 중 오류가 발생했습니다: {e}", 'error', 500)
 
+    if result == CHECKIN_RECORDED:
+        publish_attendance_status(student_number, schedule_id, ATTENDANCE_STATUS_DISPLAY['PRESENT'])
+        if _wants_json() and 'return=minimal' in request.headers.get('Prefer', ''):
+            return '', 204
+        return _checkin_response(result, "출석이 완료되었습니다!", 'success', 201)
+    if result == CHECKIN_ALREADY:
+        return _checkin_response(result, "이미 출석 처리되었습니다.", 'info', 200)
+    return _checkin_response(result, "해당 수업 세션을 찾을 수 없습니다. 관리자에게 문의하세요.", 'error', 404)
+
+
+def _wants_json():
+    """
+    요청이 JSON 응답을 원하는 fetch 클라이언트인지 확인합니다.
+    
+    Returns:
+        bool: Accept 헤더에서 application/json이 text/html보다 우선이면 True
+    """
+    return request.accept_mimetypes.best_match(['text/html', 'application/json']) == 'application/json'
+
+
+def _checkin_response(result, message, category, status_code):
+    """
+    출석 처리 결과를 요청 형식에 맞게 반환합니다.
+    
+    Args:
+        result: 결과 코드
+        message: 사용자에게 표시할 메시지
+        category: flash 카테고리 ('success', 'info', 'error')
+        status_code: JSON 응답의 HTTP 상태 코드
+        
+    Returns:
+        JSON 응답 또는 출석 페이지로의 리다이렉트
+    """
+    if _wants_json():
+        return jsonify({'result': result, 'message': message}), status_code
+    flash(message, category)
     return redirect(url_for('attendance.show_attendance'))
 
 
@@ -297,100 +476,41 @@ def manage_attendance_students():
     try:
         with get_db_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
-                # 학생 ID 조회
-                student_id = get_student_id_by_number(cursor, student_number)
-                # 학생 정보가 없으면 로그인 페이지로 리다이렉트
-                if not student_id:
-                    flash("학생 정보를 찾을 수 없습니다.", "error")
-                    return redirect(url_for('auth.login'))
-
-                # 학생이 수강하는 모든 과목을 가져온다.
-                enrolled_subjects = get_student_enrolled_subjects(cursor, student_id)
-
-                # 각 수강 과목에 대해 출석 통계 계산
-                for subject in enrolled_subjects:
+                # 로그인 시 세션에 저장된 학생 ID 사용 (학번 조회 쿼리 없음)
+                student_id = get_current_user()['id']
+
+                today = date.today()
+
+                # 수강 중인 모든 과목의 출석 통계를 요약 테이블에서 조회 (읽기 전용, 기준일 갱신은 야간 재계산 작업)
+                subject_stats = get_student_attendance_summary(cursor, student_id)
+
+                # 각 수강 과목에 대해 출석률 계산
+                for subject in subject_stats:
                     subject_id = subject['subject_id']
                     
-                    from datetime import date
-                    today = date.today()
-                    
-                    # 과목 정보 조회 (연도, 학기)
-                    subject_info = get_subject_info(cursor, subject_id)
-                    
-                    if not subject_info or not subject_info['subject_year'] or not subject_info['subject_semester']:
+                    if not subject['subject_year'] or not subject['subject_semester']:
                         # 과목 정보가 없으면 기본값 사용
                         continue
                     
-                    subject_year = subject_info['subject_year']
-                    subject_semester = subject_info['subject_semester']
-                    
                     # 학기 시작일과 종료일 계산
-                    semester_start, semester_end = get_semester_dates(subject_year, subject_semester)
+                    semester_start, semester_end = get_semester_dates(subject['subject_year'], subject['subject_semester'])
                     
                     # 주차 정보 계산
                     weeks_info = calculate_weeks_info(semester_start, semester_end, today)
                     total_weeks = weeks_info['total_weeks']
-                    current_week = weeks_info['current_week']
                     
                     # 주차 당 수업 수 (subject_schedule 개수)
-                    cursor.execute("""
-                        SELECT COUNT(*) AS schedules_per_week
-                        FROM subject_schedule
-                        WHERE subject_id = %s
-                    """, (subject_id,))
-                    schedules_result = cursor.fetchone()
-                    schedules_per_week = schedules_result['schedules_per_week'] if schedules_result else 0
+                    schedules_per_week = subject['schedules_per_week']
                     
                     # 총 수업 수 = 전체 주차 수 * 주차 당 수업 수 (표시용)
                     total_sessions = total_weeks * schedules_per_week
                     
-                    # 현재 주차까지의 예상 수업 수 (출석률 계산 기준)
-                    expected_sessions_by_current_week = current_week * schedules_per_week
-                    
-                    # 오늘까지 진행된 수업에 대한 통계 조회
-                    # 1. 오늘까지의 출석/지각/결석 수 (휴강 제외, 출석 기록이 있는 수업만)
-                    cursor.execute("""
-                        SELECT
-                            SUM(CASE WHEN c.status = 'PRESENT' THEN 1 ELSE 0 END) AS present_count,
-                            SUM(CASE WHEN c.status = 'LATE' THEN 1 ELSE 0 END) AS late_count,
-                            SUM(CASE WHEN c.status = 'ABSENT' THEN 1 ELSE 0 END) AS absent_count
-                        FROM checkin c
-                        JOIN class_session cs ON c.session_id = cs.session_id
-                        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
-                        WHERE c.student_id = %s 
-                          AND ss.subject_id = %s 
-                          AND cs.is_cancelled = FALSE
-                          AND cs.class_date <= %s
-                    """, (student_id, subject_id, today))
-                    checkin_counts = cursor.fetchone()
-
-                    # NULL 값 처리: 결과가 없거나 값이 NULL이면 0으로 설정
-                    present_count = checkin_counts['present_count'] if checkin_counts and checkin_counts['present_count'] is not None else 0
-                    late_count = checkin_counts['late_count'] if checkin_counts and checkin_counts['late_count'] is not None else 0
-                    absent_count = checkin_counts['absent_count'] if checkin_counts and checkin_counts['absent_count'] is not None else 0
-                    
-                    # 2. 오늘까지의 휴강 수
-                    cursor.execute("""
-                        SELECT COUNT(DISTINCT cs.session_id) AS cancelled_count
-                        FROM class_session cs
-                        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
-                        WHERE ss.subject_id = %s 
-                          AND cs.is_cancelled = TRUE
-                          AND cs.class_date <= %s
-                    """, (subject_id, today))
-                    cancelled_result = cursor.fetchone()
-                    cancelled_count = cancelled_result['cancelled_count'] if cancelled_result else 0
-                    
-                    # 3. 오늘까지 진행된 전체 수업 수 (휴강 포함, 출석 기록 유무와 무관)
-                    cursor.execute("""
-                        SELECT COUNT(DISTINCT cs.session_id) AS total_held_sessions
-                        FROM class_session cs
-                        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
-                        WHERE ss.subject_id = %s 
-                          AND cs.class_date <= %s
-                    """, (subject_id, today))
-                    total_held_result = cursor.fetchone()
-                    total_held_sessions = total_held_result['total_held_sessions'] if total_held_result else 0
+                    # 오늘까지 진행된 수업에 대한 통계 (휴강 제외 출석/지각/결석 수, 휴강 수, 전체 진행 수)
+                    present_count = subject['present_count']
+                    late_count = subject['late_count']
+                    absent_count = subject['absent_count']
+                    cancelled_count = subject['cancelled_count']
+                    total_held_sessions = subject['total_held_sessions']
                     
                     # 출석 기록이 없는 수업 수 = 전체 진행된 수업 수 - (출석 + 지각 + 결석 + 휴강)
                     # 출석 기록이 없는 수업은 결석으로 간주
@@ -482,12 +602,8 @@ def attendance_detail(subject_id):
     try:
         with get_db_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
-                # 학생 ID 조회
-                student_id = get_student_id_by_number(cursor, student_number)
-                # 학생 정보가 없으면 로그인 페이지로 리다이렉트
-                if not student_id:
-                    flash("학생 정보를 찾을 수 없습니다.", "error")
-                    return redirect(url_for('auth.login'))
+                # 로그인 시 세션에 저장된 학생 ID 사용 (학번 조회 쿼리 없음)
+                student_id = get_current_user()['id']
 
                 # 과목 정보를 가져온다 (이름, 연도, 학기)
                 subject_result = get_subject_info(cursor, subject_id)
@@ -500,16 +616,10 @@ def attendance_detail(subject_id):
                 subject_semester = subject_result['subject_semester']
 
                 # 학기 정보에 따라 시작일과 종료일 설정
-                if subject_semester == 1:
-                    # 1학기: 3월 1일 ~ 6월 30일
-                    semester_start = datetime(subject_year, 3, 1).date()
-                    semester_end = datetime(subject_year, 6, 30).date()
-                elif subject_semester == 2:
-                    # 2학기: 9월 1일 ~ 12월 31일 (모든 주차 표시를 위해 학기 종료일까지)
-                    semester_start = datetime(subject_year, 9, 1).date()
-                    semester_end = datetime(subject_year, 12, 31).date()
+                try:
+                    semester_start, semester_end = get_semester_dates(subject_year, subject_semester)
                 # 잘못된 학기 값인 경우 에러 처리
-                else:
+                except (ValueError, TypeError):
                     flash("올바르지 않은 학기 정보입니다.", "error")
                     return redirect(url_for('attendance.manage_attendance'))
 
@@ -537,45 +647,20 @@ def attendance_detail(subject_id):
                     JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
                     WHERE ss.subject_id = %s
                 """, (subject_id,))
-                all_sessions = cursor.fetchall()
-                
-                # 세션을 날짜와 스케줄 ID로 매핑
-                session_map = {}
-                for session_data in all_sessions:
-                    session_date = session_data['class_date']
-                    schedule_id = session_data['schedule_id']
-                    key = (session_date, schedule_id)
-                    session_map[key] = {
-                        'session_id': session_data['session_id'],
-                        'is_cancelled': session_data['is_cancelled'],
-                        'start_time': session_data['start_time'],
-                        'end_time': session_data['end_time'],
-                        'day_of_week': session_data['day_of_week']
-                    }
+                session_map = build_session_map(cursor.fetchall())
+
+                # 이 과목에 대한 학생의 모든 출석 기록을 한 번에 조회 (세션마다 조회하지 않음)
+                checkin_map = get_student_subject_checkins(cursor, student_id, subject_id)
 
                 # 주차별 출석 기록 리스트 초기화
                 attendance_records = []
-                current_date = semester_start
                 today = datetime.now().date()
                 
                 # 각 스케줄의 첫 번째 수업 날짜 계산
-                first_week_dates = {}
-                for schedule in schedules:
-                    day_of_week = WEEKDAY_MAP.get(schedule['day_of_week'])
-                    # 학기 시작일부터 해당 요일까지의 일수 계산
-                    days_ahead = day_of_week - current_date.weekday()
-                    # 음수인 경우 다음 주로 이동
-                    if days_ahead < 0:
-                        days_ahead += 7
-                    # 시작일이 해당 요일인 경우
-                    elif days_ahead == 0:
-                        pass
-                    # 첫 번째 수업 날짜 계산
-                    first_date = current_date + timedelta(days=days_ahead)
-                    first_week_dates[schedule['schedule_id']] = first_date
+                first_week_dates = calculate_week_dates(semester_start, schedules)
 
                 # 최대 16주차까지 반복 (일반적인 학기 길이)
-                for week in range(1, 17):
+                for week in range(1, MAX_WEEKS_PER_SEMESTER + 1):
                     # 각 스케줄에 대해 주차별 날짜 계산
                     for schedule in schedules:
                         schedule_id = schedule['schedule_id']
@@ -584,8 +669,7 @@ def attendance_detail(subject_id):
                         week_date = first_date + timedelta(weeks=week - 1)
                         
                         # 해당 날짜와 스케줄 ID로 세션 정보 조회
-                        session_key = (week_date, schedule_id)
-                        session_info = session_map.get(session_key)
+                        session_info = session_map.get((week_date, schedule_id))
                         
                         # 세션이 존재하지 않는 경우 '정보 없음'으로 처리
                         if not session_info:
@@ -595,8 +679,6 @@ def attendance_detail(subject_id):
                             start_time = schedule['start_time']
                             end_time = schedule['end_time']
                         else:
-                            session_id = session_info['session_id']
-                            
                             # 휴강인 경우
                             if session_info['is_cancelled']:
                                 status = '휴강'
@@ -607,19 +689,11 @@ def attendance_detail(subject_id):
                                 status_class = 'none'
                             # 오늘 또는 과거의 정상 수업인 경우 출석 기록 확인
                             else:
-                                cursor.execute(
-                                    "SELECT status FROM checkin WHERE session_id = %s AND student_id = %s",
-                                    (session_id, student_id)
-                                )
-                                checkin_result = cursor.fetchone()
+                                checkin_status = checkin_map.get(session_info['session_id'])
                                 # 출결 기록이 있으면 해당 상태로 표시
-                                if checkin_result:
-                                    status = {
-                                        'PRESENT': '출석',
-                                        'LATE': '지각',
-                                        'ABSENT': '결석'
-                                    }.get(checkin_result['status'], '알 수 없음')
-                                    status_class = checkin_result['status'].lower()
+                                if checkin_status:
+                                    status = ATTENDANCE_STATUS_MAP.get(checkin_status, '알 수 없음')
+                                    status_class = checkin_status.lower()
                                 # 출결 기록이 없으면 '정보 없음'으로 처리
                                 else:
                                     status = '정보 없음'
@@ -629,34 +703,12 @@ def attendance_detail(subject_id):
                             start_time = session_info['start_time']
                             end_time = session_info['end_time']
                         
-                        # 시간 값을 문자열로 변환 (다양한 형식 지원)
-                        if isinstance(start_time, timedelta):
-                            total_seconds = int(start_time.total_seconds())
-                            hours = total_seconds // 3600
-                            minutes = (total_seconds % 3600) // 60
-                            start_time_str = f"{hours:02d}:{minutes:02d}"
-                        elif isinstance(start_time, str):
-                            start_time_str = start_time[:5]
-                        else:
-                            start_time_str = start_time.strftime("%H:%M")
-                        
-                        # 종료 시간도 동일하게 변환
-                        if isinstance(end_time, timedelta):
-                            total_seconds = int(end_time.total_seconds())
-                            hours = total_seconds // 3600
-                            minutes = (total_seconds % 3600) // 60
-                            end_time_str = f"{hours:02d}:{minutes:02d}"
-                        elif isinstance(end_time, str):
-                            end_time_str = end_time[:5]
-                        else:
-                            end_time_str = end_time.strftime("%H:%M")
-                        
                         attendance_records.append({
                             'week': week,
                             'class_date': week_date.strftime("%Y-%m-%d"),
                             'day_of_week': schedule['day_of_week'],
-                            'start_time': start_time_str,
-                            'end_time': end_time_str,
+                            'start_time': format_time_to_str(start_time),
+                            'end_time': format_time_to_str(end_time),
                             'status': status,
                             'status_class': status_class
                         })
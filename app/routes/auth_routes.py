@@ -1,5 +1,6 @@
 from flask import Blueprint, render_template, request, redirect, url_for, session, flash
 from app.utils.db_helpers import get_db_connection
+from app.utils.session_helpers import start_user_session
 from mysql.connector import Error
 
 auth_bp = Blueprint('auth', __name__)
@@ -42,14 +43,8 @@ def login():
 
                     # 사용자 정보가 있으면 로그인 성공 처리
                     if user:
-                        # 세션에 로그인 정보 저장
-                        session['logged_in'] = True
-                        session['username'] = user['name']
-                        session['user_id'] = user['id']
-                        session['role'] = user['role']
-                        # 학생인 경우 학번도 세션에 저장
-                        if role == 'student':
-                            session['student_number'] = user['student_number']
+                        # 세션에 로그인 정보 저장 (이후 요청은 세션의 사용자 ID를 그대로 사용)
+                        start_user_session(user)
                         return redirect(url_for('main.root'))
                     # 사용자 정보가 없으면 로그인 실패
                     else:
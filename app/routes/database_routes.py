@@ -1,6 +1,13 @@
-from flask import Blueprint, jsonify, render_template
-from app.utils.db_helpers import get_db_connection, format_timedelta_to_str
-import datetime
+from flask import Blueprint, jsonify, render_template, request, Response, session
+from datetime import date
+from config import DB_BROWSER_CONFIG
+from app.utils.db_helpers import get_db_connection, get_db_pool_stats, get_table_names
+from app.utils.db_export import (
+    stream_tables, stream_query_rows, gzip_chunks, build_attendance_export_query,
+    EXPORT_MIMETYPES, EXPORT_FILE_MIMETYPES
+)
+from app.utils.db_browser import fetch_table_page
+from app.utils.auth import login_required
 
 db_bp = Blueprint('database', __name__)
 
@@ -8,87 +15,177 @@ db_bp = Blueprint('database', __name__)
 @db_bp.route('/show_database')
 def show_database():
     """
-    데이터베이스의 모든 테이블과 데이터를 JSON 형식으로 반환합니다.
+    데이터베이스의 모든 테이블과 데이터를 JSON 형식으로 스트리밍합니다.
     개발 및 디버깅 목적으로 사용됩니다.
+
+    데이터를 한 번에 메모리에 올리지 않고 DB_EXPORT_BATCH_SIZE행씩 읽어 바로 전송합니다.
+
+    Query Parameters:
+        table: 내보낼 테이블 이름 (없으면 모든 테이블)
+        format: 'json'(기본값, {"테이블": [행, ...]}) 또는 'ndjson'(한 줄에 {"table", "row"} 하나)
     """
-    db_data = {}
+    export_format = request.args.get('format', 'json')
+    if export_format not in EXPORT_MIMETYPES:
+        return jsonify({"error": f"지원하지 않는 형식입니다: {export_format}"}), 400
+
     try:
         with get_db_connection() as connection:
-            with connection.cursor(dictionary=True) as cursor:
+            with connection.cursor() as cursor:
                 # 모든 테이블 목록 조회
-                cursor.execute("SHOW TABLES")
-                tables = [row['Tables_in_wcheck'] for row in cursor.fetchall()]
-
-                # 각 테이블의 데이터 조회 및 처리
-                for table_name in tables:
-                    cursor.execute(f"SELECT * FROM {table_name}")
-                    rows = cursor.fetchall()
-                    processed_rows = []
-                    # 각 행의 데이터 타입에 따라 변환 처리
-                    for row in rows:
-                        processed_row = {}
-                        for key, value in row.items():
-                            # 날짜/시간 객체인 경우 ISO 형식으로 변환
-                            if isinstance(value, (datetime.date, datetime.datetime)):
-                                processed_row[key] = value.isoformat()
-                            # timedelta 객체인 경우 HH:MM:SS 형식으로 변환
-                            elif isinstance(value, datetime.timedelta):
-                                processed_row[key] = format_timedelta_to_str(value)
-                            # time 객체인 경우 ISO 형식으로 변환
-                            elif isinstance(value, datetime.time):
-                                processed_row[key] = value.isoformat()
-                            # 기타 타입은 그대로 저장
-                            else:
-                                processed_row[key] = value
-                        processed_rows.append(processed_row)
-                    db_data[table_name] = processed_rows
+                tables = get_table_names(cursor)
     except Exception as e:
         # 에러 발생 시 JSON 에러 응답 반환
         return jsonify({"error": str(e)}), 500
-    return jsonify(db_data)
+
+    # 단일 테이블 요청 시 실제 테이블 목록으로 검증 (쿼리에 테이블 이름을 직접 넣으므로)
+    table_name = request.args.get('table')
+    if table_name:
+        if table_name not in tables:
+            return jsonify({"error": f"테이블을 찾을 수 없습니다: {table_name}"}), 404
+        tables = [table_name]
+
+    # 스트리밍 중에는 요청 범위 연결 대신 내보내기 전용 연결을 사용
+    response = Response(stream_tables(tables, export_format), mimetype=EXPORT_MIMETYPES[export_format])
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+@db_bp.route('/export')
+@login_required
+def export_data():
+    """
+    테이블 전체 또는 조건에 맞는 출석 기록을 CSV/NDJSON 파일로 스트리밍합니다. (기본값: gzip 압축)
+    오프라인 분석용이며, DB_EXPORT_BATCH_SIZE행씩 읽어 바로 압축/전송하므로 메모리 사용량이 일정합니다.
+    학생 개인정보가 포함되므로 로그인한 교수만 사용할 수 있습니다.
+
+    Query Parameters:
+        table: 내보낼 테이블 이름 (없으면 출석 기록)
+        subject_id, year, semester: 출석 기록의 과목 ID, 개설 연도, 개설 학기 조건
+        date_from, date_to: 출석 기록의 수업일 범위 (YYYY-MM-DD, 양 끝 포함)
+        format: 'csv'(기본값) 또는 'ndjson'
+        gzip: '0'이면 압축하지 않음 (기본값: 압축)
+    """
+    if session.get('role') != 'professor':
+        return jsonify({"error": "접근 권한이 없습니다."}), 403
+
+    export_format = request.args.get('format', 'csv')
+    if export_format not in EXPORT_FILE_MIMETYPES:
+        return jsonify({"error": f"지원하지 않는 형식입니다: {export_format}"}), 400
+    compress = request.args.get('gzip', '1') != '0'
+
+    table_name = request.args.get('table')
+    if table_name:
+        try:
+            with get_db_connection() as connection:
+                with connection.cursor() as cursor:
+                    tables = get_table_names(cursor)
+        except Exception as e:
+            return jsonify({"error": str(e)}), 500
+        # 쿼리에 테이블 이름을 직접 넣으므로 실제 테이블 목록으로 검증
+        if table_name not in tables:
+            return jsonify({"error": f"테이블을 찾을 수 없습니다: {table_name}"}), 404
+        query, params = f"SELECT * FROM `{table_name}`", ()
+        filename = table_name
+    else:
+        try:
+            filters = {
+                'subject_id': _parse_filter_arg('subject_id', int, "정수"),
+                'year': _parse_filter_arg('year', int, "정수"),
+                'semester': _parse_filter_arg('semester', int, "정수"),
+                'date_from': _parse_filter_arg('date_from', date.fromisoformat, "YYYY-MM-DD 형식"),
+                'date_to': _parse_filter_arg('date_to', date.fromisoformat, "YYYY-MM-DD 형식")
+            }
+        except ValueError as e:
+            return jsonify({"error": str(e)}), 400
+        query, params = build_attendance_export_query(**filters)
+        filename = 'attendance'
+
+    body = stream_query_rows(query, params, export_format)
+    filename = f"{filename}.{export_format}"
+    if compress:
+        body = gzip_chunks(body)
+        filename += '.gz'
+    response = Response(body, mimetype='application/gzip' if compress else EXPORT_FILE_MIMETYPES[export_format])
+    response.headers['Content-Disposition'] = f'attachment; filename="{filename}"'
+    response.headers['Cache-Control'] = 'no-store'
+    return response
+
+
+def _parse_filter_arg(name, convert, expected):
+    """
+    내보내기 조건 쿼리 파라미터를 변환합니다.
+    형식이 잘못된 조건을 무시하면 의도보다 많은 데이터를 내보내게 되므로 ValueError를 발생시킵니다.
+
+    Args:
+        name: 파라미터 이름
+        convert: 변환 함수 (int, date.fromisoformat 등)
+        expected: 오류 메시지에 표시할 기대 형식
+
+    Returns:
+        변환된 값 (파라미터가 없으면 None)
+    """
+    value = request.args.get(name)
+    if not value:
+        return None
+    try:
+        return convert(value)
+    except ValueError:
+        raise ValueError(f"{name}은(는) {expected}이어야 합니다: {value}")
+
+
+@db_bp.route('/pool_stats')
+def show_pool_stats():
+    """
+    현재 워커 프로세스의 DB 커넥션 풀 통계를 JSON 형식으로 반환합니다.
+    모니터링 목적으로 사용됩니다.
+    """
+    return jsonify(get_db_pool_stats())
 
 
 @db_bp.route('/')
 def show_database_html():
     """
-    데이터베이스의 모든 테이블과 데이터를 HTML 페이지로 표시합니다.
+    데이터베이스 테이블 데이터를 HTML 페이지로 표시합니다.
     개발 및 디버깅 목적으로 사용됩니다.
+
+    선택한 테이블 하나의 한 페이지만 기본 키 순서로 조회하며(키셋 페이지네이션),
+    다른 테이블은 상단 메뉴에서 선택할 때 조회합니다.
+
+    Query Parameters:
+        table: 표시할 테이블 이름 (기본값: 첫 번째 테이블)
+        size: 페이지 크기 (기본값: DB_BROWSER_PAGE_SIZE, 최대 DB_BROWSER_MAX_PAGE_SIZE)
+        after / before: 다음/이전 페이지 커서
     """
-    db_data = {}
+    table_name = request.args.get('table')
+    page_size = request.args.get('size', DB_BROWSER_CONFIG['page_size'], type=int)
+    page_size = max(1, min(page_size, DB_BROWSER_CONFIG['max_page_size']))
+
     tables = []
+    page = None
+    error = None
     try:
         with get_db_connection() as connection:
-            with connection.cursor(dictionary=True) as cursor:
-                # 데이터베이스 선택
-                cursor.execute("USE wcheck")
-                # 모든 테이블 목록 조회
-                cursor.execute("SHOW TABLES")
-                tables = [row['Tables_in_wcheck'] for row in cursor.fetchall()]
-
-                # 각 테이블의 데이터 조회 및 처리
-                for table_name in tables:
-                    cursor.execute(f"SELECT * FROM {table_name}")
-                    rows = cursor.fetchall()
-                    processed_rows = []
-                    # 각 행의 데이터 타입에 따라 변환 처리
-                    for row in rows:
-                        processed_row = {}
-                        for key, value in row.items():
-                            # 날짜/시간 객체인 경우 ISO 형식으로 변환
-                            if isinstance(value, (datetime.date, datetime.datetime)):
-                                processed_row[key] = value.isoformat()
-                            # timedelta 객체인 경우 HH:MM:SS 형식으로 변환
-                            elif isinstance(value, datetime.timedelta):
-                                processed_row[key] = format_timedelta_to_str(value)
-                            # time 객체인 경우 ISO 형식으로 변환
-                            elif isinstance(value, datetime.time):
-                                processed_row[key] = value.isoformat()
-                            # 기타 타입은 그대로 저장
-                            else:
-                                processed_row[key] = value
-                        processed_rows.append(processed_row)
-                    db_data[table_name] = processed_rows
+            with connection.cursor() as cursor:
+                # 모든 테이블 목록 조회 (메뉴 표시 및 테이블 이름 검증용)
+                tables = get_table_names(cursor)
+
+                if table_name and table_name not in tables:
+                    error = f"테이블을 찾을 수 없습니다: {table_name}"
+                    table_name = None
+                if not table_name and tables:
+                    table_name = tables[0]
+
+                # 선택한 테이블의 현재 페이지만 조회
+                if table_name:
+                    page = fetch_table_page(
+                        cursor, table_name, page_size,
+                        after=request.args.get('after'), before=request.args.get('before')
+                    )
+                    if page['invalid_cursor']:
+                        error = "페이지 정보가 올바르지 않아 첫 페이지를 표시합니다."
     except Exception as e:
         # 에러 발생 시 에러 메시지와 함께 빈 데이터 반환
-        return render_template('db.html', tables=[], db_data={}, error=str(e))
-    return render_template('db.html', tables=tables, db_data=db_data)
+        return render_template('db.html', tables=tables, current_table=None, page=None,
+                               page_size=page_size, error=str(e))
+    return render_template('db.html', tables=tables, current_table=table_name, page=page,
+                           page_size=page_size, error=error)
@@ -1,8 +1,8 @@
 from flask import Blueprint, render_template, redirect, url_for, session
 from app.utils.auth import login_required
-from app.utils.db_helpers import get_db_connection, get_student_id_by_number, format_time_to_str, to_time
-from app.utils.session_helpers import get_session_info
-from app.utils.constants import WEEKDAY_TO_STR
+from app.utils.db_helpers import get_db_connection, format_time_to_str, to_time
+from app.utils.session_helpers import get_session_info, get_current_user
+from app.utils.timetable_cache import load_today_classes
 from datetime import datetime
 
 
@@ -20,7 +20,6 @@ def root():
     session_info = get_session_info()
     username = session_info['username']
     role = session_info['role']
-    student_number = session_info['student_number']
     
     today_classes = []
     
@@ -32,26 +31,14 @@ def root():
             
             # 주말이 아니면 오늘의 과목 조회
             if today_index <= 4:
-                today_weekday = WEEKDAY_TO_STR.get(today_index)
-                
                 with get_db_connection() as conn:
                     with conn.cursor(dictionary=True) as cursor:
-                        student_id = get_student_id_by_number(cursor, student_number)
+                        # 로그인 시 세션에 저장된 학생 ID 사용 (학번 조회 쿼리 없음)
+                        student_id = get_current_user()['id']
                         
                         if student_id:
-                            # 오늘 수업 스케줄 조회
-                            cursor.execute("""
-                                SELECT ss.schedule_id, s.name AS subject_name, p.name AS professor_name,
-                                       ss.location, ss.start_time, ss.end_time, s.subject_id
-                                FROM subject_schedule ss
-                                JOIN subject s ON ss.subject_id = s.subject_id
-                                LEFT JOIN professor p ON s.professor_id = p.professor_id
-                                JOIN enrollment e ON e.subject_id = s.subject_id
-                                WHERE UPPER(ss.day_of_week) = %s
-                                  AND e.student_id = %s
-                                ORDER BY ss.start_time
-                            """, (today_weekday.upper(), student_id))
-                            rows = cursor.fetchall()
+                            # 오늘 수업 스케줄 조회 (출석/시간표 페이지와 같은 시간표 캐시 사용)
+                            rows = load_today_classes(cursor, 'student', student_id, server_now.date())
                             
                             for row in rows:
                                 row['start_time'] = to_time(row['start_time'])
@@ -2,6 +2,11 @@ from flask import Blueprint, render_template, session, redirect, url_for, reques
 from app.utils.auth import login_required
 from app.utils.db_helpers import get_db_connection, get_subject_name
 from app.utils.constants import WEEKDAY_MAP, get_semester_dates
+from app.utils.class_session_helpers import cancel_class_session
+from app.utils.attendance_summary import refresh_attendance_summary
+from app.utils.checkin_engine import save_session_statuses
+from app.utils.attendance_window_index import invalidate_attendance_window_index
+from app.utils.reference_cache import get_reference_cache
 from mysql.connector import Error
 from datetime import datetime, timedelta
 
@@ -65,10 +70,14 @@ def list_subject_sessions(subject_id):
                     flash("과목 정보를 찾을 수 없습니다.", "error")
                     return redirect(url_for('professor.lecture_list'))
 
-                # 이 과목의 모든 정규 스케줄(요일/시간) 조회
-                schedules_query = "SELECT * FROM subject_schedule WHERE subject_id = %s"
-                cursor.execute(schedules_query, (subject_id,))
-                schedules = cursor.fetchall()
+                # 이 과목의 모든 정규 스케줄(요일/시간) 조회 (기준 정보 캐시가 켜져 있으면 메모리에서 조회)
+                reference_cache = get_reference_cache()
+                if reference_cache is not None:
+                    schedules = reference_cache.get_subject_schedules(subject_id, cursor)
+                else:
+                    schedules_query = "SELECT * FROM subject_schedule WHERE subject_id = %s"
+                    cursor.execute(schedules_query, (subject_id,))
+                    schedules = cursor.fetchall()
 
                 # DB에 이미 기록된 모든 수업 세션(휴강 포함) 조회
                 db_sessions_query = """
@@ -83,41 +92,35 @@ def list_subject_sessions(subject_id):
                 db_sessions_map = {(s['class_date'], s['schedule_id']): s for s in db_sessions}
 
                 # --- 3. 학기 전체 수업 목록 생성 ---
+                # 학기 중 스케줄에 해당하는 모든 (날짜, 스케줄) 조합 계산
+                expected_keys = []
                 current_date = SEMESTER_START
                 while current_date <= SEMESTER_END:
                     for schedule in schedules:
                         # 오늘 날짜의 요일과 스케줄의 요일이 일치하는지 확인
                         schedule_weekday = WEEKDAY_MAP.get(schedule['day_of_week'].upper())
                         if current_date.weekday() == schedule_weekday:
-                            session_info = {}
-                            session_key = (current_date, schedule['schedule_id'])
-                            if session_key in db_sessions_map:
-                                # DB에 기록이 있으면 그 정보를 사용 (session_id 존재)
-                                session_info.update(db_sessions_map[session_key])
-                            else:
-                                # DB에 기록이 없으면 '예정된' 수업으로 간주하고,
-                                # 출석부 관리를 위해 class_session을 즉시 생성합니다.
-                                cursor.execute(
-                                    "INSERT INTO class_session (schedule_id, class_date) VALUES (%s, %s)",
-                                    (schedule['schedule_id'], current_date)
-                                )
-                                new_session_id = cursor.lastrowid
-                                connection.commit() # 변경사항을 즉시 커밋합니다.
-
-                                session_info.update({
-                                    # 새로 생성된 session_id를 사용합니다.
-                                    'session_id': new_session_id,
-                                    'class_date': current_date,
-                                    'is_cancelled': False,
-                                    'schedule_id': schedule['schedule_id'],
-                                })
-                            # 공통 정보 추가
-                            session_info['day_of_week'] = schedule['day_of_week']
-                            session_info['start_time'] = (datetime.min + schedule['start_time']).strftime('%H:%M')
-                            session_info['end_time'] = (datetime.min + schedule['end_time']).strftime('%H:%M')
-                            all_sessions.append(session_info)
+                            expected_keys.append((current_date, schedule))
                     current_date += timedelta(days=1)
 
+                # 조회만 함: 세션 일괄 생성 작업(scripts/materialize_sessions.py)이 아직 만들지 않은 수업도
+                # session_id 없이 목록에 표시 (휴강 처리 시 해당 세션 하나만 생성됨)
+                for class_date, schedule in expected_keys:
+                    session_key = (class_date, schedule['schedule_id'])
+                    if session_key in db_sessions_map:
+                        # DB 기록 정보를 사용 (session_id 존재)
+                        session_info = dict(db_sessions_map[session_key])
+                    else:
+                        session_info = {
+                            'session_id': None, 'class_date': class_date,
+                            'is_cancelled': False, 'schedule_id': schedule['schedule_id']
+                        }
+                    # 공통 정보 추가
+                    session_info['day_of_week'] = schedule['day_of_week']
+                    session_info['start_time'] = (datetime.min + schedule['start_time']).strftime('%H:%M')
+                    session_info['end_time'] = (datetime.min + schedule['end_time']).strftime('%H:%M')
+                    all_sessions.append(session_info)
+
                 # --- 4. '다음 수업' 찾아서 표시하기 ---
                 next_class_found = False
                 # 날짜 오름차순으로 정렬 후 '다음 수업' 플래그 설정
@@ -159,34 +162,17 @@ def cancel_session(schedule_id, class_date):
                     flash("과목 정보를 찾을 수 없습니다.")
                     return redirect(url_for('professor.lecture_list'))
 
-                # 2. class_session ID 가져오기 (없으면 생성)
-                cursor.execute("SELECT session_id FROM class_session WHERE schedule_id = %s AND class_date = %s", (schedule_id, class_date_obj))
-                session_result = cursor.fetchone()
-
-                if session_result:
-                    session_id = session_result['session_id']
-                    cursor.execute("UPDATE class_session SET is_cancelled = TRUE WHERE session_id = %s", (session_id,))
-                else:
-                    cursor.execute("INSERT INTO class_session (schedule_id, class_date, is_cancelled) VALUES (%s, %s, TRUE)", (schedule_id, class_date_obj))
-                    session_id = cursor.lastrowid
-
-                # 3. 해당 과목의 모든 수강생 목록 조회
-                cursor.execute("SELECT student_id FROM enrollment WHERE subject_id = %s", (subject_id,))
-                students = cursor.fetchall()
+                # 2. 수업 세션을 휴강으로 표시 (없으면 생성)
+                # 3. 모든 수강생을 '출석'으로 처리 (수강생 수와 무관하게 INSERT ... SELECT 한 번)
+                cancel_class_session(cursor, schedule_id, class_date_obj)
 
-                # 4. 모든 수강생을 '출석'으로 처리 (UPSERT)
-                if students:
-                    upsert_query = """
-                        INSERT INTO checkin (session_id, student_id, status)
-                        VALUES (%s, %s, 'PRESENT')
-                        ON DUPLICATE KEY UPDATE status = 'PRESENT';
-                    """
-                    # 각 학생에 대해 쿼리 실행
-                    for student in students:
-                        cursor.execute(upsert_query, (session_id, student['student_id']))
+                # 4. 과목의 출석 통계 요약 다시 계산
+                refresh_attendance_summary(cursor, subject_ids=[subject_id])
 
                 # 5. 모든 변경사항 커밋
                 connection.commit()
+                # 휴강 처리로 오늘 세션이 새로 생성되었을 수 있으므로 출석 가능 시간 인덱스 갱신 표시
+                invalidate_attendance_window_index()
                 flash(f"{class_date} 수업이 휴강 처리되었으며, 모든 학생이 출석 처리되었습니다.")
 
     except Error as e:
@@ -218,7 +204,11 @@ def uncancel_session(session_id):
                     subject_id = result['subject_id']
 
                 cursor.execute("UPDATE class_session SET is_cancelled = FALSE WHERE session_id = %s", (session_id,))
+                if subject_id:
+                    refresh_attendance_summary(cursor, subject_ids=[subject_id])
                 connection.commit()
+                # 오늘 세션이면 출석 체크가 다시 가능해지도록 출석 가능 시간 인덱스 갱신 표시
+                invalidate_attendance_window_index()
                 flash("휴강 처리가 취소되었습니다.")
     except Error as e:
         flash(f"휴강 취소 중 오류가 발생했습니다: {e}")
@@ -236,19 +226,22 @@ def manage_attendance_professor(session_id):
     if request.method == 'POST':
         try:
             with get_db_connection() as connection:
-                with connection.cursor() as cursor:
-                    for key, new_status in request.form.items():
-                        if key.startswith('status_'):
-                            student_id = key.split('_')[1]
-                            upsert_query = """
-                                INSERT INTO checkin (session_id, student_id, status)
-                                VALUES (%s, %s, %s)
-                                ON DUPLICATE KEY UPDATE status = VALUES(status);
-                            """
-                            cursor.execute(upsert_query, (session_id, student_id, new_status))
-                    
-                    connection.commit()
-                    flash("출결 상태가 성공적으로 저장되었습니다.")
+                with connection.cursor(dictionary=True) as cursor:
+                    submitted = {
+                        key.split('_', 1)[1]: new_status
+                        for key, new_status in request.form.items()
+                        if key.startswith('status_')
+                    }
+                    # 현재 출결 상태와 비교해 바뀐 학생만 한 번에 저장
+                    student_ids = save_session_statuses(cursor, session_id, submitted)
+
+                    if student_ids:
+                        # 수정한 학생들의 해당 과목 출석 통계 요약 다시 계산
+                        refresh_attendance_summary(cursor, student_ids=student_ids, session_ids=[session_id])
+                        connection.commit()
+                        flash(f"출결 상태가 성공적으로 저장되었습니다. ({len(student_ids)}명 변경)")
+                    else:
+                        flash("변경된 출결 상태가 없습니다.")
 
         except Error as e:
             flash(f"출결 정보 저장 중 오류가 발생했습니다: {e}")
@@ -0,0 +1,190 @@
+"""
+수업별 자동 결석 스케줄러
+오늘의 각 수업 세션에 대해 출석 가능 시간이 끝난 직후 미출석 수강생을 결석 처리합니다.
+하루치 결석 처리를 23시 59분 한 번에 몰아서 하지 않고 수업 시간대별로 나누어 처리합니다.
+"""
+import atexit
+import heapq
+import os
+import threading
+from datetime import datetime, date, timedelta
+from time import monotonic
+from config import ABSENT_SCHEDULER_CONFIG
+from app.utils.db_helpers import get_db_connection, to_time
+from app.utils.attendance_helpers import get_attendance_window
+from app.utils.attendance_summary import refresh_attendance_summary
+from app.utils.auto_absent import mark_absent_for_sessions
+from app.utils.constants import ABSENT_SESSION_LOCK_PREFIX
+
+
+class AbsentScheduler:
+    """
+    오늘의 수업 세션을 결석 처리 시각(출석 마감 + grace) 순서로 관리하는 스케줄러입니다.
+
+    - 시작 시, 날짜가 바뀔 때, reload_seconds마다 오늘의 수업 세션 목록을 다시 읽음
+      (새로 생성된 세션 반영, 휴강 여부는 결석 처리 쿼리에서 확인)
+    - 결석 처리 시각이 된 세션마다 INSERT ... SELECT 한 번으로 미출석자를 결석 처리
+    - 여러 프로세스/서버에서 실행되어도 세션별 MySQL 이름 잠금(GET_LOCK)으로 한 곳에서만 처리
+    """
+
+    def __init__(self, grace_seconds=60, reload_seconds=300):
+        self.grace = timedelta(seconds=grace_seconds)
+        self.reload_seconds = reload_seconds
+        self.pid = os.getpid()
+
+        self._heap = []  # (결석 처리 시각, session_id)
+        self._scheduled = set()  # 오늘 등록된 session_id
+        self._loaded_date = None
+        self._next_reload = 0.0
+        self._stop = threading.Event()
+        self._thread = None
+        self.stats = {'loaded': 0, 'fired': 0, 'absent': 0, 'locked': 0, 'failures': 0}
+
+    def start(self):
+        """백그라운드 스레드를 시작합니다."""
+        self._thread = threading.Thread(target=self._run, name='absent-scheduler', daemon=True)
+        self._thread.start()
+        atexit.register(self.stop)
+
+    def stop(self):
+        """백그라운드 스레드를 멈춥니다."""
+        self._stop.set()
+
+    def _run(self):
+        while not self._stop.is_set():
+            try:
+                if self._loaded_date != date.today() or monotonic() >= self._next_reload:
+                    self._load()
+                self._fire_due()
+            except Exception as e:
+                self.stats['failures'] += 1
+                print(f"자동 결석 스케줄러 오류 발생: {e}")
+            self._stop.wait(self._seconds_until_next())
+
+    def _seconds_until_next(self):
+        wait = max(self._next_reload - monotonic(), 0)
+        if self._heap:
+            wait = min(wait, (self._heap[0][0] - datetime.now()).total_seconds())
+        # 자정이 지나면 다음 날 목록을 읽도록 깨어남
+        midnight = datetime.combine(date.today() + timedelta(days=1), datetime.min.time())
+        wait = min(wait, (midnight - datetime.now()).total_seconds())
+        return max(wait, 1)
+
+    def _load(self):
+        """오늘의 수업 세션을 읽어 아직 등록되지 않은 세션의 결석 처리 시각을 등록합니다."""
+        today = date.today()
+        if self._loaded_date != today:
+            self._heap = []
+            self._scheduled = set()
+            self._loaded_date = today
+        self._next_reload = monotonic() + self.reload_seconds
+
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT cs.session_id, ss.start_time
+                    FROM class_session cs
+                    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+                    WHERE cs.class_date = %s
+                      AND cs.is_cancelled = FALSE
+                """, (today,))
+                sessions = cursor.fetchall()
+
+        for session in sessions:
+            if session['session_id'] in self._scheduled:
+                continue
+            _, window_to, _ = get_attendance_window(to_time(session['start_time']), today)
+            heapq.heappush(self._heap, (window_to + self.grace, session['session_id']))
+            self._scheduled.add(session['session_id'])
+            self.stats['loaded'] += 1
+
+    def _fire_due(self):
+        """결석 처리 시각이 지난 세션을 모두 처리합니다. (시작 시 이미 지난 세션 포함)"""
+        now = datetime.now()
+        due = []
+        while self._heap and self._heap[0][0] <= now:
+            due.append(heapq.heappop(self._heap)[1])
+        if due:
+            self.sweep(due)
+
+    def sweep(self, session_ids):
+        """
+        지정한 세션들의 미출석 수강생을 세션마다 한 번의 쿼리로 결석 처리합니다.
+
+        Args:
+            session_ids: 수업 세션 ID 리스트
+
+        Returns:
+            int: 결석 처리된 학생 수
+        """
+        absent_count = 0
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                for session_id in session_ids:
+                    lock_name = f"{ABSENT_SESSION_LOCK_PREFIX}{session_id}"
+                    cursor.execute("SELECT GET_LOCK(%s, 0) AS acquired", (lock_name,))
+                    # 다른 프로세스가 같은 세션을 처리 중이면 건너뜀
+                    if cursor.fetchone()['acquired'] != 1:
+                        self.stats['locked'] += 1
+                        continue
+                    try:
+                        inserted = mark_absent_for_sessions(cursor, [session_id])
+                        if inserted:
+                            refresh_attendance_summary(cursor, session_ids=[session_id])
+                        conn.commit()
+                        absent_count += inserted
+                        self.stats['fired'] += 1
+                        self.stats['absent'] += inserted
+                    except Exception as e:
+                        conn.rollback()
+                        self.stats['failures'] += 1
+                        # 처리하지 못한 세션은 23시 59분 보정 작업에서 처리됨
+                        print(f"세션 {session_id} 자동 결석 처리 실패: {e}")
+                    finally:
+                        cursor.execute("SELECT RELEASE_LOCK(%s) AS released", (lock_name,))
+                        cursor.fetchone()
+        return absent_count
+
+
+_scheduler = None
+_scheduler_lock = threading.Lock()
+
+
+def get_absent_scheduler():
+    """
+    현재 프로세스의 수업별 자동 결석 스케줄러를 반환합니다.
+    스케줄러(ABSENT_SCHEDULER_ENABLED)가 꺼져 있으면 None을 반환합니다.
+    처음 호출될 때 백그라운드 스레드를 시작합니다.
+
+    Returns:
+        AbsentScheduler 객체 또는 None
+    """
+    global _scheduler
+    if not ABSENT_SCHEDULER_CONFIG['enabled']:
+        return None
+    if _scheduler is None or _scheduler.pid != os.getpid():
+        with _scheduler_lock:
+            if _scheduler is None or _scheduler.pid != os.getpid():
+                scheduler = AbsentScheduler(
+                    grace_seconds=ABSENT_SCHEDULER_CONFIG['grace_seconds'],
+                    reload_seconds=ABSENT_SCHEDULER_CONFIG['reload_seconds']
+                )
+                scheduler.start()
+                _scheduler = scheduler
+    return _scheduler
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_absent_scheduler()
+#   - 필요성: 스케줄러가 켜진 경우(기본값: 꺼짐, 한 프로세스에서만 켬) 프로세스당 하나의 스케줄러를 만들고 시작함.
+#            학생이 자정까지 '미출석'으로 보이지 않고, 결석 처리 쓰기가 하루에 고르게 분산됨.
+#   - 사용처: main.py의 시작 훅에서 사용됨.
+#
+# AbsentScheduler.sweep(session_ids)
+#   - 필요성: 세션별 이름 잠금을 잡고 미출석자를 INSERT ... SELECT 한 번으로 결석 처리한 뒤
+#            해당 과목의 출석 통계 요약을 다시 계산함.
+#   - 사용처: 스케줄러 백그라운드 스레드에서 호출됨.
+#
@@ -0,0 +1,238 @@
+"""
+출석 페이지 실시간 알림(SSE) 이벤트 허브
+출석 체크 경로에서 발생한 상태 변경을 같은 학생의 열린 출석 페이지(이벤트 스트림)로 전달하고,
+각 스트림은 오늘 수업의 출석 가능 시간 시작/종료 시각에 맞춰 이벤트를 보냅니다.
+"""
+import json
+import os
+import queue
+import threading
+from datetime import datetime
+from time import monotonic
+from config import ATTENDANCE_STREAM_CONFIG
+
+# 연결마다 쌓아둘 수 있는 최대 이벤트 수 (가득 차면 새 이벤트는 버림, 다음 연결 시 스냅샷으로 복구)
+STREAM_QUEUE_SIZE = 100
+
+
+class AttendanceEventHub:
+    """
+    학생(학번)별 이벤트 스트림 구독자를 관리하는 메모리 이벤트 허브입니다.
+
+    - subscribe(): 연결마다 큐를 하나 만들어 등록 (전체/학생당 연결 수 제한 초과 시 None)
+    - publish(): 해당 학생의 모든 연결 큐에 이벤트를 넣음 (블로킹 없음)
+    - 프로세스별로 동작하므로 여러 작업 프로세스로 실행하면 같은 프로세스에 연결된 스트림에만 전달됨
+      (다른 프로세스의 변경은 재연결 시 스냅샷으로 반영됨)
+    """
+
+    def __init__(self, max_connections=200, max_per_student=3):
+        self.max_connections = max_connections
+        self.max_per_student = max_per_student
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self._subscribers = {}  # 학번 -> 연결 큐 집합
+        self._connections = 0
+        self.stats = {'published': 0, 'delivered': 0, 'dropped': 0, 'rejected': 0}
+
+    def subscribe(self, student_number):
+        """
+        학생의 이벤트 스트림 연결을 등록합니다.
+
+        Args:
+            student_number: 학번
+
+        Returns:
+            queue.Queue: 이벤트 큐 (연결 수 제한을 넘으면 None)
+        """
+        with self._lock:
+            queues = self._subscribers.setdefault(student_number, set())
+            if self._connections >= self.max_connections or len(queues) >= self.max_per_student:
+                if not queues:
+                    del self._subscribers[student_number]
+                self.stats['rejected'] += 1
+                return None
+            event_queue = queue.Queue(maxsize=STREAM_QUEUE_SIZE)
+            queues.add(event_queue)
+            self._connections += 1
+            return event_queue
+
+    def unsubscribe(self, student_number, event_queue):
+        """학생의 이벤트 스트림 연결을 해제합니다."""
+        with self._lock:
+            queues = self._subscribers.get(student_number)
+            if queues is None or event_queue not in queues:
+                return
+            queues.discard(event_queue)
+            self._connections -= 1
+            if not queues:
+                del self._subscribers[student_number]
+
+    def publish(self, student_number, event, data):
+        """
+        학생의 열린 모든 스트림에 이벤트를 보냅니다.
+
+        Args:
+            student_number: 학번
+            event: 이벤트 이름 (예: 'status')
+            data: JSON으로 변환할 수 있는 이벤트 데이터
+
+        Returns:
+            int: 이벤트를 받은 연결 수
+        """
+        with self._lock:
+            queues = list(self._subscribers.get(student_number, ()))
+            self.stats['published'] += 1
+        delivered = 0
+        for event_queue in queues:
+            try:
+                event_queue.put_nowait((event, data))
+                delivered += 1
+            except queue.Full:
+                self.stats['dropped'] += 1
+        self.stats['delivered'] += delivered
+        return delivered
+
+    def get_stats(self):
+        """현재 연결 수와 이벤트 통계를 반환합니다."""
+        with self._lock:
+            return dict(self.stats, connections=self._connections, students=len(self._subscribers))
+
+
+def format_sse(event, data):
+    """
+    이벤트를 SSE(text/event-stream) 형식 문자열로 변환합니다.
+
+    Args:
+        event: 이벤트 이름
+        data: JSON으로 변환할 수 있는 이벤트 데이터
+
+    Returns:
+        str: SSE 메시지
+    """
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False)}\n\n"
+
+
+def stream_attendance_events(hub, student_number, event_queue, classes, snapshot,
+                             heartbeat_seconds=25, max_stream_seconds=1800, retry_seconds=30):
+    """
+    학생 한 명의 이벤트 스트림을 생성하는 제너레이터입니다.
+    요청 컨텍스트나 DB 연결을 사용하지 않으므로 스트리밍 중에는 DB 연결을 붙잡지 않습니다.
+
+    - 처음에 재연결 대기 시간과 현재 상태 스냅샷('snapshot')을 보냄
+    - 출석 가능 시간이 열리거나 닫히면 'window' 이벤트를 보냄
+    - 허브로 들어온 이벤트(출석 상태 변경 등)를 그대로 보냄
+    - 보낼 이벤트가 없으면 heartbeat_seconds마다 주석 줄을 보내 연결 유지 및 끊김 감지
+    - max_stream_seconds가 지나거나 날짜가 바뀌면 종료 (브라우저가 재연결하며 새 스냅샷을 받음)
+
+    Args:
+        hub: AttendanceEventHub 객체
+        student_number: 학번
+        event_queue: hub.subscribe()가 반환한 큐
+        classes: 오늘 수업 리스트 (각 항목은 schedule_id, window_from, window_to 포함)
+        snapshot: 연결 시 보낼 상태 데이터
+        heartbeat_seconds: 연결 유지용 주석 전송 주기 (초)
+        max_stream_seconds: 연결 최대 유지 시간 (초)
+        retry_seconds: 브라우저 재연결 대기 시간 (초)
+    """
+    deadline = monotonic() + max_stream_seconds
+    stream_date = datetime.now().date()
+    window_state = {}
+    try:
+        yield f"retry: {retry_seconds * 1000}\n\n"
+        yield format_sse('snapshot', snapshot)
+        for cls in classes:
+            window_state[cls['schedule_id']] = cls['window_from'] <= datetime.now() <= cls['window_to']
+        last_sent = monotonic()
+
+        while monotonic() < deadline:
+            now = datetime.now()
+            if now.date() != stream_date:
+                break
+
+            # 출석 가능 시간 시작/종료 확인
+            for cls in classes:
+                is_open = cls['window_from'] <= now <= cls['window_to']
+                if window_state[cls['schedule_id']] != is_open:
+                    window_state[cls['schedule_id']] = is_open
+                    yield format_sse('window', {'schedule_id': cls['schedule_id'], 'window_open': is_open})
+                    last_sent = monotonic()
+
+            # 다음 시간 경계, 하트비트, 연결 종료 시각 중 가장 가까운 때까지 이벤트 대기
+            wait = min(heartbeat_seconds - (monotonic() - last_sent), deadline - monotonic())
+            boundaries = [
+                boundary for cls in classes for boundary in (cls['window_from'], cls['window_to'])
+                if boundary > now
+            ]
+            if boundaries:
+                wait = min(wait, (min(boundaries) - now).total_seconds())
+            try:
+                event, data = event_queue.get(timeout=max(wait, 0.1))
+                yield format_sse(event, data)
+                last_sent = monotonic()
+            except queue.Empty:
+                if monotonic() - last_sent >= heartbeat_seconds:
+                    yield ": ping\n\n"
+                    last_sent = monotonic()
+    finally:
+        # 브라우저가 연결을 끊으면(다음 전송 실패 시) 여기서 구독 해제
+        hub.unsubscribe(student_number, event_queue)
+
+
+_hub = None
+_hub_lock = threading.Lock()
+
+
+def get_attendance_event_hub():
+    """
+    현재 프로세스의 출석 이벤트 허브를 반환합니다.
+    실시간 알림(ATTENDANCE_STREAM_ENABLED)이 꺼져 있으면 None을 반환합니다.
+
+    Returns:
+        AttendanceEventHub 객체 또는 None
+    """
+    global _hub
+    if not ATTENDANCE_STREAM_CONFIG['enabled']:
+        return None
+    if _hub is None or _hub.pid != os.getpid():
+        with _hub_lock:
+            if _hub is None or _hub.pid != os.getpid():
+                _hub = AttendanceEventHub(
+                    max_connections=ATTENDANCE_STREAM_CONFIG['max_connections'],
+                    max_per_student=ATTENDANCE_STREAM_CONFIG['max_per_student']
+                )
+    return _hub
+
+
+def publish_attendance_status(student_number, schedule_id, status):
+    """
+    학생의 출석 상태 변경을 열린 출석 페이지로 보냅니다. (실시간 알림이 꺼져 있으면 아무것도 하지 않음)
+
+    Args:
+        student_number: 학번
+        schedule_id: 스케줄 ID
+        status: 출석 상태 표시명 (예: '출석완료')
+    """
+    hub = get_attendance_event_hub()
+    if hub is not None:
+        hub.publish(student_number, 'status', {'schedule_id': schedule_id, 'status': status})
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_attendance_event_hub()
+#   - 필요성: 실시간 알림이 켜진 경우 프로세스당 하나의 이벤트 허브를 만들고 연결 수를 제한함.
+#            연결마다 스레드를 오래 점유하므로 기본값은 꺼져 있음 (스레드/비동기 작업자로 실행할 때만 ATTENDANCE_STREAM_ENABLED=true).
+#   - 사용처: app/routes/attendance_routes.py의 attendance_stream()에서 사용됨.
+#
+# publish_attendance_status(student_number, schedule_id, status)
+#   - 필요성: 출석 처리 결과를 같은 학생의 다른 탭/기기에 바로 알려, 페이지를 다시 불러오지 않게 함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()에서 사용됨.
+#
+# stream_attendance_events(hub, student_number, event_queue, classes, snapshot, ...)
+#   - 필요성: 출석 가능 시간 시작/종료를 서버 시각 기준으로 알려, 학생이 새로고침하며 기다리지 않게 함.
+#            스트리밍 중에는 요청 컨텍스트/DB 연결을 사용하지 않음.
+#   - 사용처: app/routes/attendance_routes.py의 attendance_stream()에서 사용됨.
+#
@@ -0,0 +1,300 @@
+"""
+출석 통계 요약(attendance_summary) 관련 유틸리티
+학생-과목별 출석/지각/결석/휴강/진행 수를 요약 테이블에 유지하여
+출석 현황 페이지가 checkin/class_session 원본을 매번 집계하지 않도록 합니다.
+"""
+from datetime import datetime, date
+from time import perf_counter
+from app.utils.db_helpers import get_db_connection
+from app.utils.constants import ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE
+from app.utils.checkin_engine import build_checkin_requests_table
+
+
+# 학생-과목별 통계를 원본 데이터에서 다시 계산하여 요약 테이블에 반영하는 쿼리
+# (휴강 수/진행 수는 기준일(as_of_date)까지의 수업만 집계)
+SUMMARY_REFRESH_QUERY = """
+    INSERT INTO attendance_summary
+        (student_id, subject_id, present_count, late_count, absent_count,
+         cancelled_count, held_count, as_of_date)
+    SELECT e.student_id, e.subject_id,
+           COUNT(CASE WHEN cs.is_cancelled = FALSE AND c.status = 'PRESENT' THEN 1 END),
+           COUNT(CASE WHEN cs.is_cancelled = FALSE AND c.status = 'LATE' THEN 1 END),
+           COUNT(CASE WHEN cs.is_cancelled = FALSE AND c.status = 'ABSENT' THEN 1 END),
+           COUNT(DISTINCT CASE WHEN cs.is_cancelled = TRUE THEN cs.session_id END),
+           COUNT(DISTINCT cs.session_id),
+           %s
+    FROM enrollment e
+    LEFT JOIN subject_schedule ss ON ss.subject_id = e.subject_id
+    LEFT JOIN class_session cs
+           ON cs.schedule_id = ss.schedule_id AND cs.class_date <= %s
+    LEFT JOIN checkin c
+           ON c.session_id = cs.session_id AND c.student_id = e.student_id
+    {where}
+    GROUP BY e.student_id, e.subject_id
+    ON DUPLICATE KEY UPDATE
+        present_count = VALUES(present_count),
+        late_count = VALUES(late_count),
+        absent_count = VALUES(absent_count),
+        cancelled_count = VALUES(cancelled_count),
+        held_count = VALUES(held_count),
+        as_of_date = VALUES(as_of_date)
+"""
+
+
+def _in_clause(column, values):
+    return f"{column} IN ({', '.join(['%s'] * len(values))})"
+
+
+def refresh_attendance_summary(cursor, subject_ids=None, student_ids=None,
+                               schedule_ids=None, session_ids=None, as_of_date=None):
+    """
+    지정한 범위(과목/학생/스케줄/세션)의 요약 행을 원본 데이터에서 다시 계산합니다.
+    여러 조건을 주면 모두 만족하는 (학생, 과목) 행만 갱신합니다.
+    커밋은 호출한 쪽에서 수행합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        subject_ids: 과목 ID 리스트
+        student_ids: 학생 ID 리스트
+        schedule_ids: 스케줄 ID 리스트 (해당 스케줄의 과목)
+        session_ids: 수업 세션 ID 리스트 (해당 세션의 과목)
+        as_of_date: 집계 기준일 (date 객체, 기본값: 오늘)
+
+    Returns:
+        int: 영향받은 행 수
+    """
+    if as_of_date is None:
+        as_of_date = date.today()
+
+    conditions = []
+    params = [as_of_date, as_of_date]
+    for values in (subject_ids, student_ids, schedule_ids, session_ids):
+        # 빈 리스트가 주어지면 갱신할 대상이 없음
+        if values is not None and not values:
+            return 0
+    if subject_ids is not None:
+        conditions.append(_in_clause("e.subject_id", subject_ids))
+        params.extend(subject_ids)
+    if student_ids is not None:
+        conditions.append(_in_clause("e.student_id", student_ids))
+        params.extend(student_ids)
+    if schedule_ids is not None:
+        conditions.append(
+            f"e.subject_id IN (SELECT subject_id FROM subject_schedule WHERE {_in_clause('schedule_id', schedule_ids)})"
+        )
+        params.extend(schedule_ids)
+    if session_ids is not None:
+        conditions.append(f"""e.subject_id IN (
+            SELECT ss2.subject_id
+            FROM class_session cs2
+            JOIN subject_schedule ss2 ON cs2.schedule_id = ss2.schedule_id
+            WHERE {_in_clause('cs2.session_id', session_ids)})""")
+        params.extend(session_ids)
+
+    where = "WHERE " + " AND ".join(conditions) if conditions else ""
+    cursor.execute(SUMMARY_REFRESH_QUERY.format(where=where), params)
+    return cursor.rowcount
+
+
+def apply_checkin_to_summary(cursor, checkin_id):
+    """
+    새로 기록된 출석 한 건을 요약 행에 증분 반영합니다.
+    요약 행이 없거나 기준일이 수업 날짜보다 이전이면(다음 갱신 때 다시 계산되므로) 아무것도 하지 않습니다.
+    커밋은 호출한 쪽에서 수행합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        checkin_id: 새로 삽입된 출석 기록 ID
+
+    Returns:
+        int: 갱신된 요약 행 수 (0 또는 1)
+    """
+    cursor.execute("""
+        UPDATE attendance_summary sm
+        JOIN checkin c ON c.checkin_id = %s AND c.student_id = sm.student_id
+        JOIN class_session cs ON cs.session_id = c.session_id
+        JOIN subject_schedule ss ON ss.schedule_id = cs.schedule_id AND ss.subject_id = sm.subject_id
+        SET sm.present_count = sm.present_count + (c.status = 'PRESENT'),
+            sm.late_count = sm.late_count + (c.status = 'LATE'),
+            sm.absent_count = sm.absent_count + (c.status = 'ABSENT')
+        WHERE cs.is_cancelled = FALSE
+          AND cs.class_date <= sm.as_of_date
+    """, (checkin_id,))
+    return cursor.rowcount
+
+
+def apply_bulk_checkins_to_summary(cursor, entries, first_checkin_id):
+    """
+    record_checkins_bulk()로 새로 기록된 출석들을 요약 행에 증분 반영합니다.
+    (학생, 과목)마다 새 출석 수만큼 present_count를 한 번의 UPDATE로 늘리며, 과목 전체를 다시 계산하지 않습니다.
+    커밋은 호출한 쪽에서 수행합니다.
+
+    - 이번 INSERT가 삽입한 행만 세도록 요청과 같은 학생/세션/출석 시각이면서
+      checkin_id가 first_checkin_id 이상인 'PRESENT' 기록만 집계
+    - apply_checkin_to_summary()와 같이 휴강 수업이거나 기준일이 수업 날짜보다 이전인 요약 행은 건너뜀
+      (다음 재계산 때 반영됨)
+
+    Args:
+        cursor: 데이터베이스 커서
+        entries: record_checkins_bulk()에 전달한 출석 요청 리스트
+        first_checkin_id: 이번 INSERT로 삽입된 첫 출석 기록 ID (cursor.lastrowid)
+
+    Returns:
+        int: 갱신된 요약 행 수
+    """
+    if not entries:
+        return 0
+    rows_sql, params = build_checkin_requests_table(entries)
+    cursor.execute(f"""
+        UPDATE attendance_summary sm
+        JOIN (
+            SELECT st.student_id, ss.subject_id,
+                   COUNT(DISTINCT c.checkin_id) AS new_count,
+                   MAX(cs.class_date) AS last_class_date
+            FROM ({rows_sql}) AS req
+            JOIN class_session cs ON cs.schedule_id = req.schedule_id AND cs.class_date = req.class_date
+            JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+            JOIN student st ON st.student_number = req.student_number
+            JOIN checkin c ON c.session_id = cs.session_id AND c.student_id = st.student_id
+            WHERE c.checkin_id >= %s
+              AND c.status = 'PRESENT'
+              AND c.check_time = req.check_time
+              AND cs.is_cancelled = FALSE
+            GROUP BY st.student_id, ss.subject_id
+        ) AS d ON d.student_id = sm.student_id AND d.subject_id = sm.subject_id
+        SET sm.present_count = sm.present_count + d.new_count
+        WHERE d.last_class_date <= sm.as_of_date
+    """, (*params, first_checkin_id))
+    return cursor.rowcount
+
+
+def get_student_attendance_summary(cursor, student_id):
+    """
+    학생이 수강하는 모든 과목의 출석 통계를 요약 테이블에서 조회합니다.
+    조회만 하며 요약을 다시 계산하지 않습니다. 날짜가 바뀐 뒤의 기준일 갱신과 요약 행이 없는 과목
+    (새 수강 등록 등)은 매일 자정 직후 실행되는 scripts/rebuild_attendance_summary.py가 처리하고,
+    그 전까지는 저장된 통계(요약 행이 없으면 0)를 반환합니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        student_id: 학생 ID
+
+    Returns:
+        list: 과목별 통계 딕셔너리 리스트
+            - subject_id, subject_name, professor_name, subject_year, subject_semester
+            - schedules_per_week: 주당 수업 수 (subject_schedule 개수)
+            - present_count, late_count, absent_count: 휴강이 아닌 수업의 출석/지각/결석 수
+            - cancelled_count: 휴강 수
+            - total_held_sessions: 진행된 전체 수업 수 (휴강 포함)
+            - as_of_date: 통계 기준일 (요약 행이 없으면 None)
+    """
+    query = """
+        SELECT s.subject_id, s.name AS subject_name, p.name AS professor_name,
+               s.subject_year, s.subject_semester,
+               (SELECT COUNT(*) FROM subject_schedule ss
+                WHERE ss.subject_id = s.subject_id) AS schedules_per_week,
+               COALESCE(sm.present_count, 0) AS present_count,
+               COALESCE(sm.late_count, 0) AS late_count,
+               COALESCE(sm.absent_count, 0) AS absent_count,
+               COALESCE(sm.cancelled_count, 0) AS cancelled_count,
+               COALESCE(sm.held_count, 0) AS total_held_sessions, sm.as_of_date
+        FROM enrollment e
+        JOIN subject s ON e.subject_id = s.subject_id
+        LEFT JOIN professor p ON s.professor_id = p.professor_id
+        LEFT JOIN attendance_summary sm
+               ON sm.student_id = e.student_id AND sm.subject_id = e.subject_id
+        WHERE e.student_id = %s
+        ORDER BY s.subject_id
+    """
+    cursor.execute(query, (student_id,))
+    return cursor.fetchall()
+
+
+def rebuild_attendance_summary(as_of_date=None, subject_id=None, chunk_size=ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE):
+    """
+    요약 테이블 전체를 원본 데이터(checkin/class_session/enrollment)와 일치하도록 다시 계산합니다.
+    잠금 시간을 줄이기 위해 과목을 chunk_size개씩 나누어 갱신/커밋하고,
+    수강 정보가 사라진 요약 행은 삭제합니다.
+
+    Args:
+        as_of_date: 집계 기준일 (date 객체, 기본값: 오늘)
+        subject_id: 특정 과목만 다시 계산할 경우 과목 ID
+        chunk_size: 한 번에 다시 계산할 과목 수
+
+    Returns:
+        (refreshed_count, removed_count) 튜플
+        - refreshed_count: 다시 계산된 (학생, 과목) 수
+        - removed_count: 삭제된 요약 행 수
+    """
+    if as_of_date is None:
+        as_of_date = date.today()
+
+    started = perf_counter()
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 출석 요약 재계산 시작: 기준일 {as_of_date}")
+    refreshed_count = 0
+    with get_db_connection() as conn:
+        with conn.cursor(dictionary=True) as cursor:
+            # 과목별 수강생 수 조회 (재계산 대상 과목 목록과 진행 상황 출력용)
+            query = "SELECT subject_id, COUNT(*) AS student_count FROM enrollment"
+            params = ()
+            if subject_id is not None:
+                query += " WHERE subject_id = %s"
+                params = (subject_id,)
+            cursor.execute(query + " GROUP BY subject_id ORDER BY subject_id", params)
+            student_counts = {row['subject_id']: row['student_count'] for row in cursor.fetchall()}
+            subject_ids = list(student_counts)
+
+            for start in range(0, len(subject_ids), chunk_size):
+                chunk = subject_ids[start:start + chunk_size]
+                refresh_attendance_summary(cursor, subject_ids=chunk, as_of_date=as_of_date)
+                conn.commit()
+                refreshed_count += sum(student_counts[sid] for sid in chunk)
+
+            # 수강 취소 등으로 더 이상 수강하지 않는 (학생, 과목)의 요약 행 삭제
+            delete_query = """
+                DELETE sm FROM attendance_summary sm
+                LEFT JOIN enrollment e
+                       ON e.student_id = sm.student_id AND e.subject_id = sm.subject_id
+                WHERE e.student_id IS NULL
+            """
+            delete_params = ()
+            if subject_id is not None:
+                delete_query += " AND sm.subject_id = %s"
+                delete_params = (subject_id,)
+            cursor.execute(delete_query, delete_params)
+            removed_count = cursor.rowcount
+        conn.commit()
+
+    elapsed = perf_counter() - started
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 출석 요약 재계산 완료: "
+          f"{refreshed_count}개 갱신, {removed_count}개 삭제 ({elapsed:.2f}초)")
+    return refreshed_count, removed_count
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# refresh_attendance_summary(cursor, subject_ids, student_ids, schedule_ids, session_ids, as_of_date)
+#   - 필요성: 출결이 바뀐 범위(과목/학생)의 요약 행만 INSERT ... SELECT ... ON DUPLICATE KEY UPDATE
+#            한 번으로 다시 계산함. 휴강 처리/취소, 교수 출결 수정, 자동 결석 후 호출됨.
+#   - 사용처: app/routes/professor_routes.py의 cancel_session(), uncancel_session(), manage_attendance_professor(),
+#            app/utils/auto_absent.py, app/utils/absent_scheduler.py, rebuild_attendance_summary()에서 사용됨.
+#
+# apply_checkin_to_summary(cursor, checkin_id)
+#   - 필요성: 학생이 직접 출석한 경우 요약 행의 카운터만 1 증가시켜 재계산 없이 반영함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()에서 사용됨.
+#
+# apply_bulk_checkins_to_summary(cursor, entries, first_checkin_id)
+#   - 필요성: 배치 모드의 flush마다 과목 전체 수강생의 요약을 다시 집계하지 않고, 새로 기록된 출석만큼만 카운터를 늘림.
+#   - 사용처: app/utils/checkin_batcher.py의 CheckinBatcher._write()에서 사용됨.
+#
+# get_student_attendance_summary(cursor, student_id)
+#   - 필요성: 출석 현황 페이지를 과목 수만큼의 기본 키 조회로 처리함.
+#            GET 요청에서 쓰기가 없도록 저장된 통계만 읽고, 기준일 갱신은 야간 재계산 작업에 맡김.
+#   - 사용처: app/routes/attendance_routes.py의 manage_attendance_students()에서 사용됨.
+#
+# rebuild_attendance_summary(as_of_date, subject_id, chunk_size)
+#   - 필요성: 요약 테이블을 원본 데이터와 맞춤(관리 도구로 직접 수정한 경우, 날짜가 바뀐 경우 등).
+#   - 사용처: scripts/rebuild_attendance_summary.py에서 사용됨 (매일 자정 이후 실행).
+#
@@ -0,0 +1,179 @@
+"""
+오늘의 출석 가능 시간 인덱스
+오늘 수업 세션의 출석 가능 시간과 session_id를 schedule_id로 메모리에 보관하여,
+출석 체크 요청마다 스케줄/세션을 조회하지 않고 출석 가능 시간을 확인합니다.
+"""
+import os
+import threading
+from datetime import datetime, date
+from time import monotonic
+from config import ATTENDANCE_WINDOW_INDEX_CONFIG
+from app.utils.db_helpers import get_db_connection, to_time
+from app.utils.attendance_helpers import get_attendance_window
+
+# 출석 가능 시간 확인 결과 코드
+WINDOW_OPEN = 'open'  # 출석 가능 시간 안
+WINDOW_NOT_OPEN = 'not_open'  # 아직 출석 가능 시간 전
+WINDOW_CLOSED = 'closed'  # 출석 가능 시간이 지남
+WINDOW_UNKNOWN = 'unknown'  # 오늘 해당 스케줄의 수업 세션이 없음
+WINDOW_CANCELLED = 'cancelled'  # 오늘 해당 스케줄의 수업이 휴강됨
+
+
+class AttendanceWindowIndex:
+    """
+    오늘의 수업 세션을 schedule_id -> (session_id, subject_id, is_cancelled, window_from, window_to)로 보관하는 인덱스입니다.
+
+    - 날짜가 바뀌거나 reload_seconds가 지나면 다음 조회 때 한 번의 쿼리로 다시 읽음
+      (다른 프로세스/관리 도구의 스케줄 변경은 reload_seconds 안에 반영됨)
+    - 인덱스에 없는 schedule_id는 miss_reload_seconds마다 최대 한 번만 다시 읽어 확인
+      (잘못된 요청이 반복되어도 DB 조회가 늘지 않음)
+    - 같은 프로세스에서 세션을 생성하거나 휴강 처리/취소한 경우 invalidate()로 다음 조회 때 다시 읽도록 함
+    """
+
+    def __init__(self, reload_seconds=300, miss_reload_seconds=30):
+        self.reload_seconds = reload_seconds
+        self.miss_reload_seconds = miss_reload_seconds
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self._reload_lock = threading.Lock()  # 동시에 여러 요청이 다시 읽지 않도록 함
+        self._windows = {}
+        self._loaded_date = None
+        self._loaded_at = None
+        self.stats = {'loads': 0, 'hits': 0, 'misses': 0}
+
+    def reload(self):
+        """오늘의 수업 세션과 출석 가능 시간을 다시 읽습니다."""
+        today = date.today()
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                cursor.execute("""
+                    SELECT cs.schedule_id, cs.session_id, cs.is_cancelled, ss.subject_id, ss.start_time
+                    FROM class_session cs
+                    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+                    WHERE cs.class_date = %s
+                """, (today,))
+                rows = cursor.fetchall()
+
+        windows = {}
+        for row in rows:
+            window_from, window_to, _ = get_attendance_window(to_time(row['start_time']), today)
+            windows[row['schedule_id']] = {
+                'session_id': row['session_id'],
+                'subject_id': row['subject_id'],
+                'is_cancelled': bool(row['is_cancelled']),
+                'window_from': window_from,
+                'window_to': window_to
+            }
+        with self._lock:
+            self._windows = windows
+            self._loaded_date = today
+            self._loaded_at = monotonic()
+            self.stats['loads'] += 1
+
+    def invalidate(self):
+        """다음 조회 때 인덱스를 다시 읽도록 표시합니다."""
+        with self._lock:
+            self._loaded_at = None
+
+    def _is_stale(self, max_age):
+        return (
+            self._loaded_at is None
+            or self._loaded_date != date.today()
+            or monotonic() - self._loaded_at >= max_age
+        )
+
+    def _ensure_fresh(self, max_age):
+        """인덱스가 max_age초보다 오래되었으면 한 스레드만 다시 읽습니다."""
+        if self._is_stale(max_age):
+            with self._reload_lock:
+                if self._is_stale(max_age):
+                    self.reload()
+
+    def lookup(self, schedule_id, now=None):
+        """
+        스케줄의 오늘 수업 세션과 출석 가능 여부를 확인합니다.
+
+        Args:
+            schedule_id: 스케줄 ID
+            now: 기준 시각 (기본값: 현재 시각)
+
+        Returns:
+            (result, entry) 튜플
+            - result: WINDOW_OPEN, WINDOW_NOT_OPEN, WINDOW_CLOSED, WINDOW_CANCELLED, WINDOW_UNKNOWN 중 하나
+            - entry: session_id, subject_id, is_cancelled, window_from, window_to를 담은 딕셔너리 (없으면 None)
+        """
+        self._ensure_fresh(self.reload_seconds)
+        entry = self._windows.get(schedule_id)
+        if entry is None:
+            self._ensure_fresh(self.miss_reload_seconds)
+            entry = self._windows.get(schedule_id)
+        if entry is None:
+            self.stats['misses'] += 1
+            return WINDOW_UNKNOWN, None
+
+        self.stats['hits'] += 1
+        if entry['is_cancelled']:
+            return WINDOW_CANCELLED, entry
+        now = now or datetime.now()
+        if now < entry['window_from']:
+            return WINDOW_NOT_OPEN, entry
+        if now > entry['window_to']:
+            return WINDOW_CLOSED, entry
+        return WINDOW_OPEN, entry
+
+    def get_stats(self):
+        """인덱스 크기와 조회 통계를 반환합니다."""
+        with self._lock:
+            return dict(self.stats, schedules=len(self._windows), loaded_date=str(self._loaded_date))
+
+
+_index = None
+_index_lock = threading.Lock()
+
+
+def get_attendance_window_index():
+    """
+    현재 프로세스의 출석 가능 시간 인덱스를 반환합니다.
+    인덱스(ATTENDANCE_WINDOW_INDEX_ENABLED)가 꺼져 있으면 None을 반환합니다.
+
+    Returns:
+        AttendanceWindowIndex 객체 또는 None
+    """
+    global _index
+    if not ATTENDANCE_WINDOW_INDEX_CONFIG['enabled']:
+        return None
+    if _index is None or _index.pid != os.getpid():
+        with _index_lock:
+            if _index is None or _index.pid != os.getpid():
+                _index = AttendanceWindowIndex(
+                    reload_seconds=ATTENDANCE_WINDOW_INDEX_CONFIG['reload_seconds'],
+                    miss_reload_seconds=ATTENDANCE_WINDOW_INDEX_CONFIG['miss_reload_seconds']
+                )
+    return _index
+
+
+def invalidate_attendance_window_index():
+    """
+    오늘의 수업 세션이 바뀐 경우(세션 생성, 휴강 처리/취소) 인덱스를 다시 읽도록 표시합니다.
+    인덱스가 꺼져 있으면 아무것도 하지 않습니다.
+    """
+    index = get_attendance_window_index()
+    if index is not None:
+        index.invalidate()
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_attendance_window_index()
+#   - 필요성: 출석 체크마다 스케줄/세션을 조회하지 않고 출석 가능 시간 확인과 session_id 조회를 메모리에서 처리함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()와 main.py(시작 시 미리 읽기)에서 사용됨.
+#
+# invalidate_attendance_window_index()
+#   - 필요성: 같은 프로세스에서 오늘 세션을 새로 만들거나 휴강 처리/취소한 경우 다음 출석 체크 때 바로 반영되도록 함.
+#            (다른 프로세스에는 reload_seconds 안에 반영되며, 그 전의 요청도 휴강 처리 때 모든 수강생에게 기록된
+#             출석 때문에 '이미 출석'으로 처리되어 새 기록은 생기지 않음)
+#   - 사용처: app/routes/professor_routes.py의 cancel_session(), uncancel_session()에서 사용됨.
+#
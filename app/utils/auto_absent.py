@@ -1,17 +1,67 @@
 """
 자동 결석 처리 유틸리티
 23시 59분에 그날 출석 데이터가 없는 경우 자동으로 결석 처리
+(수업별 결석 처리는 absent_scheduler.py가 출석 마감 직후 수행하고, 이 일일 처리는 누락분 보정 용도)
 """
-from datetime import datetime, date
+import os
+import socket
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from datetime import datetime, date, timedelta
+from time import perf_counter
+from config import AUTO_ABSENT_CONFIG
 from app.utils.db_helpers import get_db_connection
+from app.utils.attendance_summary import refresh_attendance_summary
+from app.utils.constants import AUTO_ABSENT_LOCK_PREFIX
 
+# 날짜별 처리 결과 코드
+AUTO_ABSENT_DONE = 'done'  # 처리 완료
+AUTO_ABSENT_SKIPPED = 'skipped'  # 이미 처리 완료된 날짜
+AUTO_ABSENT_LOCKED = 'locked'  # 다른 프로세스/호스트가 같은 날짜를 처리 중
 
-def mark_absent_for_missing_checkins(target_date=None):
+
+def mark_absent_for_sessions(cursor, session_ids):
+    """
+    지정한 수업 세션들에서 출석 기록이 없는 수강생을 한 번의 INSERT ... SELECT로 결석 처리합니다.
+    (수강생 × 출석 기록의 안티 조인으로 기록이 없는 학생만 삽입)
+    
+    Args:
+        cursor: 데이터베이스 커서
+        session_ids: 수업 세션 ID 리스트
+        
+    Returns:
+        int: 결석 처리된 학생 수
+    """
+    placeholders = ", ".join(["%s"] * len(session_ids))
+    # 처리 중에 학생이 출석한 경우에는 UNIQUE 키 충돌이 나므로 기존 기록을 그대로 둠
+    # (SELECT에도 checkin c가 조인되어 있으므로 UPDATE 절의 컬럼은 삽입 대상 테이블 이름으로 한정)
+    cursor.execute(f"""
+        INSERT INTO checkin (session_id, student_id, status, check_time)
+        SELECT cs.session_id, e.student_id, 'ABSENT', NOW()
+        FROM class_session cs
+        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+        JOIN enrollment e ON e.subject_id = ss.subject_id
+        LEFT JOIN checkin c ON c.session_id = cs.session_id AND c.student_id = e.student_id
+        WHERE cs.session_id IN ({placeholders})
+          AND cs.is_cancelled = FALSE
+          AND c.checkin_id IS NULL
+        ON DUPLICATE KEY UPDATE checkin.checkin_id = checkin.checkin_id
+    """, session_ids)
+    return cursor.rowcount
+
+
+def mark_absent_for_missing_checkins(target_date=None, chunk_size=None, stats=None):
     """
     특정 날짜의 출석 기록이 없는 학생들을 자동으로 결석 처리합니다.
+    수업 세션을 chunk_size개씩 묶어 묶음마다 한 번의 쿼리로 처리하고 커밋합니다.
     
     Args:
         target_date: 처리할 날짜 (date 객체). None이면 오늘 날짜 사용.
+        chunk_size: 한 번에 처리할 수업 세션 수 (기본값: AUTO_ABSENT_CHUNK_SIZE)
+        stats: 처리 통계를 채워 받을 딕셔너리 (선택)
+            - chunks: 처리한 묶음 수
+            - select_seconds: 세션 조회 시간 (초)
+            - insert_seconds: 결석 처리(+ 출석 통계 요약 갱신) 시간 (초)
+            - elapsed_seconds: 전체 소요 시간 (초)
     
     Returns:
         (processed_count, absent_count) 튜플
@@ -20,77 +70,206 @@ def mark_absent_for_missing_checkins(target_date=None):
     """
     if target_date is None:
         target_date = date.today()
+    if chunk_size is None:
+        chunk_size = AUTO_ABSENT_CONFIG['chunk_size']
+    chunk_size = max(chunk_size, 1)
     
     processed_count = 0
     absent_count = 0
+    chunks = 0
+    started = perf_counter()
     
     try:
         with get_db_connection() as conn:
             with conn.cursor(dictionary=True) as cursor:
-                # 해당 날짜의 모든 수업 세션 조회 (휴강 제외)
+                # 해당 날짜의 모든 수업 세션과 과목 조회 (휴강 제외)
                 cursor.execute("""
-                    SELECT cs.session_id, cs.schedule_id, cs.class_date, cs.is_cancelled
+                    SELECT cs.session_id, ss.subject_id
                     FROM class_session cs
+                    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
                     WHERE cs.class_date = %s
                       AND cs.is_cancelled = FALSE
+                    ORDER BY cs.session_id
                 """, (target_date,))
                 sessions = cursor.fetchall()
+                selected = perf_counter()
                 
-                for session in sessions:
-                    session_id = session['session_id']
-                    schedule_id = session['schedule_id']
-                    
-                    # 해당 세션의 과목 ID 조회
-                    cursor.execute("""
-                        SELECT ss.subject_id
-                        FROM subject_schedule ss
-                        WHERE ss.schedule_id = %s
-                    """, (schedule_id,))
-                    schedule_result = cursor.fetchone()
-                    
-                    if not schedule_result:
-                        continue
-                    
-                    subject_id = schedule_result['subject_id']
+                for start in range(0, len(sessions), chunk_size):
+                    chunk = sessions[start:start + chunk_size]
+                    inserted = mark_absent_for_sessions(cursor, [s['session_id'] for s in chunk])
                     
-                    # 해당 과목을 수강하는 모든 학생 조회
-                    cursor.execute("""
-                        SELECT e.student_id
-                        FROM enrollment e
-                        WHERE e.subject_id = %s
-                    """, (subject_id,))
-                    enrolled_students = cursor.fetchall()
+                    # 결석 처리된 학생이 있으면 해당 과목들의 출석 통계 요약 다시 계산
+                    if inserted:
+                        refresh_attendance_summary(cursor, subject_ids=sorted({s['subject_id'] for s in chunk}))
                     
-                    for student in enrolled_students:
-                        student_id = student['student_id']
-                        
-                        # 해당 학생의 출석 기록 확인
-                        cursor.execute("""
-                            SELECT checkin_id
-                            FROM checkin
-                            WHERE session_id = %s AND student_id = %s
-                        """, (session_id, student_id))
-                        existing_checkin = cursor.fetchone()
-                        
-                        # 출석 기록이 없으면 결석 처리
-                        if not existing_checkin:
-                            cursor.execute("""
-                                INSERT INTO checkin (session_id, student_id, status, check_time)
-                                VALUES (%s, %s, 'ABSENT', NOW())
-                            """, (session_id, student_id))
-                            absent_count += 1
-                    
-                    processed_count += 1
-                
-                conn.commit()
+                    # 묶음마다 커밋하여 긴 트랜잭션과 잠금 유지를 피함
+                    conn.commit()
+                    absent_count += inserted
+                    processed_count += len(chunk)
+                    chunks += 1
                 
     except Exception as e:
         print(f"자동 결석 처리 중 오류 발생: {e}")
         raise
     
+    if stats is not None:
+        finished = perf_counter()
+        stats.update({
+            'chunks': chunks,
+            'select_seconds': round(selected - started, 3),
+            'insert_seconds': round(finished - selected, 3),
+            'elapsed_seconds': round(finished - started, 3)
+        })
+    
     return processed_count, absent_count
 
 
+def process_auto_absent_day(target_date, skip_completed=True, chunk_size=None):
+    """
+    한 날짜의 자동 결석 처리를 날짜별 잠금과 진행 상황 기록과 함께 실행합니다.
+    MySQL 이름 잠금(GET_LOCK)으로 여러 호스트/프로세스가 같은 날짜를 동시에 처리하지 않게 하고,
+    완료된 날짜는 auto_absent_progress에 기록하여 중단 후 다시 실행할 때 건너뜁니다.
+    
+    Args:
+        target_date: 처리할 날짜 (date 객체)
+        skip_completed: True이면 이미 완료된 날짜는 건너뜀
+        chunk_size: 한 번에 처리할 수업 세션 수
+    
+    Returns:
+        dict: 처리 결과
+            - target_date: 처리 날짜
+            - result: AUTO_ABSENT_DONE, AUTO_ABSENT_SKIPPED, AUTO_ABSENT_LOCKED 중 하나
+            - processed_count, absent_count: 처리된 세션 수, 결석 처리된 학생 수
+            - chunks: 처리한 세션 묶음 수
+            - elapsed_seconds: 소요 시간 (초)
+    """
+    lock_name = f"{AUTO_ABSENT_LOCK_PREFIX}{target_date.isoformat()}"
+    worker = f"{socket.gethostname()}:{os.getpid()}"[:100]
+    outcome = {
+        'target_date': target_date,
+        'result': AUTO_ABSENT_LOCKED,
+        'processed_count': 0,
+        'absent_count': 0,
+        'chunks': 0,
+        'elapsed_seconds': 0.0
+    }
+    
+    # 잠금은 연결 단위이므로 처리하는 동안 같은 연결을 유지
+    with get_db_connection() as lock_conn:
+        with lock_conn.cursor(dictionary=True) as cursor:
+            cursor.execute("SELECT GET_LOCK(%s, 0) AS acquired", (lock_name,))
+            if cursor.fetchone()['acquired'] != 1:
+                return outcome
+            try:
+                if skip_completed:
+                    cursor.execute(
+                        "SELECT status FROM auto_absent_progress WHERE target_date = %s", (target_date,)
+                    )
+                    progress = cursor.fetchone()
+                    if progress and progress['status'] == 'DONE':
+                        outcome['result'] = AUTO_ABSENT_SKIPPED
+                        return outcome
+                
+                cursor.execute("""
+                    INSERT INTO auto_absent_progress (target_date, status, worker, started_at)
+                    VALUES (%s, 'RUNNING', %s, NOW())
+                    ON DUPLICATE KEY UPDATE status = 'RUNNING', worker = VALUES(worker),
+                                            started_at = NOW(), finished_at = NULL
+                """, (target_date, worker))
+                lock_conn.commit()
+                
+                stats = {}
+                processed_count, absent_count = mark_absent_for_missing_checkins(
+                    target_date, chunk_size=chunk_size, stats=stats
+                )
+                
+                cursor.execute("""
+                    UPDATE auto_absent_progress
+                    SET status = 'DONE', processed_count = %s, absent_count = %s, finished_at = NOW()
+                    WHERE target_date = %s
+                """, (processed_count, absent_count, target_date))
+                lock_conn.commit()
+                
+                outcome.update({
+                    'result': AUTO_ABSENT_DONE,
+                    'processed_count': processed_count,
+                    'absent_count': absent_count,
+                    'chunks': stats['chunks'],
+                    'elapsed_seconds': stats['elapsed_seconds']
+                })
+                return outcome
+            finally:
+                cursor.execute("SELECT RELEASE_LOCK(%s) AS released", (lock_name,))
+                cursor.fetchone()
+
+
+def backfill_auto_absent(start_date, end_date, workers=1, force=False, chunk_size=None):
+    """
+    기간 내 모든 날짜의 자동 결석 처리를 실행합니다 (cron 누락 등으로 빠진 날짜 보충).
+    이미 완료된 날짜는 건너뛰므로 중단된 뒤 같은 명령으로 다시 실행하면 남은 날짜부터 이어서 처리합니다.
+    
+    Args:
+        start_date: 시작 날짜 (date 객체, 포함)
+        end_date: 종료 날짜 (date 객체, 포함)
+        workers: 동시에 처리할 작업 프로세스 수 (1이면 현재 프로세스에서 순서대로 처리)
+        force: True이면 완료된 날짜도 다시 처리
+        chunk_size: 한 번에 처리할 수업 세션 수
+    
+    Returns:
+        dict: 결과별 날짜 수와 합계
+            - done, skipped, locked, failed: 결과별 날짜 수
+            - processed_count, absent_count: 처리된 세션 수, 결석 처리된 학생 수 합계
+    """
+    dates = [start_date + timedelta(days=offset) for offset in range((end_date - start_date).days + 1)]
+    summary = {
+        AUTO_ABSENT_DONE: 0, AUTO_ABSENT_SKIPPED: 0, AUTO_ABSENT_LOCKED: 0, 'failed': 0,
+        'processed_count': 0, 'absent_count': 0
+    }
+    started = perf_counter()
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 백필 시작: "
+          f"{start_date} ~ {end_date} ({len(dates)}일, 작업 프로세스 {workers}개)")
+    
+    def record(target_date, outcome=None, error=None):
+        if error is not None:
+            summary['failed'] += 1
+            print(f"  {target_date}: 실패 ({error})")
+            return
+        summary[outcome['result']] += 1
+        summary['processed_count'] += outcome['processed_count']
+        summary['absent_count'] += outcome['absent_count']
+        if outcome['result'] == AUTO_ABSENT_DONE:
+            print(f"  {target_date}: {outcome['processed_count']}개 세션, {outcome['absent_count']}명 결석 처리 "
+                  f"({outcome['elapsed_seconds']:.2f}초)")
+        elif outcome['result'] == AUTO_ABSENT_SKIPPED:
+            print(f"  {target_date}: 이미 처리됨")
+        else:
+            print(f"  {target_date}: 다른 프로세스가 처리 중")
+    
+    if workers <= 1:
+        for target_date in dates:
+            try:
+                record(target_date, process_auto_absent_day(target_date, not force, chunk_size))
+            except Exception as e:
+                record(target_date, error=e)
+    else:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                executor.submit(process_auto_absent_day, target_date, not force, chunk_size): target_date
+                for target_date in dates
+            }
+            for future in as_completed(futures):
+                try:
+                    record(futures[future], future.result())
+                except Exception as e:
+                    record(futures[future], error=e)
+    
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 백필 완료: "
+          f"완료 {summary[AUTO_ABSENT_DONE]}일, 건너뜀 {summary[AUTO_ABSENT_SKIPPED]}일, "
+          f"처리 중 {summary[AUTO_ABSENT_LOCKED]}일, 실패 {summary['failed']}일 "
+          f"({perf_counter() - started:.2f}초)")
+    return summary
+
+
 def run_daily_auto_absent():
     """
     일일 자동 결석 처리 함수
@@ -103,10 +282,15 @@ def run_daily_auto_absent():
     print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 처리 시작: {today}")
     
     try:
-        processed_count, absent_count = mark_absent_for_missing_checkins(today)
-        print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 처리 완료: {processed_count}개 세션, {absent_count}명 결석 처리")
-        return processed_count, absent_count
+        # 하루 중 다시 실행해도 그 사이 생긴 미출석을 처리하도록 완료 여부와 무관하게 실행
+        outcome = process_auto_absent_day(today, skip_completed=False)
+        if outcome['result'] == AUTO_ABSENT_LOCKED:
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 다른 프로세스가 {today} 자동 결석 처리를 실행 중이므로 건너뜁니다.")
+        else:
+            print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 처리 완료: "
+                  f"{outcome['processed_count']}개 세션, {outcome['absent_count']}명 결석 처리 "
+                  f"({outcome['chunks']}개 묶음, 전체 {outcome['elapsed_seconds']:.2f}초)")
+        return outcome['processed_count'], outcome['absent_count']
     except Exception as e:
         print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 자동 결석 처리 실패: {e}")
         raise
-
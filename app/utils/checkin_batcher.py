@@ -0,0 +1,330 @@
+"""
+출석 체크 쓰기 지연(write-behind) 배처
+수업 시작 시각에 몰리는 출석 요청을 로컬 추가 전용 로그에 먼저 기록(응답)하고,
+일정 시간 또는 일정 건수마다 checkin 테이블에 다중 행 INSERT로 한꺼번에 반영합니다.
+"""
+import atexit
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from mysql.connector.errors import InterfaceError, OperationalError
+from config import CHECKIN_BATCH_CONFIG
+from app.utils.db_helpers import get_db_connection
+from app.utils.checkin_engine import record_checkins_bulk, get_recorded_bulk_checkins
+from app.utils.attendance_summary import apply_bulk_checkins_to_summary
+from app.utils.attendance_events import get_attendance_event_hub, publish_attendance_status
+from app.utils.constants import ATTENDANCE_STATUS_DISPLAY
+
+SEGMENT_PREFIX = 'checkin-'
+SEGMENT_SUFFIX = '.log'
+# 재시도 한도를 넘어 기록을 포기한 세그먼트의 접미어 (복구 대상에서 제외, 수동 확인용)
+FAILED_SUFFIX = '-failed.log'
+
+
+class CheckinBatcher:
+    """
+    출석 요청을 모아서 대량으로 기록하는 배처입니다.
+
+    - submit(): 요청을 현재 로그 세그먼트에 추가(fsync)한 뒤 메모리 버퍼에 넣고 바로 반환
+    - flush(): 버퍼를 새 세그먼트로 교체하고 이전 세그먼트의 요청을 DB에 기록한 뒤 세그먼트 삭제
+    - 재시작 시 남아 있는 세그먼트(비정상 종료된 프로세스의 로그)를 순서대로 다시 기록
+      (기록은 UNIQUE(session_id, student_id) 덕분에 여러 번 실행해도 결과가 같음)
+    - 연결 오류가 아닌 오류로 max_retries번 실패한 세그먼트는 '-failed.log'로 이름을 바꿔 남기고 다음 세그먼트로 진행
+      (한 세그먼트 때문에 이후의 모든 출석 기록이 멈추지 않도록 함)
+    """
+
+    def __init__(self, log_dir, flush_interval_ms=200, max_batch_rows=500, fsync=True, max_retries=5):
+        self.log_dir = Path(log_dir)
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_batch_rows = max_batch_rows
+        self.fsync = fsync
+        self.max_retries = max_retries
+        self.pid = os.getpid()
+        # 같은 PID가 재사용되어도 이전 실행의 세그먼트와 구분되도록 시작 시각을 세그먼트 이름에 포함
+        self.instance_id = f"{self.pid}-{int(time.time() * 1000)}"
+
+        self._lock = threading.Lock()  # 버퍼와 현재 세그먼트 보호
+        self._flush_lock = threading.Lock()  # 한 번에 하나의 flush만 실행 (순서 보장)
+        self._wakeup = threading.Event()
+        self._stop = threading.Event()
+        self._thread = None
+        self._buffer = []
+        self._segment_seq = 0
+        self._segment_path = None
+        self._segment_file = None
+        self._pending = []  # DB 기록에 실패해 재시도할 (세그먼트 경로, 요청 목록)
+        self._attempts = {}  # 세그먼트 경로별 연결 오류가 아닌 실패 횟수
+        self.stats = {
+            'submitted': 0, 'flushed_rows': 0, 'inserted': 0, 'flushes': 0, 'failures': 0, 'dead_lettered': 0
+        }
+
+    def start(self):
+        """남은 로그를 복구하고 주기적으로 flush하는 백그라운드 스레드를 시작합니다."""
+        self.log_dir.mkdir(parents=True, exist_ok=True)
+        self._recover()
+        with self._lock:
+            self._open_segment()
+        self._thread = threading.Thread(target=self._run, name='checkin-batcher', daemon=True)
+        self._thread.start()
+        atexit.register(self.shutdown)
+
+    def submit(self, schedule_id, class_date, student_number, check_time=None):
+        """
+        출석 요청을 로그에 기록하고 버퍼에 추가합니다.
+
+        Args:
+            schedule_id: 스케줄 ID
+            class_date: 수업 날짜 (date 객체)
+            student_number: 학번
+            check_time: 출석 시각 (datetime 객체, 기본값: 현재 시각)
+        """
+        entry = {
+            'schedule_id': schedule_id,
+            'class_date': class_date.isoformat(),
+            'student_number': student_number,
+            'check_time': (check_time or datetime.now()).isoformat(sep=' ', timespec='seconds')
+        }
+        line = json.dumps(entry, ensure_ascii=False) + '\n'
+        with self._lock:
+            # 응답하기 전에 로그에 기록하여 프로세스가 죽어도 재시작 시 복구 가능하게 함
+            self._segment_file.write(line)
+            self._segment_file.flush()
+            if self.fsync:
+                os.fsync(self._segment_file.fileno())
+            self._buffer.append(entry)
+            self.stats['submitted'] += 1
+            buffered = len(self._buffer)
+        # 최대 건수에 도달하면 주기를 기다리지 않고 바로 flush
+        if buffered >= self.max_batch_rows:
+            self._wakeup.set()
+
+    def flush(self):
+        """
+        버퍼에 쌓인 요청을 DB에 기록합니다.
+        이전에 실패한 세그먼트가 있으면 먼저 기록하여 요청 순서를 유지합니다.
+
+        Returns:
+            int: 새로 기록된 출석 수
+        """
+        with self._flush_lock:
+            with self._lock:
+                if self._buffer:
+                    # 현재 세그먼트를 닫고 새 세그먼트로 교체
+                    self._pending.append((self._segment_path, self._buffer))
+                    self._buffer = []
+                    self._segment_file.close()
+                    self._open_segment()
+
+            inserted = 0
+            while self._pending:
+                path, entries = self._pending[0]
+                try:
+                    inserted += self._write(entries)
+                except Exception as e:
+                    self.stats['failures'] += 1
+                    # DB 연결/잠금 대기 같은 일시적 오류는 한도 없이 다음 주기에 재시도 (요청 순서 유지)
+                    if isinstance(e, (InterfaceError, OperationalError)):
+                        print(f"출석 배치 기록 실패 (다음 주기에 재시도): {e}")
+                        break
+                    attempts = self._attempts.get(path, 0) + 1
+                    self._attempts[path] = attempts
+                    if attempts < self.max_retries:
+                        print(f"출석 배치 기록 실패 ({attempts}/{self.max_retries}, 다음 주기에 재시도): {e}")
+                        break
+                    # 재시도 한도 초과: 세그먼트를 따로 보관하고 다음 세그먼트로 진행
+                    failed_path = self._dead_letter(path)
+                    print(f"출석 배치 기록 포기 ({len(entries)}건, {failed_path}에 보관): {e}")
+                    self._pending.pop(0)
+                    continue
+                self._pending.pop(0)
+                self._attempts.pop(path, None)
+                _remove_quietly(path)
+            return inserted
+
+    def shutdown(self):
+        """백그라운드 스레드를 멈추고 남은 요청을 모두 기록합니다."""
+        if self._stop.is_set():
+            return
+        self._stop.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout=self.flush_interval * 10 + 5)
+        self.flush()
+        with self._lock:
+            if self._segment_file is not None:
+                self._segment_file.close()
+                self._segment_file = None
+                # 비어 있는 세그먼트는 남길 필요가 없음
+                if self._segment_path.exists() and self._segment_path.stat().st_size == 0:
+                    _remove_quietly(self._segment_path)
+
+    def _run(self):
+        while not self._stop.is_set():
+            self._wakeup.wait(self.flush_interval)
+            self._wakeup.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"출석 배치 처리 중 오류 발생: {e}")
+
+    def _write(self, entries):
+        inserted = 0
+        recorded = []
+        notify = get_attendance_event_hub() is not None
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                for start in range(0, len(entries), self.max_batch_rows):
+                    chunk = entries[start:start + self.max_batch_rows]
+                    chunk_inserted = record_checkins_bulk(cursor, chunk)
+                    if chunk_inserted:
+                        first_checkin_id = cursor.lastrowid
+                        # 새로 기록된 출석만 통계 요약에 같은 트랜잭션으로 증분 반영 (과목 전체 재계산 없음)
+                        apply_bulk_checkins_to_summary(cursor, chunk, first_checkin_id)
+                        if notify:
+                            recorded.extend(get_recorded_bulk_checkins(cursor, chunk, first_checkin_id))
+                    inserted += chunk_inserted
+            conn.commit()
+        # 커밋된 출석만 같은 학생의 열린 출석 페이지에 알림
+        for student_number, schedule_id in recorded:
+            publish_attendance_status(student_number, schedule_id, ATTENDANCE_STATUS_DISPLAY['PRESENT'])
+        self.stats['flushes'] += 1
+        self.stats['flushed_rows'] += len(entries)
+        self.stats['inserted'] += inserted
+        return inserted
+
+    def _dead_letter(self, path):
+        """기록을 포기한 세그먼트를 복구 대상이 아닌 '-failed.log' 이름으로 바꿉니다."""
+        self._attempts.pop(path, None)
+        self.stats['dead_lettered'] += 1
+        failed_path = path.with_name(path.name[:-len(SEGMENT_SUFFIX)] + FAILED_SUFFIX)
+        try:
+            os.rename(path, failed_path)
+        except OSError:
+            return path
+        return failed_path
+
+    def _open_segment(self):
+        self._segment_seq += 1
+        self._segment_path = self.log_dir / f"{SEGMENT_PREFIX}{self.instance_id}-{self._segment_seq:06d}{SEGMENT_SUFFIX}"
+        self._segment_file = open(self._segment_path, 'a', encoding='utf-8')
+
+    def _recover(self):
+        """
+        종료된 프로세스가 남긴 세그먼트를 순서대로 읽어 재시도 목록에 넣고 기록합니다.
+        실행 중인 다른 워커의 세그먼트는 건드리지 않습니다.
+        """
+        for path in sorted(self.log_dir.glob(f"{SEGMENT_PREFIX}*{SEGMENT_SUFFIX}"), key=_segment_sort_key):
+            if path.name.startswith(f"{SEGMENT_PREFIX}{self.instance_id}-") or path.name.endswith(FAILED_SUFFIX):
+                continue
+            owner_pid = _segment_pid(path)
+            if owner_pid is None or (owner_pid != self.pid and _pid_alive(owner_pid)):
+                continue
+            # 다른 워커와 동시에 복구하지 않도록 이름을 바꿔 소유권을 가져옴
+            # (복구 중 이 프로세스가 죽어도 다음 시작 시 다시 복구되도록 같은 접두어 유지)
+            claimed = path.with_name(f"{SEGMENT_PREFIX}{self.instance_id}-recovered-{path.name}")
+            try:
+                os.rename(path, claimed)
+            except OSError:
+                continue
+            entries = _read_segment(claimed)
+            if entries:
+                self._pending.append((claimed, entries))
+            else:
+                _remove_quietly(claimed)
+        if self._pending:
+            print(f"출석 배치 로그 복구: {sum(len(e) for _, e in self._pending)}건")
+            self.flush()
+
+
+def _read_segment(path):
+    entries = []
+    with open(path, encoding='utf-8') as f:
+        for line in f:
+            try:
+                entries.append(json.loads(line))
+            except ValueError:
+                # 기록 도중 종료되어 잘린 마지막 줄은 응답하지 않은 요청이므로 버림
+                continue
+    return entries
+
+
+def _segment_pid(path):
+    try:
+        return int(path.name[len(SEGMENT_PREFIX):].split('-')[0])
+    except ValueError:
+        return None
+
+
+def _segment_sort_key(path):
+    return (path.stat().st_mtime, path.name)
+
+
+def _pid_alive(pid):
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+def _remove_quietly(path):
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+_batcher = None
+_batcher_lock = threading.Lock()
+
+
+def get_checkin_batcher():
+    """
+    현재 프로세스의 출석 배처를 반환합니다.
+    배치 모드(CHECKIN_BATCH_ENABLED)가 꺼져 있으면 None을 반환합니다.
+    처음 호출될 때 로그 복구와 백그라운드 스레드를 시작합니다.
+
+    Returns:
+        CheckinBatcher 객체 또는 None
+    """
+    global _batcher
+    if not CHECKIN_BATCH_CONFIG['enabled']:
+        return None
+    if _batcher is None or _batcher.pid != os.getpid():
+        with _batcher_lock:
+            if _batcher is None or _batcher.pid != os.getpid():
+                batcher = CheckinBatcher(
+                    CHECKIN_BATCH_CONFIG['log_dir'],
+                    flush_interval_ms=CHECKIN_BATCH_CONFIG['flush_interval_ms'],
+                    max_batch_rows=CHECKIN_BATCH_CONFIG['max_batch_rows'],
+                    fsync=CHECKIN_BATCH_CONFIG['fsync'],
+                    max_retries=CHECKIN_BATCH_CONFIG['max_retries']
+                )
+                batcher.start()
+                _batcher = batcher
+    return _batcher
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_checkin_batcher()
+#   - 필요성: 배치 모드가 켜진 경우 프로세스당 하나의 배처를 만들고 시작함.
+#            수업 시작 직후 몰리는 출석 요청을 개별 INSERT + 커밋 대신 대량 쓰기로 처리함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()와 main.py(시작 시 로그 복구)에서 사용됨.
+#
+# CheckinBatcher.submit(schedule_id, class_date, student_number, check_time)
+#   - 필요성: 요청을 로그에 안전하게 기록한 뒤 바로 응답할 수 있게 함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()에서 사용됨.
+#
+# CheckinBatcher.flush() / shutdown()
+#   - 필요성: 버퍼를 DB에 반영하고, 커밋된 출석만 실시간 알림으로 보냄. shutdown은 프로세스 종료 시(atexit) 남은 요청을 모두 기록함.
+#            연결 오류가 아닌 오류로 계속 실패하는 세그먼트는 '-failed.log'로 보관하고 다음 세그먼트로 진행함.
+#   - 사용처: 배처 백그라운드 스레드와 atexit 훅에서 호출됨.
+#
@@ -0,0 +1,300 @@
+"""
+출석 체크 처리 엔진
+수업 세션 조회와 출석 기록 삽입을 하나의 SQL 문으로 처리합니다.
+"""
+from app.utils.constants import ATTENDANCE_STATUS_DISPLAY
+
+# 출석 처리 결과 코드
+CHECKIN_RECORDED = 'recorded'  # 새로 출석 처리됨
+CHECKIN_ALREADY = 'already'  # 이미 출석 기록이 있음
+CHECKIN_NOT_FOUND = 'not_found'  # 오늘 해당 수업 세션이 없거나 수강생이 아님
+
+
+# 세션 조회 + 수강 여부 확인 + 출석 기록 삽입을 한 번에 처리하는 쿼리
+# UNIQUE(session_id, student_id) 충돌 시 아무것도 바꾸지 않고 기존 checkin_id를 LAST_INSERT_ID로 돌려받아
+# 별도의 SELECT 없이 '이미 출석'을 판별합니다.
+CHECKIN_BY_NUMBER_QUERY = """
+    INSERT INTO checkin (session_id, student_id, check_time, status)
+    SELECT cs.session_id, st.student_id, NOW(), 'PRESENT'
+    FROM class_session cs
+    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+    JOIN enrollment e ON e.subject_id = ss.subject_id
+    JOIN student st ON e.student_id = st.student_id
+    WHERE cs.schedule_id = %s
+      AND cs.class_date = %s
+      AND st.student_number = %s
+    ON DUPLICATE KEY UPDATE checkin_id = LAST_INSERT_ID(checkin_id)
+"""
+
+# 세션과 학생 ID를 이미 알고 있을 때(출석 가능 시간 인덱스, 로그인 세션) 수강 여부 확인 + 출석 기록 삽입을 한 번에 처리하는 쿼리
+CHECKIN_BY_SESSION_QUERY = """
+    INSERT INTO checkin (session_id, student_id, check_time, status)
+    SELECT %s, e.student_id, NOW(), 'PRESENT'
+    FROM enrollment e
+    WHERE e.student_id = %s
+      AND e.subject_id = %s
+    ON DUPLICATE KEY UPDATE checkin_id = LAST_INSERT_ID(checkin_id)
+"""
+
+
+def _checkin_result(cursor):
+    """
+    출석 기록 INSERT 결과를 결과 코드로 변환합니다.
+
+    Args:
+        cursor: CHECKIN_BY_*_QUERY를 실행한 커서
+
+    Returns:
+        (result, checkin_id) 튜플
+    """
+    # 새 행이 삽입되면 영향받은 행 수가 1
+    if cursor.rowcount == 1:
+        return CHECKIN_RECORDED, cursor.lastrowid
+    # 중복 키로 변경 없이 끝난 경우 LAST_INSERT_ID(checkin_id)로 기존 ID가 전달됨
+    if cursor.lastrowid:
+        return CHECKIN_ALREADY, cursor.lastrowid
+    # SELECT 결과가 없으면 세션이 없거나 수강생이 아님
+    return CHECKIN_NOT_FOUND, None
+
+
+def record_checkin(cursor, schedule_id, class_date, student_number):
+    """
+    학생의 출석을 한 번의 쿼리로 기록합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        schedule_id: 스케줄 ID
+        class_date: 수업 날짜 (date 객체)
+        student_number: 학번
+
+    Returns:
+        (result, checkin_id) 튜플
+        - result: CHECKIN_RECORDED, CHECKIN_ALREADY, CHECKIN_NOT_FOUND 중 하나
+        - checkin_id: 새로 생성되었거나 이미 존재하는 출석 기록 ID (없으면 None)
+    """
+    cursor.execute(CHECKIN_BY_NUMBER_QUERY, (schedule_id, class_date, student_number))
+    return _checkin_result(cursor)
+
+
+def record_checkin_for_session(cursor, session_id, subject_id, student_id):
+    """
+    수업 세션을 이미 알고 있을 때 학생의 출석을 한 번의 쿼리로 기록합니다.
+    세션/스케줄/학생 조인 없이 수강 여부만 확인합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        session_id: 수업 세션 ID
+        subject_id: 과목 ID
+        student_id: 학생 ID
+
+    Returns:
+        (result, checkin_id) 튜플 (record_checkin과 동일)
+    """
+    cursor.execute(CHECKIN_BY_SESSION_QUERY, (session_id, student_id, subject_id))
+    return _checkin_result(cursor)
+
+
+def is_checkin_target(cursor, schedule_id, class_date, student_id, subject_id=None):
+    """
+    학생이 해당 날짜의 수업 세션에 출석할 수 있는지(세션이 있고 수강생인지) 확인합니다.
+    배치 모드에서 요청을 접수하기 전에 사용하며, 출석 기록은 하지 않습니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        schedule_id: 스케줄 ID
+        class_date: 수업 날짜 (date 객체)
+        student_id: 학생 ID
+        subject_id: 과목 ID (출석 가능 시간 인덱스에서 세션을 이미 찾은 경우 수강 여부만 확인)
+
+    Returns:
+        bool: 출석 대상이면 True
+    """
+    if subject_id is not None:
+        cursor.execute("""
+            SELECT 1 FROM enrollment
+            WHERE student_id = %s AND subject_id = %s
+        """, (student_id, subject_id))
+    else:
+        cursor.execute("""
+            SELECT 1
+            FROM class_session cs
+            JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+            JOIN enrollment e ON e.subject_id = ss.subject_id AND e.student_id = %s
+            WHERE cs.schedule_id = %s
+              AND cs.class_date = %s
+        """, (student_id, schedule_id, class_date))
+    return cursor.fetchone() is not None
+
+
+def build_checkin_requests_table(entries):
+    """
+    출석 요청 목록을 UNION ALL 파생 테이블 SQL과 파라미터로 만듭니다.
+    (열: seq, schedule_id, class_date, student_number, check_time)
+
+    Args:
+        entries: 출석 요청 딕셔너리 리스트
+
+    Returns:
+        (rows_sql, params) 튜플
+    """
+    rows_sql = " UNION ALL ".join(
+        ["SELECT %s AS seq, %s AS schedule_id, %s AS class_date, %s AS student_number, %s AS check_time"]
+        * len(entries)
+    )
+    params = []
+    for seq, entry in enumerate(entries):
+        params.extend([
+            seq, entry['schedule_id'], entry['class_date'], entry['student_number'], entry['check_time']
+        ])
+    return rows_sql, params
+
+
+def record_checkins_bulk(cursor, entries):
+    """
+    여러 학생의 출석을 한 번의 다중 행 INSERT ... SELECT로 기록합니다.
+    entries 순서대로 삽입하므로 같은 학생의 중복 요청은 먼저 들어온 요청이 기록됩니다.
+    이미 출석 기록이 있거나 세션이 없는 항목은 무시됩니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        entries: 출석 요청 딕셔너리 리스트
+            (각 항목은 schedule_id, class_date, student_number, check_time을 포함)
+
+    Returns:
+        int: 새로 기록된 출석 수 (1 이상이면 cursor.lastrowid가 이번에 삽입된 첫 출석 기록 ID)
+    """
+    if not entries:
+        return 0
+
+    # 요청 목록을 파생 테이블로 만들어 세션/학생과 조인
+    rows_sql, params = build_checkin_requests_table(entries)
+    cursor.execute(f"""
+        INSERT INTO checkin (session_id, student_id, check_time, status)
+        SELECT cs.session_id, st.student_id, req.check_time, 'PRESENT'
+        FROM ({rows_sql}) AS req
+        JOIN class_session cs ON cs.schedule_id = req.schedule_id AND cs.class_date = req.class_date
+        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+        JOIN student st ON st.student_number = req.student_number
+        JOIN enrollment e ON e.subject_id = ss.subject_id AND e.student_id = st.student_id
+        ORDER BY req.seq
+        ON DUPLICATE KEY UPDATE checkin_id = checkin_id
+    """, params)
+    # 중복 키로 변경이 없는 행은 영향받은 행 수에 포함되지 않음
+    return cursor.rowcount
+
+
+def get_recorded_bulk_checkins(cursor, entries, first_checkin_id):
+    """
+    record_checkins_bulk()로 이번에 새로 기록된 출석 요청의 (학번, 스케줄 ID) 목록을 조회합니다.
+    (실시간 알림을 실제로 기록된 요청에만 보내기 위해 사용)
+
+    Args:
+        cursor: 데이터베이스 커서
+        entries: record_checkins_bulk()에 전달한 출석 요청 리스트
+        first_checkin_id: 이번 INSERT로 삽입된 첫 출석 기록 ID (cursor.lastrowid)
+
+    Returns:
+        list: (student_number, schedule_id) 튜플 리스트
+    """
+    if not entries:
+        return []
+    rows_sql, params = build_checkin_requests_table(entries)
+    cursor.execute(f"""
+        SELECT DISTINCT req.student_number, req.schedule_id
+        FROM ({rows_sql}) AS req
+        JOIN class_session cs ON cs.schedule_id = req.schedule_id AND cs.class_date = req.class_date
+        JOIN student st ON st.student_number = req.student_number
+        JOIN checkin c ON c.session_id = cs.session_id AND c.student_id = st.student_id
+        WHERE c.checkin_id >= %s
+          AND c.check_time = req.check_time
+    """, (*params, first_checkin_id))
+    return [(row[0], row[1]) for row in cursor.fetchall()]
+
+
+def save_session_statuses(cursor, session_id, submitted):
+    """
+    교수 출결 관리 화면에서 제출한 출석 상태 중 바뀐 것만 한 번의 다중 행 INSERT로 저장합니다.
+    출석 기록이 없는 학생은 어떤 상태로 제출되든 바뀐 것으로 보고 기록을 저장합니다.
+    (화면에 '결석'으로 표시되더라도 '결석'으로 저장하면 명시적인 ABSENT 행이 생성됨)
+    수강생이 아니거나 알 수 없는 상태 값은 무시합니다. 커밋은 호출한 쪽에서 수행합니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        session_id: 수업 세션 ID
+        submitted: {student_id: status} 딕셔너리 (폼에서 받은 값)
+
+    Returns:
+        list: 상태가 바뀐 학생 ID 리스트
+    """
+    if not submitted:
+        return []
+
+    # 현재 세션의 수강생 명단과 저장된 출석 상태 조회 (출석 기록이 없으면 None)
+    cursor.execute("""
+        SELECT e.student_id, chk.status
+        FROM class_session cs
+        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+        JOIN enrollment e ON e.subject_id = ss.subject_id
+        LEFT JOIN checkin chk ON chk.session_id = cs.session_id AND chk.student_id = e.student_id
+        WHERE cs.session_id = %s
+    """, (session_id,))
+    current = {row['student_id']: row['status'] for row in cursor.fetchall()}
+
+    changed = []
+    for student_id, status in submitted.items():
+        try:
+            student_id = int(student_id)
+        except (TypeError, ValueError):
+            continue
+        if student_id in current and status in ATTENDANCE_STATUS_DISPLAY and current[student_id] != status:
+            changed.append((student_id, status))
+
+    if not changed:
+        return []
+
+    # 바뀐 학생만 VALUES 목록 하나로 저장 (수강생 수와 무관하게 한 번의 왕복)
+    values_sql = ", ".join(["(%s, %s, %s)"] * len(changed))
+    params = []
+    for student_id, status in changed:
+        params.extend([session_id, student_id, status])
+    cursor.execute(f"""
+        INSERT INTO checkin (session_id, student_id, status)
+        VALUES {values_sql}
+        ON DUPLICATE KEY UPDATE status = VALUES(status)
+    """, params)
+    return [student_id for student_id, _ in changed]
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# record_checkin(cursor, schedule_id, class_date, student_number)
+#   - 필요성: 학생 조회, 세션 조회, 중복 확인, 삽입의 4번 왕복을 INSERT ... SELECT 한 번으로 줄임.
+#            UNIQUE(session_id, student_id) 키로 중복 출석을 원자적으로 방지함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()에서 사용됨.
+#
+# is_checkin_target(cursor, schedule_id, class_date, student_id, subject_id=None)
+#   - 필요성: 배치 모드는 DB 반영 전에 응답하므로, 수강생이 아니거나 세션이 없는 요청을 접수(202)하지 않도록
+#            한 행 조회로 먼저 확인함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()(배치 모드)에서 사용됨.
+#
+# record_checkin_for_session(cursor, session_id, subject_id, student_id)
+#   - 필요성: 출석 가능 시간 인덱스에서 찾은 session_id로 세션/스케줄 조인 없이 출석을 기록함.
+#   - 사용처: app/routes/attendance_routes.py의 check_attendance()에서 사용됨.
+#
+# record_checkins_bulk(cursor, entries)
+#   - 필요성: 쓰기 지연(write-behind) 모드에서 모아둔 출석 요청을 다중 행 INSERT 한 번으로 기록함.
+#            수천 개의 작은 트랜잭션을 몇 개의 대량 쓰기로 바꿈.
+#   - 사용처: app/utils/checkin_batcher.py의 CheckinBatcher.flush()에서 사용됨.
+#
+#
+# get_recorded_bulk_checkins(cursor, entries, first_checkin_id)
+#   - 필요성: 배치 모드에서 '출석완료' 실시간 알림을 커밋된 출석에만 보내도록 새로 기록된 요청을 조회함.
+#   - 사용처: app/utils/checkin_batcher.py의 CheckinBatcher._write()에서 사용됨 (실시간 알림이 켜진 경우만).
+#
+# save_session_statuses(cursor, session_id, submitted)
+#   - 필요성: 학생마다 UPSERT를 실행하던 저장을, 현재 명단과 비교해 바뀐 행만 다중 행 INSERT 한 번으로 줄임.
+#            300명 규모의 강의도 조회 1번, 쓰기 1번으로 저장됨.
+#   - 사용처: app/routes/professor_routes.py의 manage_attendance_professor()에서 사용됨.
+#
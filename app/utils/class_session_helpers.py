@@ -0,0 +1,329 @@
+"""
+수업 세션(class_session) 관련 유틸리티
+스케줄(subject_schedule)로부터 날짜별 수업 세션을 미리 일괄 생성합니다.
+"""
+from datetime import datetime, date, timedelta
+from time import perf_counter
+from app.utils.db_helpers import get_db_connection
+from app.utils.attendance_summary import refresh_attendance_summary
+from app.utils.constants import WEEKDAY_MAP, SESSION_MATERIALIZE_CHUNK_SIZE, get_semester_dates
+
+
+def _plan_session_rows(cursor, start_date, end_date, subject_id=None, schedule_ids=None, respect_semester=True):
+    """
+    기간 내에 있어야 할 수업 세션 (schedule_id, class_date) 목록을 계산합니다. (SELECT만 실행)
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        start_date: 시작 날짜 (date 객체, 포함)
+        end_date: 종료 날짜 (date 객체, 포함)
+        subject_id: 특정 과목만 계산할 경우 과목 ID
+        schedule_ids: 특정 스케줄만 계산할 경우 스케줄 ID 리스트
+        respect_semester: True이면 과목의 개설 연도/학기 기간 밖의 날짜는 제외
+
+    Returns:
+        list: (schedule_id, class_date) 튜플 리스트
+    """
+    # 대상 스케줄 조회 (과목 개설 학기 정보 포함)
+    query = """
+        SELECT ss.schedule_id, ss.day_of_week, s.subject_year, s.subject_semester
+        FROM subject_schedule ss
+        JOIN subject s ON ss.subject_id = s.subject_id
+    """
+    conditions = []
+    params = []
+    if subject_id is not None:
+        conditions.append("ss.subject_id = %s")
+        params.append(subject_id)
+    if schedule_ids is not None:
+        if not schedule_ids:
+            return []
+        conditions.append(f"ss.schedule_id IN ({', '.join(['%s'] * len(schedule_ids))})")
+        params.extend(schedule_ids)
+    if conditions:
+        query += " WHERE " + " AND ".join(conditions)
+    cursor.execute(query, params)
+    schedules = cursor.fetchall()
+
+    # 요일별로 스케줄을 묶고, 학기 기간을 미리 계산
+    schedules_by_weekday = {}
+    for schedule in schedules:
+        weekday = WEEKDAY_MAP.get(str(schedule['day_of_week']).upper())
+        if weekday is None:
+            continue
+        semester_range = None
+        if respect_semester and schedule['subject_year'] and schedule['subject_semester'] in (1, 2):
+            semester_range = get_semester_dates(schedule['subject_year'], schedule['subject_semester'])
+        schedules_by_weekday.setdefault(weekday, []).append((schedule['schedule_id'], semester_range))
+
+    # 기간 내 날짜마다 해당 요일의 스케줄에 대한 세션 행 생성
+    rows = []
+    current_date = start_date
+    while current_date <= end_date:
+        for schedule_id, semester_range in schedules_by_weekday.get(current_date.weekday(), []):
+            if semester_range and not (semester_range[0] <= current_date <= semester_range[1]):
+                continue
+            rows.append((schedule_id, current_date))
+        current_date += timedelta(days=1)
+    return rows
+
+
+def materialize_sessions(cursor, start_date, end_date, subject_id=None, schedule_ids=None,
+                         respect_semester=True, chunk_size=SESSION_MATERIALIZE_CHUNK_SIZE):
+    """
+    기간 내 모든 수업 세션을 다중 행 INSERT IGNORE로 일괄 생성합니다.
+    이미 존재하는 (schedule_id, class_date)는 UNIQUE 키에 의해 무시되므로 여러 번 실행해도 안전합니다.
+    커밋은 호출한 쪽에서 수행합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        start_date: 시작 날짜 (date 객체, 포함)
+        end_date: 종료 날짜 (date 객체, 포함)
+        subject_id: 특정 과목만 생성할 경우 과목 ID
+        schedule_ids: 특정 스케줄만 생성할 경우 스케줄 ID 리스트
+        respect_semester: True이면 과목의 개설 연도/학기 기간 밖의 날짜는 생성하지 않음
+        chunk_size: INSERT 한 번에 넣을 최대 행 수
+
+    Returns:
+        int: 새로 생성된 세션 수
+    """
+    rows = _plan_session_rows(cursor, start_date, end_date, subject_id, schedule_ids, respect_semester)
+
+    created_count = 0
+    for start in range(0, len(rows), chunk_size):
+        chunk = rows[start:start + chunk_size]
+        placeholders = ", ".join(["(%s, %s)"] * len(chunk))
+        params = [value for row in chunk for value in row]
+        cursor.execute(
+            f"INSERT IGNORE INTO class_session (schedule_id, class_date) VALUES {placeholders}",
+            params
+        )
+        created_count += cursor.rowcount
+    return created_count
+
+
+def run_session_materializer(start_date, end_date, subject_id=None):
+    """
+    기간 내 수업 세션을 일괄 생성하고 커밋합니다.
+    스크립트(cron)와 애플리케이션 시작 훅에서 사용합니다.
+
+    Args:
+        start_date: 시작 날짜 (date 객체)
+        end_date: 종료 날짜 (date 객체)
+        subject_id: 특정 과목만 생성할 경우 과목 ID
+
+    Returns:
+        int: 새로 생성된 세션 수
+    """
+    started = perf_counter()
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 수업 세션 생성 시작: {start_date} ~ {end_date}")
+    with get_db_connection() as conn:
+        with conn.cursor(dictionary=True) as cursor:
+            created_count = materialize_sessions(cursor, start_date, end_date, subject_id=subject_id)
+        conn.commit()
+    elapsed = perf_counter() - started
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 수업 세션 생성 완료: {created_count}개 생성 ({elapsed:.2f}초)")
+    return created_count
+
+
+def materialize_upcoming_sessions(days):
+    """
+    오늘부터 지정한 일수만큼의 수업 세션을 일괄 생성합니다.
+
+    Args:
+        days: 오늘을 포함해 생성할 일수
+
+    Returns:
+        int: 새로 생성된 세션 수
+    """
+    today = date.today()
+    return run_session_materializer(today, today + timedelta(days=max(days, 1) - 1))
+
+
+# 휴강된 세션의 모든 수강생을 '출석'으로 처리하는 쿼리 (조건은 호출하는 쪽에서 지정)
+CANCELLED_CHECKIN_QUERY = """
+    INSERT INTO checkin (session_id, student_id, status)
+    SELECT cs.session_id, e.student_id, 'PRESENT'
+    FROM class_session cs
+    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+    JOIN enrollment e ON e.subject_id = ss.subject_id
+    WHERE {condition}
+    ON DUPLICATE KEY UPDATE status = 'PRESENT'
+"""
+
+
+def cancel_class_session(cursor, schedule_id, class_date):
+    """
+    수업 세션을 휴강 처리하고 모든 수강생을 '출석'으로 처리합니다.
+    세션이 없으면 휴강 상태로 생성하며, 수강생 수와 무관하게 쿼리 두 번으로 처리합니다.
+    커밋은 호출한 쪽에서 수행합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        schedule_id: 스케줄 ID
+        class_date: 수업 날짜 (date 객체)
+
+    Returns:
+        int: 휴강 처리된 세션 ID
+    """
+    # 이미 있는 세션이면 휴강으로 바꾸고 LAST_INSERT_ID로 기존 session_id를 돌려받음
+    cursor.execute("""
+        INSERT INTO class_session (schedule_id, class_date, is_cancelled)
+        VALUES (%s, %s, TRUE)
+        ON DUPLICATE KEY UPDATE is_cancelled = TRUE, session_id = LAST_INSERT_ID(session_id)
+    """, (schedule_id, class_date))
+    session_id = cursor.lastrowid
+
+    cursor.execute(CANCELLED_CHECKIN_QUERY.format(condition="cs.session_id = %s"), (session_id,))
+    return session_id
+
+
+def _count_date_cancellation(cursor, class_date):
+    """
+    cancel_sessions_on_date()가 처리할 건수를 데이터를 바꾸지 않고 SELECT만으로 계산합니다. (dry-run용)
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        class_date: 휴강할 날짜 (date 객체)
+
+    Returns:
+        dict: cancel_sessions_on_date()의 처리 결과와 같은 형식
+    """
+    cursor.execute("""
+        SELECT schedule_id, is_cancelled FROM class_session WHERE class_date = %s
+    """, (class_date,))
+    existing = {row['schedule_id']: row['is_cancelled'] for row in cursor.fetchall()}
+    # 아직 생성되지 않은 세션 (materialize_sessions()가 생성할 세션)
+    missing = {schedule_id for schedule_id, _ in _plan_session_rows(cursor, class_date, class_date)} - existing.keys()
+    schedule_ids = sorted(existing.keys() | missing)
+
+    counts = {'subjects': 0, 'students': 0}
+    if schedule_ids:
+        cursor.execute(f"""
+            SELECT COUNT(DISTINCT ss.subject_id) AS subjects,
+                   COUNT(e.student_id) AS students
+            FROM subject_schedule ss
+            LEFT JOIN enrollment e ON e.subject_id = ss.subject_id
+            WHERE ss.schedule_id IN ({', '.join(['%s'] * len(schedule_ids))})
+        """, schedule_ids)
+        counts = cursor.fetchone()
+
+    return {
+        'sessions': len(schedule_ids),
+        'created': len(missing),
+        # 새로 생성되는 세션도 휴강으로 표시되므로 신규 휴강에 포함
+        'newly_cancelled': len(missing) + sum(1 for is_cancelled in existing.values() if not is_cancelled),
+        'subjects': counts['subjects'],
+        'students': counts['students']
+    }
+
+
+def cancel_sessions_on_date(class_date, dry_run=False):
+    """
+    특정 날짜(공휴일, 시험 기간 등)의 모든 과목 수업을 한 트랜잭션으로 휴강 처리합니다.
+    아직 생성되지 않은 세션은 먼저 생성하고, 모든 수강생을 '출석'으로 처리한 뒤 출석 통계 요약을 다시 계산합니다.
+    dry_run이면 쓰기 쿼리를 실행하지 않고 SELECT만으로 건수를 집계합니다.
+
+    Args:
+        class_date: 휴강할 날짜 (date 객체)
+        dry_run: True이면 변경 사항을 저장하지 않음
+
+    Returns:
+        dict: 처리 결과
+            - sessions: 해당 날짜의 전체 수업 세션 수
+            - created: 새로 생성된 세션 수
+            - newly_cancelled: 이번에 새로 휴강 처리된 세션 수
+            - subjects: 휴강된 과목 수
+            - students: 출석 처리 대상 (세션, 수강생) 수
+    """
+    started = perf_counter()
+    mode = "확인(dry-run)" if dry_run else "실행"
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 날짜 일괄 휴강 {mode} 시작: {class_date}")
+    if dry_run:
+        with get_db_connection() as conn:
+            with conn.cursor(dictionary=True) as cursor:
+                result = _count_date_cancellation(cursor, class_date)
+        _print_date_cancellation(started, mode, result)
+        return result
+
+    with get_db_connection() as conn:
+        with conn.cursor(dictionary=True) as cursor:
+            # 1. 해당 날짜의 세션이 없으면 생성 (과목 개설 학기 기간 안의 수업만)
+            created = materialize_sessions(cursor, class_date, class_date)
+
+            # 2. 해당 날짜의 모든 세션을 휴강으로 표시
+            cursor.execute("""
+                UPDATE class_session SET is_cancelled = TRUE
+                WHERE class_date = %s AND is_cancelled = FALSE
+            """, (class_date,))
+            newly_cancelled = cursor.rowcount
+
+            cursor.execute("""
+                SELECT COUNT(DISTINCT cs.session_id) AS sessions,
+                       COUNT(e.student_id) AS students
+                FROM class_session cs
+                JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+                LEFT JOIN enrollment e ON e.subject_id = ss.subject_id
+                WHERE cs.class_date = %s
+            """, (class_date,))
+            counts = cursor.fetchone()
+            cursor.execute("""
+                SELECT DISTINCT ss.subject_id
+                FROM class_session cs
+                JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+                WHERE cs.class_date = %s
+            """, (class_date,))
+            subject_ids = [row['subject_id'] for row in cursor.fetchall()]
+
+            # 3. 모든 수강생을 '출석'으로 처리하고 과목별 출석 통계 요약 다시 계산
+            cursor.execute(CANCELLED_CHECKIN_QUERY.format(condition="cs.class_date = %s"), (class_date,))
+            refresh_attendance_summary(cursor, subject_ids=subject_ids)
+        conn.commit()
+
+    result = {
+        'sessions': counts['sessions'],
+        'created': created,
+        'newly_cancelled': newly_cancelled,
+        'subjects': len(subject_ids),
+        'students': counts['students']
+    }
+    _print_date_cancellation(started, mode, result)
+    return result
+
+
+def _print_date_cancellation(started, mode, result):
+    """날짜 일괄 휴강 결과와 소요 시간을 출력합니다."""
+    elapsed = perf_counter() - started
+    print(f"[{datetime.now().strftime('%Y-%m-%d %H:%M:%S')}] 날짜 일괄 휴강 {mode} 완료: "
+          f"{result['subjects']}개 과목, {result['sessions']}개 세션(신규 휴강 {result['newly_cancelled']}개, "
+          f"생성 {result['created']}개), {result['students']}명 출석 처리 ({elapsed:.2f}초)")
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# materialize_sessions(cursor, start_date, end_date, subject_id, schedule_ids, respect_semester)
+#   - 필요성: 페이지 조회(GET) 중에 세션을 하나씩 INSERT + 커밋하던 방식을 없애고,
+#            기간 단위로 다중 행 INSERT IGNORE 하여 잠금 경합과 UNIQUE 키 경쟁을 제거함.
+#   - 사용처: run_session_materializer(), cancel_sessions_on_date()에서 사용됨.
+#
+# run_session_materializer(start_date, end_date, subject_id)
+#   - 필요성: 세션 생성 + 커밋 + 소요 시간 출력을 한 번에 처리함.
+#   - 사용처: scripts/materialize_sessions.py에서 사용됨.
+#
+# materialize_upcoming_sessions(days)
+#   - 필요성: 애플리케이션 시작 시 앞으로 며칠간의 세션을 미리 생성함. (개발용, 운영에서는 cron 작업 사용)
+#   - 사용처: main.py의 시작 훅에서 사용됨 (SESSION_MATERIALIZE_ON_STARTUP=true일 때만).
+#
+#
+# cancel_class_session(cursor, schedule_id, class_date)
+#   - 필요성: 세션 조회/생성과 수강생별 UPSERT 반복을 INSERT ... ON DUPLICATE KEY UPDATE와
+#            INSERT ... SELECT FROM enrollment 두 번으로 줄임.
+#   - 사용처: app/routes/professor_routes.py의 cancel_session()에서 사용됨.
+#
+# cancel_sessions_on_date(class_date, dry_run)
+#   - 필요성: 공휴일/시험 기간처럼 모든 과목이 쉬는 날을 한 트랜잭션으로 휴강 처리함.
+#            dry_run으로 실행 전에 영향받는 과목/세션/학생 수를 SELECT만으로 확인할 수 있음 (쓰기/잠금 없음).
+#   - 사용처: scripts/cancel_sessions_by_date.py에서 사용됨.
+#
@@ -7,6 +7,16 @@ from datetime import date
 ATTENDANCE_WINDOW_MINUTES = 10  # 출석 가능 시간 범위 (분 단위)
 MAX_WEEKS_PER_SEMESTER = 16  # 학기당 최대 주차 수
 
+# 수업 세션 일괄 생성 관련 상수
+SESSION_MATERIALIZE_CHUNK_SIZE = 1000  # INSERT 한 번에 넣을 최대 세션 행 수
+
+# 출석 통계 요약 관련 상수
+ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE = 50  # 요약 재계산 시 한 번에 처리할 과목 수
+
+# 자동 결석 처리 관련 상수
+AUTO_ABSENT_LOCK_PREFIX = 'wcheck:auto_absent:'  # 날짜별 MySQL 이름 잠금(GET_LOCK) 접두어
+ABSENT_SESSION_LOCK_PREFIX = 'wcheck:absent_session:'  # 수업 세션별 MySQL 이름 잠금 접두어
+
 # 1학기 날짜 설정
 SEMESTER_1_START_MONTH = 3  # 1학기 시작 월
 SEMESTER_1_START_DAY = 1  # 1학기 시작 일
@@ -84,3 +94,6 @@ ATTENDANCE_STATUS_DISPLAY = {
     'ABSENT': '결석'
 }
 
+
+# 세션 쿠키를 읽지 않는 경로 접두사 (인증이 필요 없는 가벼운 API)
+SESSIONLESS_PATH_PREFIXES = ('/api/server_time',)
@@ -0,0 +1,167 @@
+"""
+DB 테이블 페이지 조회 (키셋 페이지네이션)
+테이블을 기본 키 순서로 나누어 요청한 페이지의 행만 조회합니다.
+OFFSET과 달리 뒤쪽 페이지도 기본 키 인덱스로 바로 찾으므로 행 수가 늘어도 조회 시간이 일정합니다.
+"""
+import base64
+import json
+from app.utils.db_helpers import serialize_db_value
+
+
+def get_primary_key_columns(cursor, table_name):
+    """
+    테이블의 기본 키 컬럼을 순서대로 조회합니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary 여부 무관)
+        table_name: 테이블 이름
+
+    Returns:
+        list: 기본 키 컬럼 이름 리스트 (기본 키가 없으면 빈 리스트)
+    """
+    cursor.execute("""
+        SELECT COLUMN_NAME
+        FROM information_schema.KEY_COLUMN_USAGE
+        WHERE TABLE_SCHEMA = DATABASE()
+          AND TABLE_NAME = %s
+          AND CONSTRAINT_NAME = 'PRIMARY'
+        ORDER BY ORDINAL_POSITION
+    """, (table_name,))
+    return [
+        row['COLUMN_NAME'] if isinstance(row, dict) else row[0]
+        for row in cursor.fetchall()
+    ]
+
+
+def encode_page_cursor(values):
+    """
+    페이지 경계 행의 기본 키 값을 URL에 넣을 수 있는 문자열로 변환합니다.
+
+    Args:
+        values: 기본 키 값 리스트 (serialize_db_value()로 변환된 값)
+
+    Returns:
+        str: URL-safe base64 문자열
+    """
+    raw = json.dumps(values, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+    return base64.urlsafe_b64encode(raw).decode('ascii').rstrip('=')
+
+
+def decode_page_cursor(cursor_value, key_count):
+    """
+    encode_page_cursor()로 만든 문자열을 기본 키 값 리스트로 되돌립니다.
+
+    Args:
+        cursor_value: 페이지 커서 문자열
+        key_count: 기본 키 컬럼 수
+
+    Returns:
+        list: 기본 키 값 리스트 (형식이 잘못되었으면 None)
+    """
+    try:
+        padded = cursor_value + '=' * (-len(cursor_value) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode('ascii')).decode('utf-8'))
+    except (ValueError, UnicodeError):
+        return None
+    if not isinstance(values, list) or len(values) != key_count:
+        return None
+    return values
+
+
+def fetch_table_page(cursor, table_name, page_size, after=None, before=None):
+    """
+    테이블의 한 페이지를 기본 키 순서로 조회합니다.
+
+    - after: 이 커서(이전 페이지의 마지막 행) 다음 행부터 page_size행 (다음 페이지)
+    - before: 이 커서(다음 페이지의 첫 행) 앞의 page_size행 (이전 페이지)
+    - 둘 다 없으면 첫 페이지
+    - page_size + 1행을 조회하여 다음/이전 페이지가 있는지 함께 확인
+    - 기본 키가 없는 테이블은 첫 페이지만 조회 (커서 없음)
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=False, 테이블 이름은 호출 전에 검증해야 함)
+        table_name: 테이블 이름
+        page_size: 페이지 크기 (행)
+        after: 다음 페이지 커서
+        before: 이전 페이지 커서
+
+    Returns:
+        dict:
+            - columns: 컬럼 이름 리스트
+            - rows: serialize_db_value()로 변환한 값 리스트의 리스트
+            - key_columns: 기본 키 컬럼 리스트
+            - next_cursor / prev_cursor: 다음/이전 페이지 커서 (없으면 None)
+            - invalid_cursor: 커서 형식이 잘못되어 첫 페이지를 반환한 경우 True
+    """
+    key_columns = get_primary_key_columns(cursor, table_name)
+    key_list = ', '.join(f"`{column}`" for column in key_columns)
+    key_row = f"({key_list})" if len(key_columns) > 1 else key_list
+
+    direction = 'first'
+    params = []
+    where = ''
+    invalid_cursor = False
+    if key_columns and (after or before):
+        values = decode_page_cursor(after or before, len(key_columns))
+        if values is None:
+            invalid_cursor = True
+        else:
+            direction = 'next' if after else 'prev'
+            placeholders = ', '.join(['%s'] * len(values))
+            boundary = f"({placeholders})" if len(values) > 1 else placeholders
+            where = f"WHERE {key_row} {'>' if direction == 'next' else '<'} {boundary}"
+            params = values
+
+    order = ''
+    if key_columns:
+        sort = 'DESC' if direction == 'prev' else 'ASC'
+        order = 'ORDER BY ' + ', '.join(f"`{column}` {sort}" for column in key_columns)
+
+    cursor.execute(f"SELECT * FROM `{table_name}` {where} {order} LIMIT %s", (*params, page_size + 1))
+    columns = list(cursor.column_names)
+    rows = cursor.fetchall()
+
+    has_more = len(rows) > page_size
+    rows = rows[:page_size]
+    if direction == 'prev':
+        # 역순으로 조회했으므로 다시 기본 키 오름차순으로 정렬
+        rows.reverse()
+    rows = [[serialize_db_value(value) for value in row] for row in rows]
+
+    next_cursor = prev_cursor = None
+    if key_columns and rows:
+        key_indexes = [columns.index(column) for column in key_columns]
+
+        def row_cursor(row):
+            return encode_page_cursor([row[index] for index in key_indexes])
+
+        # 다음 페이지: 앞으로 조회해서 더 있거나, 이전 페이지로 돌아온 경우(커서 행이 뒤에 있음)
+        if has_more or direction == 'prev':
+            next_cursor = row_cursor(rows[-1])
+        # 이전 페이지: 다음 페이지로 넘어온 경우(커서 행이 앞에 있음)이거나, 뒤로 조회해서 더 있는 경우
+        if direction == 'next' or (direction == 'prev' and has_more):
+            prev_cursor = row_cursor(rows[0])
+
+    return {
+        'columns': columns,
+        'rows': rows,
+        'key_columns': key_columns,
+        'next_cursor': next_cursor,
+        'prev_cursor': prev_cursor,
+        'invalid_cursor': invalid_cursor
+    }
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# fetch_table_page(cursor, table_name, page_size, after=None, before=None)
+#   - 필요성: /db/ 페이지가 모든 테이블의 모든 행을 한 번에 렌더링하지 않고, 선택한 테이블의 한 페이지만 조회함.
+#            (기본 키) > (마지막 행의 기본 키) 조건으로 다음 페이지를 찾으므로 OFFSET처럼 앞 행을 건너뛰며 읽지 않음.
+#   - 사용처: app/routes/database_routes.py의 show_database_html()에서 사용됨.
+#
+# encode_page_cursor(values) / decode_page_cursor(cursor_value, key_count)
+#   - 필요성: 페이지 경계 행의 기본 키(복합 키 포함)를 URL 파라미터로 주고받음.
+#   - 사용처: fetch_table_page()에서 사용됨.
+#
@@ -0,0 +1,268 @@
+"""
+DB 데이터 내보내기
+테이블 데이터를 버퍼링하지 않는 커서와 fetchmany 묶음으로 읽어, 전체를 메모리에 올리지 않고 스트리밍합니다.
+"""
+import csv
+import io
+import json
+import zlib
+from config import DB_EXPORT_CONFIG
+from app.utils.db_helpers import get_db_pool, serialize_db_value
+
+# 지원하는 내보내기 형식과 응답 MIME 타입
+EXPORT_MIMETYPES = {
+    'json': 'application/json',  # {"테이블": [행, ...], ...}
+    'ndjson': 'application/x-ndjson'  # 한 줄에 {"table": 테이블, "row": 행} 하나
+}
+
+# 파일 내보내기(/db/export, scripts/export_data.py) 형식과 MIME 타입 (한 줄에 한 행)
+EXPORT_FILE_MIMETYPES = {
+    'csv': 'text/csv',  # 첫 줄은 열 이름
+    'ndjson': 'application/x-ndjson'  # 한 줄에 행 객체 하나
+}
+
+# 출석 기록 내보내기 쿼리 (수업일, 시작 시간, 학번 순)
+ATTENDANCE_EXPORT_QUERY = """
+    SELECT
+        cs.class_date, ss.start_time, ss.end_time, ss.location,
+        s.subject_id, s.name AS subject_name, s.subject_year, s.subject_semester,
+        cs.session_id, cs.is_cancelled,
+        st.student_id, st.student_number, st.name AS student_name,
+        c.status, c.check_time
+    FROM checkin c
+    JOIN class_session cs ON c.session_id = cs.session_id
+    JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+    JOIN subject s ON ss.subject_id = s.subject_id
+    JOIN student st ON c.student_id = st.student_id
+    {where}
+    ORDER BY cs.class_date, ss.start_time, cs.session_id, st.student_number
+"""
+
+
+def _dumps(value):
+    return json.dumps(value, ensure_ascii=False, separators=(',', ':'))
+
+
+def iter_row_batches(cursor, query, params=(), batch_size=None):
+    """
+    쿼리 결과를 batch_size행씩 변환하여 생성합니다.
+    버퍼링하지 않는 커서와 함께 사용하면 한 번에 batch_size행만 메모리에 올라갑니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (buffered=False 권장, dictionary 커서가 아니어야 함)
+        query: 실행할 SELECT 쿼리
+        params: 쿼리 파라미터
+        batch_size: 한 번에 읽는 행 수 (기본값: DB_EXPORT_BATCH_SIZE)
+
+    Yields:
+        (columns, rows) 튜플 - 열 이름 리스트와 serialize_db_value()로 변환한 값 리스트의 리스트
+    """
+    batch_size = batch_size or DB_EXPORT_CONFIG['batch_size']
+    cursor.execute(query, params)
+    columns = list(cursor.column_names)
+    while True:
+        rows = cursor.fetchmany(batch_size)
+        if not rows:
+            break
+        yield columns, [[serialize_db_value(value) for value in row] for row in rows]
+
+
+def open_export_connection():
+    """
+    내보내기 전용 연결을 풀에서 빌려 읽기 전용 스냅샷 트랜잭션을 시작합니다.
+    요청 범위 연결과 달리 스트리밍이 끝날 때까지 유지되며, 여러 테이블을 같은 시점 기준으로 읽습니다.
+
+    Returns:
+        PooledConnection 객체 (사용 후 close(), 중단 시 discard())
+    """
+    conn = get_db_pool().connection()
+    try:
+        conn.start_transaction(consistent_snapshot=True, readonly=True)
+    except Exception:
+        conn.discard()
+        raise
+    return conn
+
+
+def _stream_with_export_connection(produce):
+    """
+    내보내기 전용 연결과 버퍼링하지 않는 커서로 produce(cursor)가 생성하는 조각을 그대로 생성합니다.
+    중간에 오류가 나거나 클라이언트가 연결을 끊으면 연결을 풀에 돌려놓지 않고 닫습니다.
+    (읽지 않은 결과가 남은 연결을 다른 요청이 물려받지 않도록 함)
+    """
+    conn = open_export_connection()
+    completed = False
+    try:
+        cursor = conn.cursor(buffered=False)
+        yield from produce(cursor)
+        cursor.close()
+        completed = True
+    finally:
+        if completed:
+            conn.close()
+        else:
+            conn.discard()
+
+
+def stream_tables(table_names, export_format='json', batch_size=None):
+    """
+    여러 테이블의 데이터를 JSON 또는 NDJSON 문자열 조각으로 생성하는 제너레이터입니다.
+    요청 컨텍스트를 사용하지 않고 전용 연결을 직접 빌리므로 스트리밍 응답 본문으로 사용할 수 있습니다.
+
+    - json: {"테이블": [{...}, ...], ...} 형태의 하나의 JSON 객체
+    - ndjson: 한 줄에 {"table": 테이블, "row": {...}} 하나
+    - 중간에 오류가 나거나 클라이언트가 연결을 끊으면 연결을 풀에 돌려놓지 않고 닫음
+
+    Args:
+        table_names: 내보낼 테이블 이름 리스트 (호출 전에 실제 테이블 목록으로 검증해야 함)
+        export_format: 'json' 또는 'ndjson'
+        batch_size: 한 번에 읽는 행 수 (기본값: DB_EXPORT_BATCH_SIZE)
+
+    Yields:
+        str: 응답 본문 조각 (fetchmany 묶음마다 하나)
+    """
+    def produce(cursor):
+        if export_format == 'json':
+            yield '{'
+        for index, table_name in enumerate(table_names):
+            if export_format == 'json':
+                yield f"{',' if index else ''}{_dumps(table_name)}:["
+            first = True
+            for columns, rows in iter_row_batches(cursor, f"SELECT * FROM `{table_name}`", batch_size=batch_size):
+                if export_format == 'json':
+                    chunk = ','.join(_dumps(dict(zip(columns, row))) for row in rows)
+                    yield chunk if first else ',' + chunk
+                else:
+                    yield ''.join(
+                        _dumps({'table': table_name, 'row': dict(zip(columns, row))}) + '\n' for row in rows
+                    )
+                first = False
+            if export_format == 'json':
+                yield ']'
+        if export_format == 'json':
+            yield '}\n'
+
+    return _stream_with_export_connection(produce)
+
+
+def build_attendance_export_query(subject_id=None, year=None, semester=None, date_from=None, date_to=None):
+    """
+    조건에 맞는 출석 기록 내보내기 쿼리와 파라미터를 만듭니다.
+
+    Args:
+        subject_id: 과목 ID (None이면 전체 과목)
+        year: 개설 연도 (subject.subject_year)
+        semester: 개설 학기 (subject.subject_semester)
+        date_from: 시작 수업일 (포함)
+        date_to: 종료 수업일 (포함)
+
+    Returns:
+        (query, params) 튜플
+    """
+    conditions = []
+    params = []
+    for condition, value in (
+        ("s.subject_id = %s", subject_id),
+        ("s.subject_year = %s", year),
+        ("s.subject_semester = %s", semester),
+        ("cs.class_date >= %s", date_from),
+        ("cs.class_date <= %s", date_to)
+    ):
+        if value is not None:
+            conditions.append(condition)
+            params.append(value)
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+    return ATTENDANCE_EXPORT_QUERY.format(where=where), tuple(params)
+
+
+def _csv_line(writer, buffer, values):
+    """값 리스트를 CSV 한 줄 문자열로 변환합니다. (None은 빈 칸)"""
+    buffer.seek(0)
+    buffer.truncate()
+    writer.writerow(['' if value is None else value for value in values])
+    return buffer.getvalue()
+
+
+def stream_query_rows(query, params=(), export_format='csv', batch_size=None):
+    """
+    쿼리 결과를 CSV 또는 NDJSON 문자열 조각으로 생성하는 제너레이터입니다.
+    stream_tables()와 같이 전용 연결과 버퍼링하지 않는 커서로 batch_size행씩 읽습니다.
+
+    - csv: 첫 줄은 열 이름 (결과가 없어도 출력)
+    - ndjson: 한 줄에 {열 이름: 값} 객체 하나
+
+    Args:
+        query: 실행할 SELECT 쿼리 (테이블 이름을 넣는 경우 호출 전에 검증해야 함)
+        params: 쿼리 파라미터
+        export_format: 'csv' 또는 'ndjson'
+        batch_size: 한 번에 읽는 행 수 (기본값: DB_EXPORT_BATCH_SIZE)
+
+    Yields:
+        str: 본문 조각 (fetchmany 묶음마다 하나)
+    """
+    def produce(cursor):
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        header_written = False
+        for columns, rows in iter_row_batches(cursor, query, params, batch_size):
+            if export_format == 'csv':
+                lines = [_csv_line(writer, buffer, row) for row in rows]
+                if not header_written:
+                    lines.insert(0, _csv_line(writer, buffer, columns))
+                    header_written = True
+                yield ''.join(lines)
+            else:
+                yield ''.join(_dumps(dict(zip(columns, row))) + '\n' for row in rows)
+        if export_format == 'csv' and not header_written:
+            yield _csv_line(writer, buffer, cursor.column_names)
+
+    return _stream_with_export_connection(produce)
+
+
+def gzip_chunks(chunks, level=None):
+    """
+    문자열 조각을 UTF-8로 인코딩하여 gzip 형식으로 압축한 바이트 조각을 생성합니다.
+    압축기 상태만 유지하므로 전체 데이터를 메모리에 올리지 않습니다.
+
+    Args:
+        chunks: 문자열 조각 이터레이터 (stream_query_rows() 등)
+        level: 압축 레벨 1~9 (기본값: DB_EXPORT_GZIP_LEVEL)
+
+    Yields:
+        bytes: gzip 데이터 조각
+    """
+    compressor = zlib.compressobj(level or DB_EXPORT_CONFIG['gzip_level'], zlib.DEFLATED, 31)  # 31: gzip 헤더
+    try:
+        for chunk in chunks:
+            data = compressor.compress(chunk.encode('utf-8'))
+            if data:
+                yield data
+        yield compressor.flush()
+    finally:
+        # 중간에 중단되면 원본 제너레이터를 바로 닫아 DB 연결을 정리
+        if hasattr(chunks, 'close'):
+            chunks.close()
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# stream_tables(table_names, export_format='json', batch_size=None)
+#   - 필요성: 모든 테이블을 fetchall()로 읽어 하나의 JSON으로 만들던 방식은 데이터가 늘면 작업 프로세스 메모리가
+#            테이블 크기만큼 늘어남. 버퍼링하지 않는 커서로 batch_size행씩 읽어 바로 전송하므로 메모리가 일정함.
+#   - 사용처: app/routes/database_routes.py의 show_database()에서 사용됨.
+#
+# stream_query_rows(query, params=(), export_format='csv', batch_size=None) / gzip_chunks(chunks, level=None)
+#   - 필요성: 테이블 전체나 조건에 맞는 출석 기록을 분석용 CSV/NDJSON 파일로 내보냄. gzip도 조각 단위로 압축하므로
+#            행 수와 관계없이 메모리 사용량이 일정함.
+#   - 사용처: app/routes/database_routes.py의 export_data(), scripts/export_data.py에서 사용됨.
+#
+# build_attendance_export_query(subject_id=None, year=None, semester=None, date_from=None, date_to=None)
+#   - 필요성: 과목/연도/학기/수업일 범위 조건으로 출석 기록(수업, 학생, 출석 상태)을 조회하는 쿼리를 만듦.
+#   - 사용처: app/routes/database_routes.py의 export_data(), scripts/export_data.py에서 사용됨.
+#
+# iter_row_batches(cursor, query, params=(), batch_size=None)
+#   - 필요성: 큰 조회 결과를 묶음 단위로 변환하여 생성함. (값 변환은 db_helpers.serialize_db_value 사용)
+#   - 사용처: stream_tables(), stream_query_rows()에서 사용됨.
+#
@@ -1,9 +1,14 @@
 """
 데이터베이스 관련 유틸리티 함수들
 """
-from mysql.connector import connect
-from config import DB_CONFIG
-from datetime import timedelta, time
+from flask import current_app, g, has_app_context, request
+from config import DB_CONFIG, DB_POOL_CONFIG
+from app.utils.db_pool import ConnectionPool
+from app.utils.constants import WEEKDAY_TO_STR
+from datetime import timedelta, time, date, datetime
+from decimal import Decimal
+import os
+import threading
 
 
 # DB 연결 설정 상수 (UTF-8 인코딩 설정 포함)
@@ -14,15 +19,108 @@ DB_CONNECTION_CONFIG = {
 }
 
 
+_pool = None
+_pool_lock = threading.Lock()
+
+
+def get_db_pool():
+    """
+    현재 프로세스의 커넥션 풀을 반환합니다.
+    처음 호출될 때 생성하며, fork된 자식 프로세스에서는 새 풀을 만듭니다.
+    
+    Returns:
+        ConnectionPool 객체
+    """
+    global _pool
+    if _pool is None or _pool.pid != os.getpid():
+        with _pool_lock:
+            if _pool is None or _pool.pid != os.getpid():
+                _pool = ConnectionPool(DB_CONNECTION_CONFIG, **DB_POOL_CONFIG)
+    return _pool
+
+
 def get_db_connection():
     """
     데이터베이스 연결을 반환합니다.
-    UTF-8 인코딩 설정이 포함된 연결을 생성합니다.
+    UTF-8 인코딩 설정이 포함된 연결을 커넥션 풀에서 빌려옵니다.
+    
+    Flask 요청(앱 컨텍스트) 안에서는 요청당 하나의 연결을 flask.g에 보관하여 재사용하고,
+    요청이 끝나면 close_db_connection()이 풀에 반납합니다.
+    스크립트 등 앱 컨텍스트 밖에서는 with 블록이 끝날 때 바로 반납됩니다.
+    
+    Returns:
+        데이터베이스 연결 객체 (PooledConnection)
+    """
+    if has_app_context():
+        conn = g.get('_db_connection')
+        if conn is None:
+            conn = get_db_pool().connection(request_scoped=True)
+            g._db_connection = conn
+        return conn
+    return get_db_pool().connection()
+
+
+def close_db_connection(exception=None):
+    """
+    요청에서 빌린 연결을 풀에 반납합니다.
+    app.teardown_appcontext에 등록되어 요청 종료 시 호출됩니다.
+    
+    Args:
+        exception: 요청 처리 중 발생한 예외 (teardown 콜백 규약)
+    """
+    conn = g.pop('_db_connection', None)
+    if conn is not None:
+        conn.release()
+
+
+def get_db_pool_stats():
+    """
+    현재 프로세스의 커넥션 풀 통계를 반환합니다.
+    
+    Returns:
+        dict: 풀 통계 (열린 연결 수, 대여 중인 연결 수, 누적 카운터 등)
+    """
+    return get_db_pool().stats()
+
+
+def get_request_query_count():
+    """
+    현재 요청에서 실행한 DB 쿼리 수를 반환합니다.
     
     Returns:
-        데이터베이스 연결 객체
+        int: 쿼리 수 (요청에서 DB 연결을 사용하지 않았으면 0)
     """
-    return connect(**DB_CONNECTION_CONFIG)
+    conn = g.get('_db_connection')
+    return conn.query_count if conn is not None else 0
+
+
+def _report_query_count(response):
+    """
+    디버그 모드에서 요청별 쿼리 수를 응답 헤더(X-DB-Query-Count)와 로그로 보고합니다.
+    
+    Args:
+        response: Flask 응답 객체
+        
+    Returns:
+        응답 객체
+    """
+    if not current_app.debug:
+        return response
+    query_count = get_request_query_count()
+    response.headers['X-DB-Query-Count'] = str(query_count)
+    print(f"[DB] {request.method} {request.path} ({request.endpoint}): 쿼리 {query_count}회")
+    return response
+
+
+def init_db(app):
+    """
+    Flask 앱에 요청 단위 연결 반납 콜백과 (디버그 모드용) 요청별 쿼리 수 보고 콜백을 등록합니다.
+    
+    Args:
+        app: Flask 애플리케이션 객체
+    """
+    app.teardown_appcontext(close_db_connection)
+    app.after_request(_report_query_count)
 
 
 def to_time(value):
@@ -94,54 +192,63 @@ def format_timedelta_to_str(timedelta_value):
     return str(timedelta_value)
 
 
-def get_student_id_by_number(cursor, student_number):
+def serialize_db_value(value):
     """
-    학번으로 학생 ID를 조회합니다.
+    DB에서 읽은 값을 JSON/CSV로 내보낼 수 있는 값으로 변환합니다.
     
     Args:
-        cursor: 데이터베이스 커서
-        student_number: 학번
+        value: DB 컬럼 값
         
     Returns:
-        student_id (int) 또는 None (학생이 없는 경우)
+        날짜/시간은 ISO 형식 문자열, timedelta(TIME 컬럼)는 "HH:MM:SS" 문자열,
+        Decimal은 문자열, 그 외에는 원래 값
     """
-    cursor.execute("SELECT student_id FROM student WHERE student_number = %s", (student_number,))
-    result = cursor.fetchone()
-    # 결과가 있으면 student_id 반환, 없으면 None 반환
-    return result['student_id'] if result else None
+    # 날짜/시간 객체인 경우 ISO 형식으로 변환
+    if isinstance(value, (date, datetime, time)):
+        return value.isoformat()
+    # timedelta 객체인 경우 HH:MM:SS 형식으로 변환
+    if isinstance(value, timedelta):
+        return format_timedelta_to_str(value)
+    # 정밀도를 잃지 않도록 문자열로 변환
+    if isinstance(value, Decimal):
+        return str(value)
+    if isinstance(value, (bytes, bytearray)):
+        return value.decode('utf-8', errors='replace')
+    return value
 
 
-def get_or_create_session(cursor, conn, schedule_id, class_date):
+def get_table_names(cursor):
     """
-    특정 날짜의 수업 세션을 조회하거나 없으면 생성합니다.
+    현재 데이터베이스의 테이블 목록을 조회합니다.
     
     Args:
-        cursor: 데이터베이스 커서
-        conn: 데이터베이스 연결
-        schedule_id: 스케줄 ID
-        class_date: 수업 날짜 (date 객체)
+        cursor: 데이터베이스 커서 (dictionary 여부 무관)
         
     Returns:
-        session_id: 수업 세션 ID
+        list: 테이블 이름 리스트
     """
-    # 기존 세션 조회
-    cursor.execute(
-        "SELECT session_id FROM class_session WHERE schedule_id = %s AND class_date = %s",
-        (schedule_id, class_date)
-    )
-    session_result = cursor.fetchone()
+    cursor.execute("SHOW TABLES")
+    return [
+        next(iter(row.values())) if isinstance(row, dict) else row[0]
+        for row in cursor.fetchall()
+    ]
+
 
-    # 세션이 존재하면 기존 ID 반환
-    if session_result:
-        return session_result['session_id']
-    # 세션이 없으면 새로 생성
-    else:
-        cursor.execute(
-            "INSERT INTO class_session (schedule_id, class_date) VALUES (%s, %s)",
-            (schedule_id, class_date)
-        )
-        conn.commit()
-        return cursor.lastrowid
+def get_student_id_by_number(cursor, student_number):
+    """
+    학번으로 학생 ID를 조회합니다.
+    
+    Args:
+        cursor: 데이터베이스 커서
+        student_number: 학번
+        
+    Returns:
+        student_id (int) 또는 None (학생이 없는 경우)
+    """
+    cursor.execute("SELECT student_id FROM student WHERE student_number = %s", (student_number,))
+    result = cursor.fetchone()
+    # 결과가 있으면 student_id 반환, 없으면 None 반환
+    return result['student_id'] if result else None
 
 
 def get_subject_info(cursor, subject_id):
@@ -155,6 +262,11 @@ def get_subject_info(cursor, subject_id):
     Returns:
         dict: 과목 정보 딕셔너리 또는 None
     """
+    # 기준 정보 캐시가 켜져 있으면 메모리에서 조회 (reference_cache가 이 모듈을 import하므로 함수 안에서 import)
+    from app.utils.reference_cache import get_reference_cache
+    cache = get_reference_cache()
+    if cache is not None:
+        return cache.get_subject(subject_id, cursor)
     cursor.execute("SELECT name, subject_year, subject_semester FROM subject WHERE subject_id = %s", (subject_id,))
     return cursor.fetchone()
 
@@ -170,6 +282,11 @@ def get_subject_name(cursor, subject_id):
     Returns:
         str: 과목 이름 또는 None
     """
+    from app.utils.reference_cache import get_reference_cache
+    cache = get_reference_cache()
+    if cache is not None:
+        result = cache.get_subject(subject_id, cursor)
+        return result['name'] if result else None
     cursor.execute("SELECT name FROM subject WHERE subject_id = %s", (subject_id,))
     result = cursor.fetchone()
     return result['name'] if result else None
@@ -196,15 +313,84 @@ def get_student_enrolled_subjects(cursor, student_id):
     return cursor.fetchall()
 
 
+def get_student_today_classes(cursor, student_id, class_date):
+    """
+    학생이 특정 날짜에 수강하는 수업 목록을 수업 세션과 출석 상태와 함께 조회합니다.
+    스케줄, 수업 세션, 출석 기록을 하나의 조인 쿼리로 가져옵니다.
+    
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        student_id: 학생 ID
+        class_date: 수업 날짜 (date 객체)
+        
+    Returns:
+        list: 수업 리스트 (시작 시간 순)
+            - session_id: 해당 날짜의 수업 세션 ID (세션이 아직 없으면 None)
+            - is_cancelled: 휴강 여부 (세션이 없으면 None)
+            - checkin_status: 출석 상태 코드 (출석 기록이 없으면 None)
+    """
+    cursor.execute("""
+        SELECT ss.schedule_id, s.name AS subject_name, p.name AS professor_name,
+               ss.location, ss.start_time, ss.end_time, s.subject_id,
+               cs.session_id, cs.is_cancelled, c.status AS checkin_status
+        FROM enrollment e
+        JOIN subject s ON e.subject_id = s.subject_id
+        JOIN subject_schedule ss ON ss.subject_id = s.subject_id
+        LEFT JOIN professor p ON s.professor_id = p.professor_id
+        LEFT JOIN class_session cs
+               ON cs.schedule_id = ss.schedule_id AND cs.class_date = %s
+        LEFT JOIN checkin c
+               ON c.session_id = cs.session_id AND c.student_id = e.student_id
+        WHERE e.student_id = %s
+          AND UPPER(ss.day_of_week) = %s
+        ORDER BY ss.start_time
+    """, (class_date, student_id, WEEKDAY_TO_STR[class_date.weekday()]))
+    return cursor.fetchall()
+
+
+def get_student_subject_checkins(cursor, student_id, subject_id):
+    """
+    학생의 특정 과목 출석 기록을 모두 조회합니다.
+    
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        student_id: 학생 ID
+        subject_id: 과목 ID
+        
+    Returns:
+        {session_id: status} 딕셔너리
+    """
+    cursor.execute("""
+        SELECT c.session_id, c.status
+        FROM checkin c
+        JOIN class_session cs ON c.session_id = cs.session_id
+        JOIN subject_schedule ss ON cs.schedule_id = ss.schedule_id
+        WHERE c.student_id = %s AND ss.subject_id = %s
+    """, (student_id, subject_id))
+    return {row['session_id']: row['status'] for row in cursor.fetchall()}
+
+
 # ============================================================================
 # 헬퍼 함수 사용 설명
 # ============================================================================
 #
 # get_db_connection()
-#   - 필요성: UTF-8 인코딩 설정이 포함된 DB 연결을 일관되게 생성함. 
-#            DB 연결 설정 중앙화로 코드 재사용성 향상 및 인코딩 문제 방지.
-#   - 사용처: app/routes/attendance_routes.py의 show_attendance(), check_attendance(), 
-#            manage_attendance(), attendance_detail()에서 DB 연결 시 사용됨.
+#   - 필요성: UTF-8 인코딩 설정이 포함된 DB 연결을 커넥션 풀에서 일관되게 빌려옴. 
+#            요청마다 TCP 연결/인증을 반복하지 않고, 요청당 하나의 연결만 사용함.
+#   - 사용처: app/routes/*의 모든 라우트, app/utils/auth.py, app/utils/auto_absent.py 등
+#            DB 연결이 필요한 모든 곳에서 사용됨.
+#
+# close_db_connection(exception) / init_db(app)
+#   - 필요성: 요청 단위로 빌린 연결을 요청 종료 시 반드시 풀에 반납함.
+#   - 사용처: main.py에서 init_db(app)으로 teardown 콜백을 등록함.
+#
+# get_request_query_count()
+#   - 필요성: 요청마다 실행된 쿼리 수를 확인하여 N+1 쿼리 회귀를 발견함.
+#   - 사용처: 디버그 모드에서 응답 헤더 X-DB-Query-Count와 로그로 보고됨.
+#
+# get_db_pool_stats()
+#   - 필요성: 풀 크기, 대여 중인 연결 수, 대기/타임아웃 횟수 등 모니터링 지표 제공.
+#   - 사용처: app/routes/database_routes.py의 /db/pool_stats에서 사용됨.
 #
 # to_time(value)
 #   - 필요성: DB에서 가져온 시간 값(timedelta, str, time 등)을 일관된 time 객체로 변환함.
@@ -218,16 +404,20 @@ def get_student_enrolled_subjects(cursor, student_id):
 #
 # get_student_id_by_number(cursor, student_number)
 #   - 필요성: 학번으로 학생 ID 조회 로직을 재사용 가능한 함수로 분리함. 코드 중복 방지.
-#   - 사용처: app/routes/attendance_routes.py, app/routes/main_routes.py에서 
-#            학번으로 학생 ID를 조회할 때 사용됨.
+#   - 사용처: 라우트는 로그인 시 세션에 저장된 학생 ID(session_helpers.get_current_user)를 사용하므로,
+#            세션 정보가 없는 곳(스크립트 등)에서 학번으로 학생 ID를 조회할 때 사용함.
 #
 # format_timedelta_to_str(timedelta_value)
 #   - 필요성: timedelta 객체를 "HH:MM:SS" 형식 문자열로 변환함. 중복된 변환 로직 제거.
-#   - 사용처: app/routes/database_routes.py에서 timedelta 값을 문자열로 변환할 때 사용됨.
+#   - 사용처: serialize_db_value()에서 TIME 컬럼 값을 문자열로 변환할 때 사용됨.
+#
+# serialize_db_value(value)
+#   - 필요성: DB 데이터를 JSON/CSV로 내보낼 때의 타입 변환(날짜/시간, TIME, Decimal)을 한 곳에서 처리함.
+#   - 사용처: app/utils/db_export.py, app/utils/db_browser.py에서 사용됨.
 #
-# get_or_create_session(cursor, conn, schedule_id, class_date)
-#   - 필요성: 특정 날짜의 수업 세션을 조회하거나 없으면 생성함. 코드 중복 방지.
-#   - 사용처: app/routes/attendance_routes.py에서 수업 세션 조회/생성 시 사용됨.
+# get_table_names(cursor)
+#   - 필요성: 데이터베이스 이름에 따라 달라지는 SHOW TABLES 결과 컬럼명(Tables_in_<DB>)에 의존하지 않음.
+#   - 사용처: app/routes/database_routes.py에서 사용됨.
 #
 # get_subject_info(cursor, subject_id)
 #   - 필요성: 과목 정보(이름, 연도, 학기)를 조회함. 코드 중복 방지.
@@ -240,4 +430,15 @@ def get_student_enrolled_subjects(cursor, student_id):
 # get_student_enrolled_subjects(cursor, student_id)
 #   - 필요성: 학생이 수강하는 모든 과목을 조회함. 코드 중복 방지.
 #   - 사용처: 학생 수강 과목 목록이 필요한 곳에서 사용됨.
-#
\ No newline at end of file
+#
+# get_student_today_classes(cursor, student_id, class_date)
+#   - 필요성: 오늘의 수업, 세션 ID, 출석 상태를 한 번의 조인 쿼리로 조회함.
+#            수업마다 세션/출석 상태를 따로 조회하던 N+1 쿼리를 제거함.
+#   - 사용처: app/utils/timetable_cache.py의 load_today_classes()에서 시간표 캐시가 꺼진 경우 사용됨.
+#
+#
+# get_student_subject_checkins(cursor, student_id, subject_id)
+#   - 필요성: 주차별 출석 상세에서 세션마다 실행하던 출석 조회를 한 번의 쿼리로 대체함.
+#            결과를 session_id 키의 딕셔너리로 반환하여 세션 맵과 메모리에서 결합함.
+#   - 사용처: app/routes/attendance_routes.py의 attendance_detail()에서 사용됨.
+#
@@ -0,0 +1,294 @@
+"""
+데이터베이스 커넥션 풀
+요청마다 새로 connect()하지 않고 미리 열어둔 연결을 빌려 쓰고 반납합니다.
+"""
+import os
+import threading
+from collections import deque
+from time import monotonic
+from mysql.connector import connect
+from mysql.connector.errors import PoolError
+
+
+class PoolTimeoutError(PoolError):
+    """풀의 모든 연결이 사용 중이고 대기 시간 안에 반납되지 않은 경우 발생합니다."""
+
+
+class ConnectionPool:
+    """
+    크기, 초과 허용(overflow), 재활용 주기(recycle), 사전 핑(pre-ping)을 지원하는 커넥션 풀입니다.
+
+    - pool_size: 유휴 상태로 유지하는 최대 연결 수
+    - max_overflow: pool_size를 넘어 임시로 열 수 있는 연결 수 (반납 시 바로 닫힘)
+    - recycle_seconds: 생성 후 이 시간이 지난 연결은 대여 시점에 새 연결로 교체
+    - pre_ping: 대여 전에 ping으로 연결 상태를 확인하고 끊긴 연결은 교체
+    - timeout_seconds: 풀이 가득 찼을 때 반납을 기다리는 최대 시간
+    """
+
+    def __init__(self, connect_kwargs, pool_size=10, max_overflow=10,
+                 recycle_seconds=1800, pre_ping=True, timeout_seconds=10):
+        self._connect_kwargs = connect_kwargs
+        self.pool_size = pool_size
+        self.max_overflow = max_overflow
+        self.recycle_seconds = recycle_seconds
+        self.pre_ping = pre_ping
+        self.timeout_seconds = timeout_seconds
+        # fork 이후 부모 프로세스의 소켓을 재사용하지 않도록 생성 프로세스를 기록
+        self.pid = os.getpid()
+
+        self._cond = threading.Condition()
+        self._idle = deque()  # (raw_connection, created_at) - 마지막에 반납된 연결부터 재사용
+        self._open_count = 0
+        self._checked_out = 0
+        self._counters = {
+            'acquired': 0,
+            'created': 0,
+            'recycled': 0,
+            'ping_failures': 0,
+            'waits': 0,
+            'timeouts': 0,
+        }
+
+    def connection(self, request_scoped=False):
+        """
+        풀에서 연결을 빌려 PooledConnection으로 감싸 반환합니다.
+
+        Args:
+            request_scoped: True이면 with 블록이 끝나도 반납하지 않고 요청 종료 시 반납
+
+        Returns:
+            PooledConnection 객체
+        """
+        raw, created_at = self._acquire()
+        return PooledConnection(self, raw, created_at, request_scoped=request_scoped)
+
+    def _acquire(self):
+        deadline = monotonic() + self.timeout_seconds
+        with self._cond:
+            while True:
+                # 유휴 연결이 있으면 재사용
+                if self._idle:
+                    raw, created_at = self._idle.pop()
+                    break
+                # 최대 연결 수에 도달하지 않았으면 새로 생성
+                if self._open_count < self.pool_size + self.max_overflow:
+                    self._open_count += 1
+                    raw, created_at = None, None
+                    break
+                # 모두 사용 중이면 반납될 때까지 대기
+                remaining = deadline - monotonic()
+                if remaining <= 0:
+                    self._counters['timeouts'] += 1
+                    raise PoolTimeoutError(
+                        f"커넥션 풀 대기 시간 초과 ({self.timeout_seconds}초, 사용 중 {self._checked_out}개)"
+                    )
+                self._counters['waits'] += 1
+                self._cond.wait(remaining)
+            self._checked_out += 1
+            self._counters['acquired'] += 1
+
+        # 네트워크 작업(연결 생성, ping)은 잠금 밖에서 수행
+        try:
+            if raw is None:
+                return self._create()
+            return self._validate(raw, created_at)
+        except Exception:
+            with self._cond:
+                self._open_count -= 1
+                self._checked_out -= 1
+                self._cond.notify()
+            raise
+
+    def _create(self):
+        raw = connect(**self._connect_kwargs)
+        with self._cond:
+            self._counters['created'] += 1
+        return raw, monotonic()
+
+    def _validate(self, raw, created_at):
+        # 재활용 주기가 지난 연결은 교체 (MySQL wait_timeout 등으로 끊기기 전에 교체)
+        if self.recycle_seconds and monotonic() - created_at > self.recycle_seconds:
+            _close_quietly(raw)
+            with self._cond:
+                self._counters['recycled'] += 1
+            return self._create()
+        # 사전 핑: 끊긴 연결이면 교체
+        if self.pre_ping:
+            try:
+                raw.ping(reconnect=False)
+            except Exception:
+                _close_quietly(raw)
+                with self._cond:
+                    self._counters['ping_failures'] += 1
+                return self._create()
+        return raw, created_at
+
+    def release(self, raw, created_at):
+        """
+        빌린 연결을 풀에 반납합니다.
+        커밋되지 않은 트랜잭션은 롤백하고, 초과 연결이나 문제가 있는 연결은 닫습니다.
+
+        Args:
+            raw: mysql.connector 연결 객체
+            created_at: 연결 생성 시각 (monotonic)
+        """
+        healthy = True
+        try:
+            # 다음 요청이 이전 트랜잭션의 스냅샷/잠금을 물려받지 않도록 정리
+            if raw.in_transaction:
+                raw.rollback()
+        except Exception:
+            healthy = False
+
+        with self._cond:
+            self._checked_out -= 1
+            if healthy and len(self._idle) < self.pool_size:
+                self._idle.append((raw, created_at))
+                raw = None
+            else:
+                self._open_count -= 1
+            self._cond.notify()
+
+        if raw is not None:
+            _close_quietly(raw)
+
+    def discard(self, raw):
+        """
+        빌린 연결을 풀에 돌려놓지 않고 닫습니다.
+        읽지 않은 결과가 남은 연결(중단된 스트리밍 조회 등)처럼 재사용할 수 없는 연결에 사용합니다.
+
+        Args:
+            raw: mysql.connector 연결 객체
+        """
+        with self._cond:
+            self._checked_out -= 1
+            self._open_count -= 1
+            self._cond.notify()
+        _close_quietly(raw)
+
+    def dispose(self):
+        """유휴 연결을 모두 닫습니다. 대여 중인 연결은 반납 시 정상 처리됩니다."""
+        with self._cond:
+            idle = list(self._idle)
+            self._idle.clear()
+            self._open_count -= len(idle)
+        for raw, _ in idle:
+            _close_quietly(raw)
+
+    def stats(self):
+        """
+        모니터링용 풀 통계를 반환합니다.
+
+        Returns:
+            dict: 설정값, 현재 연결 수, 누적 카운터
+        """
+        with self._cond:
+            return {
+                'pid': self.pid,
+                'pool_size': self.pool_size,
+                'max_overflow': self.max_overflow,
+                'recycle_seconds': self.recycle_seconds,
+                'pre_ping': self.pre_ping,
+                'open': self._open_count,
+                'idle': len(self._idle),
+                'checked_out': self._checked_out,
+                'overflow': max(0, self._open_count - self.pool_size),
+                **self._counters,
+            }
+
+
+class PooledConnection:
+    """
+    풀에서 빌린 연결의 프록시입니다.
+    mysql.connector 연결과 같은 방식(cursor, commit, with 문)으로 사용할 수 있고,
+    close() 또는 with 블록 종료 시 연결을 닫지 않고 풀에 반납합니다.
+    request_scoped 연결은 with 블록이 끝나도 반납하지 않고 요청 종료(teardown) 시 반납합니다.
+    """
+
+    def __init__(self, pool, raw, created_at, request_scoped=False):
+        self._pool = pool
+        self._raw = raw
+        self._created_at = created_at
+        self._request_scoped = request_scoped
+        # 이 연결로 실행한 쿼리 수 (디버그 모드에서 요청별 쿼리 수 보고에 사용)
+        self.query_count = 0
+
+    def __getattr__(self, name):
+        return getattr(self._raw, name)
+
+    def cursor(self, *args, **kwargs):
+        """실행한 쿼리 수를 세는 커서를 반환합니다."""
+        return CountingCursor(self, self._raw.cursor(*args, **kwargs))
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def close(self):
+        """
+        연결 사용을 마칩니다.
+        요청 범위 연결은 커밋되지 않은 작업만 롤백하고 연결을 유지합니다.
+        (기존 connect()의 close와 동일하게 커밋되지 않은 작업은 버려집니다.)
+        """
+        if self._raw is None:
+            return
+        if self._request_scoped:
+            try:
+                if self._raw.in_transaction:
+                    self._raw.rollback()
+            except Exception:
+                pass
+            return
+        self.release()
+
+    def release(self):
+        """연결을 풀에 반납합니다. 여러 번 호출해도 안전합니다."""
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.release(raw, self._created_at)
+
+    def discard(self):
+        """연결을 풀에 반납하지 않고 닫습니다. 여러 번 호출해도 안전합니다."""
+        raw, self._raw = self._raw, None
+        if raw is not None:
+            self._pool.discard(raw)
+
+
+class CountingCursor:
+    """
+    mysql.connector 커서의 프록시입니다.
+    execute/executemany 호출 횟수를 연결의 query_count에 더합니다.
+    """
+
+    def __init__(self, connection, cursor):
+        self._connection = connection
+        self._cursor = cursor
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+    def __iter__(self):
+        return iter(self._cursor)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self._cursor.close()
+
+    def execute(self, *args, **kwargs):
+        self._connection.query_count += 1
+        return self._cursor.execute(*args, **kwargs)
+
+    def executemany(self, *args, **kwargs):
+        self._connection.query_count += 1
+        return self._cursor.executemany(*args, **kwargs)
+
+
+def _close_quietly(raw):
+    try:
+        raw.close()
+    except Exception:
+        pass
@@ -0,0 +1,270 @@
+"""
+기준 정보 캐시
+학기 중 거의 바뀌지 않는 과목(subject), 교수(professor), 스케줄(subject_schedule)을 프로세스 메모리에 보관합니다.
+cache_version 테이블의 버전으로 여러 프로세스/서버의 캐시를 함께 무효화합니다.
+"""
+import os
+import threading
+from time import monotonic
+from config import REFERENCE_CACHE_CONFIG
+from app.utils.db_helpers import get_db_connection
+
+# cache_version 테이블에서 기준 정보 캐시가 사용하는 이름
+REFERENCE_CACHE_NAME = 'reference'
+# 수강 정보(enrollment) 변경 시 올라가는 버전 이름 (사용자별 시간표 캐시에서 사용)
+ENROLLMENT_CACHE_NAME = 'enrollment'
+
+
+def _fetch_dicts(cursor):
+    """커서 종류(dictionary 여부)와 무관하게 조회 결과를 딕셔너리 리스트로 반환합니다."""
+    rows = cursor.fetchall()
+    if rows and not isinstance(rows[0], dict):
+        columns = cursor.column_names
+        rows = [dict(zip(columns, row)) for row in rows]
+    return rows
+
+
+def read_cache_versions(cursor):
+    """
+    모든 캐시 범위의 버전을 조회합니다. (캐시 범위마다 한 행이므로 몇 행뿐임)
+
+    Args:
+        cursor: 데이터베이스 커서
+
+    Returns:
+        dict: cache_version.name -> version
+    """
+    cursor.execute("SELECT name, version FROM cache_version")
+    return {row['name']: row['version'] for row in _fetch_dicts(cursor)}
+
+
+def bump_cache_version(cursor, name=REFERENCE_CACHE_NAME):
+    """
+    캐시 버전을 올려 모든 프로세스의 캐시를 무효화합니다.
+    기준 정보를 바꾸는 작업과 같은 트랜잭션에서 호출하고 함께 커밋합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+        name: cache_version.name
+    """
+    cursor.execute(
+        "INSERT INTO cache_version (name, version) VALUES (%s, 1) ON DUPLICATE KEY UPDATE version = version + 1",
+        (name,)
+    )
+
+
+class ReferenceCache:
+    """
+    과목/교수/스케줄 기준 정보 캐시입니다.
+
+    - 처음 조회할 때와 ttl_seconds가 지났을 때 세 테이블을 모두 다시 읽음
+    - 그 사이에는 version_check_seconds마다 cache_version만 확인하여, reference 버전이 바뀌었으면 다시 읽음
+      (관리 도구 등 다른 프로세스의 변경이 version_check_seconds 안에 반영됨)
+    - 확인한 다른 캐시 범위의 버전(enrollment 등)도 함께 보관하여 get_versions()로 제공
+    - 조회 결과는 복사본을 반환하므로 호출한 쪽에서 수정해도 캐시에 영향이 없음
+    """
+
+    def __init__(self, ttl_seconds=600, version_check_seconds=5):
+        self.ttl_seconds = ttl_seconds
+        self.version_check_seconds = version_check_seconds
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self.version = None
+        self.versions = {}
+        self._loaded_at = None
+        self._checked_at = None
+        self._subjects = {}
+        self._professors = {}
+        self._schedules = {}
+        self._schedules_by_subject = {}
+        self.stats = {'loads': 0, 'version_checks': 0}
+
+    def _load(self, cursor):
+        # 버전을 먼저 읽어, 읽는 도중 바뀐 내용은 다음 확인 때 다시 읽도록 함
+        versions = read_cache_versions(cursor)
+        cursor.execute("""
+            SELECT s.subject_id, s.name, s.subject_year, s.subject_semester, s.professor_id,
+                   p.name AS professor_name
+            FROM subject s
+            LEFT JOIN professor p ON s.professor_id = p.professor_id
+        """)
+        subjects = {row['subject_id']: row for row in _fetch_dicts(cursor)}
+        cursor.execute("SELECT professor_id, name, major, email, office_location FROM professor")
+        professors = {row['professor_id']: row for row in _fetch_dicts(cursor)}
+        cursor.execute("SELECT * FROM subject_schedule ORDER BY subject_id, day_of_week, start_time")
+        schedules = {}
+        schedules_by_subject = {}
+        for row in _fetch_dicts(cursor):
+            schedules[row['schedule_id']] = row
+            schedules_by_subject.setdefault(row['subject_id'], []).append(row)
+
+        self._subjects = subjects
+        self._professors = professors
+        self._schedules = schedules
+        self._schedules_by_subject = schedules_by_subject
+        self.versions = versions
+        self.version = versions.get(REFERENCE_CACHE_NAME, 0)
+        self._loaded_at = self._checked_at = monotonic()
+        self.stats['loads'] += 1
+
+    def _refresh(self, cursor):
+        now = monotonic()
+        if self._loaded_at is None or now - self._loaded_at >= self.ttl_seconds:
+            self._load(cursor)
+        elif now - self._checked_at >= self.version_check_seconds:
+            self.stats['version_checks'] += 1
+            versions = read_cache_versions(cursor)
+            if versions.get(REFERENCE_CACHE_NAME, 0) != self.version:
+                self._load(cursor)
+            else:
+                self.versions = versions
+                self._checked_at = now
+
+    def ensure_fresh(self, cursor=None):
+        """
+        캐시가 오래되었거나 버전이 바뀌었으면 다시 읽습니다.
+
+        Args:
+            cursor: 데이터베이스 커서 (없으면 요청의 DB 연결로 새 커서를 만듦)
+        """
+        now = monotonic()
+        if (self._loaded_at is not None and now - self._loaded_at < self.ttl_seconds
+                and now - self._checked_at < self.version_check_seconds):
+            return
+        with self._lock:
+            if cursor is not None:
+                self._refresh(cursor)
+                return
+            with get_db_connection() as conn:
+                with conn.cursor(dictionary=True) as own_cursor:
+                    self._refresh(own_cursor)
+
+    def invalidate(self):
+        """다음 조회 때 다시 읽도록 표시합니다."""
+        with self._lock:
+            self._loaded_at = None
+
+    def get_versions(self, cursor=None):
+        """
+        마지막으로 확인한 모든 캐시 범위의 버전을 반환합니다. (최대 version_check_seconds 전 값)
+
+        Returns:
+            dict: cache_version.name -> version
+        """
+        self.ensure_fresh(cursor)
+        return dict(self.versions)
+
+    def get_subject(self, subject_id, cursor=None):
+        """
+        과목 정보를 반환합니다.
+
+        Returns:
+            dict: subject_id, name, subject_year, subject_semester, professor_id, professor_name (없으면 None)
+        """
+        self.ensure_fresh(cursor)
+        subject = self._subjects.get(subject_id)
+        return dict(subject) if subject else None
+
+    def get_professor(self, professor_id, cursor=None):
+        """
+        교수 정보를 반환합니다.
+
+        Returns:
+            dict: professor_id, name, major, email, office_location (없으면 None)
+        """
+        self.ensure_fresh(cursor)
+        professor = self._professors.get(professor_id)
+        return dict(professor) if professor else None
+
+    def get_schedule(self, schedule_id, cursor=None):
+        """
+        스케줄 한 건을 반환합니다. (subject_schedule 행, 없으면 None)
+        """
+        self.ensure_fresh(cursor)
+        schedule = self._schedules.get(schedule_id)
+        return dict(schedule) if schedule else None
+
+    def get_professor_subjects(self, professor_id, cursor=None):
+        """
+        교수가 담당하는 과목 리스트를 반환합니다.
+        """
+        self.ensure_fresh(cursor)
+        return [dict(subject) for subject in self._subjects.values() if subject['professor_id'] == professor_id]
+
+    def get_subject_schedules(self, subject_id, cursor=None):
+        """
+        과목의 모든 정규 스케줄을 요일, 시작 시간 순으로 반환합니다. (subject_schedule 행 리스트)
+        """
+        self.ensure_fresh(cursor)
+        return [dict(schedule) for schedule in self._schedules_by_subject.get(subject_id, [])]
+
+    def get_stats(self):
+        """캐시 크기와 버전, 통계를 반환합니다."""
+        return dict(
+            self.stats, version=self.version,
+            subjects=len(self._subjects), professors=len(self._professors), schedules=len(self._schedules)
+        )
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_reference_cache():
+    """
+    현재 프로세스의 기준 정보 캐시를 반환합니다.
+    캐시(REFERENCE_CACHE_ENABLED)가 꺼져 있으면 None을 반환합니다.
+
+    Returns:
+        ReferenceCache 객체 또는 None
+    """
+    global _cache
+    if not REFERENCE_CACHE_CONFIG['enabled']:
+        return None
+    if _cache is None or _cache.pid != os.getpid():
+        with _cache_lock:
+            if _cache is None or _cache.pid != os.getpid():
+                _cache = ReferenceCache(
+                    ttl_seconds=REFERENCE_CACHE_CONFIG['ttl_seconds'],
+                    version_check_seconds=REFERENCE_CACHE_CONFIG['version_check_seconds']
+                )
+    return _cache
+
+
+def get_cache_versions(cursor):
+    """
+    모든 캐시 범위의 버전을 반환합니다.
+    기준 정보 캐시가 켜져 있으면 캐시가 마지막으로 확인한 값을, 꺼져 있으면 DB에서 바로 조회한 값을 반환합니다.
+
+    Args:
+        cursor: 데이터베이스 커서
+
+    Returns:
+        dict: cache_version.name -> version
+    """
+    cache = get_reference_cache()
+    if cache is not None:
+        return cache.get_versions(cursor)
+    return read_cache_versions(cursor)
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_reference_cache()
+#   - 필요성: 페이지마다 반복되는 과목/교수/스케줄 조회를 프로세스 메모리에서 처리함.
+#            버전 확인은 version_check_seconds마다 기본 키 조회 한 번뿐임.
+#   - 사용처: app/utils/db_helpers.py의 get_subject_info()/get_subject_name(),
+#            app/routes/professor_routes.py의 list_subject_sessions(),
+#            app/utils/timetable_cache.py(사용자별 시간표)에서 사용됨.
+#
+# get_cache_versions(cursor)
+#   - 필요성: 캐시 범위(reference, enrollment)별 버전을 캐시 키로 사용하여, 데이터가 바뀐 경우에만 다시 계산함.
+#   - 사용처: app/utils/timetable_cache.py에서 사용됨.
+#
+# bump_cache_version(cursor, name)
+#   - 필요성: 기준 정보/수강 정보를 바꾸는 쓰기 경로에서 버전을 올려 모든 프로세스의 캐시를 무효화함.
+#   - 사용처: 관리 GUI app/admin.py, app/admin_local.py의 bump_table_cache_version()에서 사용됨 (변경과 같은 트랜잭션).
+#
@@ -1,7 +1,52 @@
 """
 세션 관련 유틸리티 함수들
 """
-from flask import session
+from flask import session, g
+from flask.sessions import SecureCookieSessionInterface
+from app.utils.constants import SESSIONLESS_PATH_PREFIXES
+
+
+def start_user_session(user):
+    """
+    로그인에 성공한 사용자 정보를 세션에 저장합니다.
+    이후 요청에서는 get_current_user()가 세션에서 바로 사용자 정보를 읽으므로 DB를 다시 조회하지 않습니다.
+
+    Args:
+        user: 로그인 조회 결과 딕셔너리 (id, name, role, 학생인 경우 student_number)
+    """
+    session.clear()
+    session['logged_in'] = True
+    session['username'] = user['name']
+    session['user_id'] = user['id']
+    session['role'] = user['role']
+    # 학생인 경우 학번도 세션에 저장
+    if user['role'] == 'student':
+        session['student_number'] = user['student_number']
+
+
+def get_current_user():
+    """
+    현재 로그인한 사용자 정보를 반환합니다.
+    세션은 요청당 한 번만 읽어 flask.g에 보관하므로 같은 요청 안에서 여러 번 호출해도 됩니다.
+
+    Returns:
+        dict: 사용자 정보 (로그인하지 않았으면 None)
+            - id: 학생이면 student_id, 교수면 professor_id
+            - number: 학번 (학생인 경우만)
+            - role: 역할 ('student' 또는 'professor')
+            - name: 사용자 이름
+    """
+    if '_current_user' not in g:
+        user = None
+        if session.get('logged_in') and session.get('user_id') is not None:
+            user = {
+                'id': session['user_id'],
+                'number': session.get('student_number'),
+                'role': session.get('role', 'student'),
+                'name': session.get('username', '사용자')
+            }
+        g._current_user = user
+    return g._current_user
 
 
 def get_session_info():
@@ -39,3 +84,41 @@ def get_student_session_info():
         'student_number': session.get('student_number')
     }
 
+
+class SessionlessPathInterface(SecureCookieSessionInterface):
+    """
+    지정한 경로에서는 세션 쿠키를 읽거나 쓰지 않는 세션 인터페이스입니다.
+    서버 시간 API처럼 자주 호출되고 사용자 정보가 필요 없는 요청에서 쿠키 서명 검증을 건너뜁니다.
+    """
+
+    def __init__(self, path_prefixes=SESSIONLESS_PATH_PREFIXES):
+        self.path_prefixes = tuple(path_prefixes)
+
+    def open_session(self, app, request):
+        if request.path.startswith(self.path_prefixes):
+            return self.make_null_session(app)
+        return super().open_session(app, request)
+
+    def save_session(self, app, session, response):
+        if self.is_null_session(session):
+            return
+        super().save_session(app, session, response)
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# start_user_session(user)
+#   - 필요성: 로그인 시 사용자 ID/학번/역할/이름을 한 번만 조회해 세션에 저장함.
+#   - 사용처: app/routes/auth_routes.py의 login()에서 사용됨.
+#
+# get_current_user()
+#   - 필요성: 라우트마다 학번으로 학생 ID를 조회하던 쿼리를 없애고, 세션에 저장된 ID를 요청 단위로 재사용함.
+#   - 사용처: app/routes/main_routes.py, attendance_routes.py의 학생용 라우트에서 사용됨.
+#
+# SessionlessPathInterface
+#   - 필요성: 열린 출석 페이지마다 주기적으로 호출하는 경로에서 세션 쿠키 복호화/재발급 비용을 없앰.
+#            적용 경로는 constants.py의 SESSIONLESS_PATH_PREFIXES에서 관리함.
+#   - 사용처: main.py에서 app.session_interface로 설정됨.
+#
@@ -0,0 +1,400 @@
+"""
+사용자별 시간표 캐시
+주간 시간표 그리드(30분 단위 슬롯 x 월~금)와 rowspan 계산 결과를 사용자별로 보관합니다.
+그리드는 수강 정보나 스케줄이 바뀔 때만 달라지므로 cache_version의 버전을 캐시 키로 사용합니다.
+"""
+import os
+import threading
+from collections import OrderedDict
+from config import TIMETABLE_CACHE_CONFIG
+from app.utils.constants import KOREAN_TO_WEEKDAY, WEEKDAY_NAMES, WEEKDAY_TO_STR
+from app.utils.db_helpers import get_student_today_classes, format_time_to_str
+from app.utils.reference_cache import (
+    get_reference_cache, get_cache_versions, REFERENCE_CACHE_NAME, ENROLLMENT_CACHE_NAME
+)
+
+# 시간표 요일 (월~금만 사용)
+TIMETABLE_DAYS = WEEKDAY_NAMES[:5]
+# 30분 단위 시간 슬롯 (9:00~21:30)
+TIMETABLE_SLOTS = [(h, m) for h in range(9, 22) for m in (0, 30)]
+TIMETABLE_SLOT_MINUTES = 30
+# 압축 배열 형식(/api/timetable)의 열 순서
+TIMETABLE_COMPACT_FIELDS = [
+    'schedule_id', 'subject_id', 'subject_name', 'professor_name',
+    'day', 'start', 'end', 'location', 'slot', 'rowspan'
+]
+
+
+def empty_timetable_grid():
+    """
+    빈 시간표 그리드를 생성합니다.
+
+    Returns:
+        dict: (시, 분) -> {요일: None}
+    """
+    return {slot: {day: None for day in TIMETABLE_DAYS} for slot in TIMETABLE_SLOTS}
+
+
+def build_timetable_grid(schedules):
+    """
+    스케줄 리스트로 시간표 그리드를 생성합니다.
+    수업 시작 슬롯에는 수업 정보와 rowspan을, 병합된 다음 슬롯에는 'skip'을 넣습니다.
+
+    Args:
+        schedules: 스케줄 리스트 (day_of_week, start_time, end_time(timedelta), subject_name 등 포함)
+
+    Returns:
+        dict: (시, 분) -> {요일: 수업 정보 / 'skip' / None}
+    """
+    timetable_grid = empty_timetable_grid()
+
+    for item in schedules:
+        # 시간을 초 단위로 변환
+        start_total_seconds = item['start_time'].total_seconds()
+        end_total_seconds = item['end_time'].total_seconds()
+
+        # 시작 시간 계산
+        start_hour = int(start_total_seconds // 3600)
+        start_minute = int((start_total_seconds % 3600) // 60)
+        # 수업 시간 계산 (분 단위)
+        duration_minutes = (end_total_seconds - start_total_seconds) / 60
+
+        # rowspan 계산 (30분 단위)
+        rowspan = int(duration_minutes / 30)
+
+        # 시작 시간 슬롯에 수업 정보 배치
+        if (start_hour, start_minute) in timetable_grid:
+            timetable_grid[(start_hour, start_minute)][item['day_of_week']] = {
+                **item, 'rowspan': rowspan
+            }
+
+        # 병합된 셀의 다음 슬롯들을 skip으로 표시
+        current_hour, current_minute = start_hour, start_minute
+        for i in range(1, rowspan):
+            current_minute += 30
+            # 60분을 넘어가면 시간 증가
+            if current_minute >= 60:
+                current_hour += 1
+                current_minute -= 60
+            # 해당 슬롯을 skip으로 표시
+            if (current_hour, current_minute) in timetable_grid:
+                timetable_grid[(current_hour, current_minute)][item['day_of_week']] = 'skip'
+
+    return timetable_grid
+
+
+def build_compact_timetable(schedules):
+    """
+    스케줄 리스트를 압축 배열 형식으로 변환합니다. (열 순서는 TIMETABLE_COMPACT_FIELDS)
+    slot은 첫 슬롯(9:00)부터의 30분 단위 위치, rowspan은 차지하는 슬롯 수입니다.
+
+    Args:
+        schedules: load_user_schedules()의 결과
+
+    Returns:
+        list: 수업마다 하나의 리스트 (요일, 시작 시간 순)
+    """
+    first_slot_minutes = TIMETABLE_SLOTS[0][0] * 60 + TIMETABLE_SLOTS[0][1]
+    rows = []
+    for item in sorted(schedules, key=lambda s: (WEEKDAY_NAMES.index(s['day_of_week']), s['start_time'])):
+        start_minutes = int(item['start_time'].total_seconds() // 60)
+        end_minutes = int(item['end_time'].total_seconds() // 60)
+        rows.append([
+            item['schedule_id'], item['subject_id'], item['subject_name'], item['professor_name'],
+            item['day_of_week'],
+            format_time_to_str(item['start_time']),
+            format_time_to_str(item['end_time']),
+            item['location'],
+            (start_minutes - first_slot_minutes) // TIMETABLE_SLOT_MINUTES,
+            (end_minutes - start_minutes) // TIMETABLE_SLOT_MINUTES
+        ])
+    return rows
+
+
+def load_user_schedules(cursor, role, user_id):
+    """
+    사용자의 주간 스케줄 리스트를 조회합니다.
+    학생은 수강 과목, 교수는 담당 과목의 스케줄을 반환합니다.
+    기준 정보 캐시가 켜져 있으면 학생은 수강 과목 ID만 조회하고 나머지는 캐시에서 채웁니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        role: 'student' 또는 'professor'
+        user_id: 학생 ID 또는 교수 ID
+
+    Returns:
+        list: schedule_id, subject_id, subject_name, professor_name, day_of_week(영문),
+              start_time, end_time(timedelta), location을 담은 딕셔너리 리스트
+    """
+    reference_cache = get_reference_cache()
+    schedules = []
+
+    if reference_cache is not None:
+        if role == 'student':
+            cursor.execute("SELECT subject_id FROM enrollment WHERE student_id = %s", (user_id,))
+            subjects = [reference_cache.get_subject(row['subject_id'], cursor) for row in cursor.fetchall()]
+        elif role == 'professor':
+            subjects = reference_cache.get_professor_subjects(user_id, cursor)
+        else:
+            subjects = []
+
+        for subject in subjects:
+            if subject is None:
+                continue
+            for schedule in reference_cache.get_subject_schedules(subject['subject_id'], cursor):
+                schedules.append({
+                    'schedule_id': schedule['schedule_id'],
+                    'subject_id': subject['subject_id'],
+                    'subject_name': subject['name'],
+                    'professor_name': subject['professor_name'],
+                    'day_of_week': schedule['day_of_week'],
+                    'start_time': schedule['start_time'],
+                    'end_time': schedule['end_time'],
+                    'location': schedule['location']
+                })
+    else:
+        query = ""
+        if role == 'student':
+            # 학생이 수강하는 과목의 스케줄 정보 조회
+            query = """
+                SELECT ss.schedule_id, s.subject_id, s.name AS subject_name, p.name AS professor_name,
+                       ss.day_of_week, ss.start_time, ss.end_time, ss.location
+                FROM enrollment e
+                JOIN subject s ON e.subject_id = s.subject_id
+                JOIN subject_schedule ss ON s.subject_id = ss.subject_id
+                LEFT JOIN professor p ON s.professor_id = p.professor_id
+                WHERE e.student_id = %s
+            """
+        elif role == 'professor':
+            # 교수가 담당하는 과목의 스케줄 정보 조회
+            query = """
+                SELECT ss.schedule_id, s.subject_id, s.name AS subject_name, p.name AS professor_name,
+                       ss.day_of_week, ss.start_time, ss.end_time, ss.location
+                FROM subject s
+                JOIN subject_schedule ss ON s.subject_id = ss.subject_id
+                JOIN professor p ON s.professor_id = p.professor_id
+                WHERE p.professor_id = %s
+            """
+        if query:
+            cursor.execute(query, (user_id,))
+            schedules = cursor.fetchall()
+
+    # 요일 형식 통일 (한글 -> 영문)
+    for item in schedules:
+        item['day_of_week'] = KOREAN_TO_WEEKDAY.get(item['day_of_week'], item['day_of_week'])
+    return schedules
+
+
+def get_timetable_version(cursor, role):
+    """
+    사용자 시간표의 버전을 반환합니다.
+    학생은 기준 정보와 수강 정보 버전, 교수는 기준 정보 버전에만 영향을 받습니다.
+
+    Returns:
+        tuple: (reference 버전, enrollment 버전 또는 None)
+    """
+    versions = get_cache_versions(cursor)
+    enrollment_version = versions.get(ENROLLMENT_CACHE_NAME, 0) if role == 'student' else None
+    return versions.get(REFERENCE_CACHE_NAME, 0), enrollment_version
+
+
+def build_user_timetable(cursor, role, user_id, version):
+    """
+    사용자의 시간표 항목(스케줄 리스트, 그리드, 버전)을 생성합니다.
+
+    Returns:
+        dict: version, schedules, grid, compact, etag_base
+    """
+    schedules = load_user_schedules(cursor, role, user_id)
+    return {
+        'version': version,
+        'schedules': schedules,
+        'grid': build_timetable_grid(schedules),
+        'compact': build_compact_timetable(schedules),
+        'etag_base': f"{role}:{user_id}:{version[0]}:{version[1]}"
+    }
+
+
+class TimetableCache:
+    """
+    (역할, 사용자 ID)별 시간표 항목을 보관하는 LRU 캐시입니다.
+
+    - 항목의 버전(기준 정보/수강 정보 버전)이 현재 버전과 다르면 다시 계산
+    - max_entries를 넘으면 가장 오래 사용하지 않은 항목부터 제거
+    - 반환한 항목은 여러 요청이 공유하므로 호출한 쪽에서 수정하지 않아야 함
+    """
+
+    def __init__(self, max_entries=2000):
+        self.max_entries = max_entries
+        self.pid = os.getpid()
+
+        self._lock = threading.Lock()
+        self._entries = OrderedDict()
+        self.stats = {'hits': 0, 'misses': 0}
+
+    def get(self, cursor, role, user_id):
+        """
+        사용자의 시간표 항목을 반환합니다. (버전이 바뀌었거나 없으면 계산 후 보관)
+
+        Args:
+            cursor: 데이터베이스 커서 (dictionary=True)
+            role: 'student' 또는 'professor'
+            user_id: 학생 ID 또는 교수 ID
+
+        Returns:
+            dict: version, schedules, grid, compact, etag_base
+        """
+        key = (role, user_id)
+        version = get_timetable_version(cursor, role)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry['version'] == version:
+                self._entries.move_to_end(key)
+                self.stats['hits'] += 1
+                return entry
+
+        entry = build_user_timetable(cursor, role, user_id, version)
+        with self._lock:
+            self.stats['misses'] += 1
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get_stats(self):
+        """캐시 크기와 조회 통계를 반환합니다."""
+        with self._lock:
+            return dict(self.stats, entries=len(self._entries))
+
+
+_cache = None
+_cache_lock = threading.Lock()
+
+
+def get_timetable_cache():
+    """
+    현재 프로세스의 시간표 캐시를 반환합니다.
+    캐시(TIMETABLE_CACHE_ENABLED)가 꺼져 있으면 None을 반환합니다.
+
+    Returns:
+        TimetableCache 객체 또는 None
+    """
+    global _cache
+    if not TIMETABLE_CACHE_CONFIG['enabled']:
+        return None
+    if _cache is None or _cache.pid != os.getpid():
+        with _cache_lock:
+            if _cache is None or _cache.pid != os.getpid():
+                _cache = TimetableCache(max_entries=TIMETABLE_CACHE_CONFIG['max_entries'])
+    return _cache
+
+
+def get_user_timetable(cursor, role, user_id):
+    """
+    사용자의 시간표 항목을 반환합니다.
+    캐시가 꺼져 있으면 매번 새로 계산합니다.
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        role: 'student' 또는 'professor'
+        user_id: 학생 ID 또는 교수 ID
+
+    Returns:
+        dict: version, schedules(주간 스케줄 리스트), grid(시간표 그리드),
+              compact(압축 배열 형식), etag_base(ETag 계산용 문자열)
+    """
+    cache = get_timetable_cache()
+    if cache is not None:
+        return cache.get(cursor, role, user_id)
+    return build_user_timetable(cursor, role, user_id, get_timetable_version(cursor, role))
+
+
+def load_today_classes(cursor, role, user_id, class_date, weekly_schedules=None):
+    """
+    사용자가 특정 날짜에 듣거나 가르치는 수업 목록을 수업 세션, 출석 상태와 함께 반환합니다.
+    메인 페이지, 출석 페이지, 시간표 페이지, /api/today가 같은 기준으로 사용합니다.
+
+    - 주간 스케줄은 사용자별 시간표 캐시에서 가져오고, 해당 날짜의 세션/출석 상태만 한 번의 쿼리로 조회
+    - 그 날짜 요일의 수업이 없으면 DB를 조회하지 않음
+    - 시간표 캐시가 꺼져 있으면 학생은 get_student_today_classes()의 조인 쿼리 한 번으로 조회
+
+    Args:
+        cursor: 데이터베이스 커서 (dictionary=True)
+        role: 'student' 또는 'professor'
+        user_id: 학생 ID 또는 교수 ID
+        class_date: 수업 날짜 (date 객체)
+        weekly_schedules: 이미 조회한 주간 스케줄 (없으면 get_user_timetable()로 조회)
+
+    Returns:
+        list: 수업 리스트 (시작 시간 순, 새로 만든 딕셔너리이므로 수정해도 됨)
+            - schedule_id, subject_id, subject_name, professor_name, location, start_time, end_time(timedelta)
+            - session_id: 해당 날짜의 수업 세션 ID (세션이 아직 없으면 None)
+            - is_cancelled: 휴강 여부 (세션이 없으면 None)
+            - checkin_status: 출석 상태 코드 (학생만, 출석 기록이 없으면 None)
+    """
+    if weekly_schedules is None:
+        if role == 'student' and get_timetable_cache() is None:
+            return get_student_today_classes(cursor, user_id, class_date)
+        weekly_schedules = get_user_timetable(cursor, role, user_id)['schedules']
+
+    today_day = WEEKDAY_TO_STR[class_date.weekday()]
+    candidates = sorted(
+        (schedule for schedule in weekly_schedules if schedule['day_of_week'] == today_day),
+        key=lambda schedule: schedule['start_time']
+    )
+    if not candidates:
+        return []
+
+    # 해당 날짜의 수업 세션과 (학생인 경우) 출석 상태를 한 번에 조회
+    placeholders = ', '.join(['%s'] * len(candidates))
+    schedule_ids = [schedule['schedule_id'] for schedule in candidates]
+    if role == 'student':
+        cursor.execute(f"""
+            SELECT cs.schedule_id, cs.session_id, cs.is_cancelled, c.status AS checkin_status
+            FROM class_session cs
+            LEFT JOIN checkin c
+                   ON c.session_id = cs.session_id AND c.student_id = %s
+            WHERE cs.class_date = %s
+              AND cs.schedule_id IN ({placeholders})
+        """, (user_id, class_date, *schedule_ids))
+    else:
+        cursor.execute(f"""
+            SELECT schedule_id, session_id, is_cancelled, NULL AS checkin_status
+            FROM class_session
+            WHERE class_date = %s
+              AND schedule_id IN ({placeholders})
+        """, (class_date, *schedule_ids))
+    sessions = {row['schedule_id']: row for row in cursor.fetchall()}
+
+    classes = []
+    for schedule in candidates:
+        class_session = sessions.get(schedule['schedule_id'], {})
+        classes.append(dict(
+            schedule,
+            session_id=class_session.get('session_id'),
+            is_cancelled=class_session.get('is_cancelled'),
+            checkin_status=class_session.get('checkin_status')
+        ))
+    return classes
+
+
+# ============================================================================
+# 헬퍼 함수 사용 설명
+# ============================================================================
+#
+# get_user_timetable(cursor, role, user_id)
+#   - 필요성: 시간표 페이지를 볼 때마다 두 번의 조인 쿼리와 26개 슬롯 x 5일 그리드, rowspan을 다시 계산하지 않음.
+#            수강 정보/스케줄이 바뀌어 cache_version이 올라간 경우에만 다시 계산함.
+#   - 사용처: app/routes/timetable_routes.py의 timetable(), app/routes/api_routes.py의 /api/timetable에서 사용됨.
+#
+# load_today_classes(cursor, role, user_id, class_date, weekly_schedules=None)
+#   - 필요성: 메인/출석/시간표 페이지와 /api/today가 각자 조인 쿼리로 오늘 수업을 조회하지 않고,
+#            캐시된 주간 스케줄에 그날의 세션/출석 상태 조회 한 번만 더함.
+#   - 사용처: app/routes/main_routes.py의 root(), app/routes/attendance_routes.py의 _load_today_classes(),
+#            app/routes/timetable_routes.py의 timetable(), app/routes/api_routes.py의 /api/today에서 사용됨.
+#
+# empty_timetable_grid()
+#   - 필요성: DB 오류 시에도 같은 형태의 빈 시간표를 표시함.
+#   - 사용처: app/routes/timetable_routes.py의 timetable()에서 사용됨.
+#
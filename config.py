@@ -25,6 +25,53 @@ def get_env_variable(name):
     return value
 
 
+def get_env_int(name, default):
+    """
+    정수형 환경 변수를 가져옵니다. 설정되지 않은 경우 기본값을 사용합니다.
+    
+    Args:
+        name: 환경 변수 이름
+        default: 기본값
+        
+    Returns:
+        int: 환경 변수 값 또는 기본값
+    """
+    value = os.getenv(name)
+    return int(value) if value not in (None, '') else default
+
+
+def get_env_float(name, default):
+    """
+    실수형 환경 변수를 가져옵니다. 설정되지 않은 경우 기본값을 사용합니다.
+    
+    Args:
+        name: 환경 변수 이름
+        default: 기본값
+        
+    Returns:
+        float: 환경 변수 값 또는 기본값
+    """
+    value = os.getenv(name)
+    return float(value) if value not in (None, '') else default
+
+
+def get_env_bool(name, default):
+    """
+    불리언 환경 변수를 가져옵니다. '1', 'true', 'yes', 'on'을 참으로 간주합니다.
+    
+    Args:
+        name: 환경 변수 이름
+        default: 기본값
+        
+    Returns:
+        bool: 환경 변수 값 또는 기본값
+    """
+    value = os.getenv(name)
+    if value in (None, ''):
+        return default
+    return value.strip().lower() in ('1', 'true', 'yes', 'on')
+
+
 # 데이터베이스 연결 설정
 # app과 admin_cli에서 모두 import하여 사용합니다.
 DB_CONFIG = {
@@ -32,4 +79,104 @@ DB_CONFIG = {
     'user': get_env_variable('DB_USER'),
     'password': get_env_variable('DB_PASSWORD'),
     'database': get_env_variable('DB_NAME')
-}
\ No newline at end of file
+}
+
+# 데이터베이스 커넥션 풀 설정
+# 환경 변수가 없으면 기본값을 사용합니다. (프로세스마다 별도의 풀이 생성됩니다)
+DB_POOL_CONFIG = {
+    'pool_size': get_env_int('DB_POOL_SIZE', 10),  # 유지할 유휴 연결 수
+    'max_overflow': get_env_int('DB_POOL_MAX_OVERFLOW', 10),  # 순간적으로 추가 허용할 연결 수
+    'recycle_seconds': get_env_int('DB_POOL_RECYCLE', 1800),  # 연결 재생성 주기 (초)
+    'pre_ping': get_env_bool('DB_POOL_PRE_PING', True),  # 대여 전 연결 상태 확인 여부
+    'timeout_seconds': get_env_float('DB_POOL_TIMEOUT', 10.0)  # 풀이 가득 찼을 때 대기 시간 (초)
+}
+
+# 출석 체크 쓰기 지연(배치) 모드 설정
+# 활성화하면 출석 요청을 로컬 로그에 먼저 기록하고 주기적으로 다중 행 INSERT로 반영합니다.
+CHECKIN_BATCH_CONFIG = {
+    'enabled': get_env_bool('CHECKIN_BATCH_ENABLED', False),  # 배치 모드 사용 여부
+    'flush_interval_ms': get_env_int('CHECKIN_BATCH_FLUSH_MS', 200),  # 기록 주기 (밀리초)
+    'max_batch_rows': get_env_int('CHECKIN_BATCH_MAX_ROWS', 500),  # 이 건수가 쌓이면 주기와 무관하게 기록
+    'fsync': get_env_bool('CHECKIN_BATCH_FSYNC', True),  # 요청마다 로그를 디스크에 동기화할지 여부
+    'max_retries': get_env_int('CHECKIN_BATCH_MAX_RETRIES', 5),  # 연결 오류가 아닌 오류로 실패한 세그먼트의 재시도 횟수 (넘으면 -failed.log로 보관)
+    'log_dir': os.getenv(
+        'CHECKIN_BATCH_LOG_DIR',
+        os.path.join(os.path.dirname(os.path.abspath(__file__)), 'var', 'checkin_log')
+    )  # 추가 전용 로그 디렉토리 (재시작 시 복구에 사용)
+}
+
+# 수업 세션 일괄 생성 설정
+# 세션은 매일 자정 scripts/materialize_sessions.py cron 작업으로 생성합니다.
+# on_startup을 켜면 애플리케이션(각 워커 프로세스) 시작 시에도 오늘부터 지정한 일수만큼 미리 생성합니다. (개발용)
+SESSION_MATERIALIZE_CONFIG = {
+    'on_startup': get_env_bool('SESSION_MATERIALIZE_ON_STARTUP', False),  # 시작 시 생성 여부 (기본값: cron 작업에 맡김)
+    'days': get_env_int('SESSION_MATERIALIZE_DAYS', 14)  # 오늘부터 생성할 일수
+}
+
+# 자동 결석 처리 설정
+# 수업 세션을 chunk_size개씩 묶어 INSERT ... SELECT 한 번으로 결석 처리하고 묶음마다 커밋합니다.
+AUTO_ABSENT_CONFIG = {
+    'chunk_size': get_env_int('AUTO_ABSENT_CHUNK_SIZE', 200)  # 한 번에 처리할 수업 세션 수
+}
+
+# 수업별 자동 결석 스케줄러 설정
+# 각 수업의 출석 가능 시간이 끝나면(시작 + ATTENDANCE_WINDOW_MINUTES + grace) 해당 수업의 미출석자를 바로 결석 처리합니다.
+# (23시 59분 scripts/auto_absent_daily.py는 누락분을 보정하는 용도로 유지합니다)
+# 워커 프로세스마다 스케줄러가 시작되므로 기본값은 꺼져 있으며, 정확히 한 프로세스에서만 켭니다.
+ABSENT_SCHEDULER_CONFIG = {
+    'enabled': get_env_bool('ABSENT_SCHEDULER_ENABLED', False),  # 스케줄러 사용 여부 (한 프로세스에서만 켬)
+    'grace_seconds': get_env_int('ABSENT_SCHEDULER_GRACE_SECONDS', 60),  # 출석 마감 후 결석 처리까지 대기 시간 (초)
+    'reload_seconds': get_env_int('ABSENT_SCHEDULER_RELOAD_SECONDS', 300)  # 오늘 수업 목록을 다시 읽는 주기 (초)
+}
+
+# 출석 페이지 실시간 알림(SSE) 설정
+# 학생별 이벤트 스트림으로 출석 가능 시간 시작/종료와 출석 상태 변경을 전달합니다.
+# 연결마다 스레드 하나를 최대 max_stream_seconds 동안 사용하므로 프로세스당 연결 수를 제한합니다.
+# 기본 실행 방식(Dockerfile의 flask run 개발 서버)에서는 열린 탭마다 스레드가 묶이므로 기본값은 꺼져 있으며,
+# 스레드/비동기 작업자(예: gunicorn --threads, gevent)로 실행하는 경우에만 켭니다.
+ATTENDANCE_STREAM_CONFIG = {
+    'enabled': get_env_bool('ATTENDANCE_STREAM_ENABLED', False),  # 실시간 알림 사용 여부 (스레드/비동기 작업자에서만 켬)
+    'max_connections': get_env_int('ATTENDANCE_STREAM_MAX_CONNECTIONS', 200),  # 프로세스당 최대 연결 수
+    'max_per_student': get_env_int('ATTENDANCE_STREAM_MAX_PER_STUDENT', 3),  # 학생당 최대 연결 수 (탭/기기)
+    'heartbeat_seconds': get_env_int('ATTENDANCE_STREAM_HEARTBEAT_SECONDS', 25),  # 연결 유지용 주석 전송 주기 (초)
+    'max_stream_seconds': get_env_int('ATTENDANCE_STREAM_MAX_SECONDS', 1800),  # 연결 최대 유지 시간 (초, 이후 재연결)
+    'retry_seconds': get_env_int('ATTENDANCE_STREAM_RETRY_SECONDS', 30)  # 재연결/재시도 대기 시간 (초)
+}
+
+# 오늘의 출석 가능 시간 인덱스 설정
+# 오늘 수업 세션의 출석 가능 시간을 메모리에 보관하여 출석 체크 시 시간 범위를 확인하고 session_id를 바로 찾습니다.
+ATTENDANCE_WINDOW_INDEX_CONFIG = {
+    'enabled': get_env_bool('ATTENDANCE_WINDOW_INDEX_ENABLED', True),  # 인덱스 사용 여부
+    'reload_seconds': get_env_int('ATTENDANCE_WINDOW_INDEX_RELOAD_SECONDS', 300),  # 오늘 세션 목록을 다시 읽는 주기 (초)
+    'miss_reload_seconds': get_env_int('ATTENDANCE_WINDOW_INDEX_MISS_RELOAD_SECONDS', 30)  # 인덱스에 없는 스케줄 요청 시 다시 읽는 최소 간격 (초)
+}
+
+# 기준 정보(과목/교수/스케줄) 캐시 설정
+# 학기 중 거의 바뀌지 않는 기준 정보를 프로세스 메모리에 보관하고,
+# cache_version 테이블의 버전이 바뀌거나 TTL이 지나면 다시 읽습니다.
+REFERENCE_CACHE_CONFIG = {
+    'enabled': get_env_bool('REFERENCE_CACHE_ENABLED', True),  # 캐시 사용 여부
+    'ttl_seconds': get_env_int('REFERENCE_CACHE_TTL_SECONDS', 600),  # 버전과 무관하게 다시 읽는 주기 (초)
+    'version_check_seconds': get_env_int('REFERENCE_CACHE_VERSION_CHECK_SECONDS', 5)  # 버전 확인 주기 (초)
+}
+
+# 사용자별 시간표 캐시 설정
+# 주간 시간표 그리드를 (역할, 사용자 ID, 기준 정보/수강 정보 버전)마다 한 번만 계산하여 보관합니다.
+TIMETABLE_CACHE_CONFIG = {
+    'enabled': get_env_bool('TIMETABLE_CACHE_ENABLED', True),  # 캐시 사용 여부
+    'max_entries': get_env_int('TIMETABLE_CACHE_MAX_ENTRIES', 2000)  # 보관할 최대 사용자 수 (초과 시 가장 오래 사용하지 않은 항목 제거)
+}
+
+# DB 데이터 내보내기(스트리밍) 설정
+# 테이블 데이터를 버퍼링하지 않는 커서로 batch_size행씩 읽어 내보냅니다. (메모리 사용량이 테이블 크기와 무관)
+DB_EXPORT_CONFIG = {
+    'batch_size': get_env_int('DB_EXPORT_BATCH_SIZE', 1000),  # 한 번에 읽어 전송하는 행 수
+    'gzip_level': get_env_int('DB_EXPORT_GZIP_LEVEL', 6)  # CSV/NDJSON 파일 내보내기의 gzip 압축 레벨 (1~9)
+}
+
+# DB 데이터 HTML 페이지(/db/) 설정
+# 테이블을 기본 키 순서로 page_size행씩 나누어(키셋 페이지네이션) 현재 페이지만 조회합니다.
+DB_BROWSER_CONFIG = {
+    'page_size': get_env_int('DB_BROWSER_PAGE_SIZE', 50),  # 기본 페이지 크기 (행)
+    'max_page_size': get_env_int('DB_BROWSER_MAX_PAGE_SIZE', 500)  # 요청으로 지정할 수 있는 최대 페이지 크기 (행)
+}
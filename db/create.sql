@@ -101,4 +101,49 @@ CREATE TABLE IF NOT EXISTS checkin (
         
     FOREIGN KEY (student_id) REFERENCES student(student_id)
         ON DELETE CASCADE
-) COMMENT '출석 기록';
\ No newline at end of file
+) COMMENT '출석 기록';
+
+-- 10. 출석 통계 요약 테이블 (학생-과목별 출석 집계)
+CREATE TABLE IF NOT EXISTS attendance_summary (
+    student_id INT UNSIGNED NOT NULL COMMENT '학생 외래키',
+    subject_id INT UNSIGNED NOT NULL COMMENT '과목 외래키',
+    present_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '출석 수 (휴강 제외)',
+    late_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '지각 수 (휴강 제외)',
+    absent_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '결석 수 (휴강 제외)',
+    cancelled_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '휴강 수',
+    held_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '진행된 전체 수업 수 (휴강 포함)',
+    as_of_date DATE NOT NULL COMMENT '집계 기준일 (이 날짜까지의 수업을 집계)',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 갱신 시각',
+
+    PRIMARY KEY (student_id, subject_id),
+
+    FOREIGN KEY (student_id) REFERENCES student(student_id)
+        ON DELETE CASCADE,
+    FOREIGN KEY (subject_id) REFERENCES subject(subject_id)
+        ON DELETE CASCADE
+        --   -> (설명) checkin/class_session에서 계산할 수 있는 파생 데이터이므로
+        --      scripts/rebuild_attendance_summary.py로 언제든 다시 만들 수 있습니다.
+) COMMENT '학생-과목별 출석 통계 요약';
+
+
+-- 11. 자동 결석 처리 진행 상황 테이블 (날짜별 처리 완료 기록, 백필 재개용)
+CREATE TABLE IF NOT EXISTS auto_absent_progress (
+    target_date DATE PRIMARY KEY COMMENT '처리 대상 날짜',
+    status ENUM('RUNNING', 'DONE') NOT NULL DEFAULT 'RUNNING' COMMENT '처리 상태',
+    processed_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '처리된 수업 세션 수',
+    absent_count INT UNSIGNED NOT NULL DEFAULT 0 COMMENT '결석 처리된 학생 수',
+    worker VARCHAR(100) COMMENT '처리한 호스트/프로세스',
+    started_at TIMESTAMP NULL COMMENT '처리 시작 시각',
+    finished_at TIMESTAMP NULL COMMENT '처리 완료 시각'
+) COMMENT '자동 결석 처리 진행 상황';
+
+
+-- 12. 캐시 버전 테이블 (프로세스 메모리 캐시 무효화용)
+CREATE TABLE IF NOT EXISTS cache_version (
+    name VARCHAR(50) PRIMARY KEY COMMENT '캐시 범위 (reference: 과목/교수/스케줄, enrollment: 수강 정보)',
+    version BIGINT UNSIGNED NOT NULL DEFAULT 0 COMMENT '변경될 때마다 1씩 증가',
+    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP COMMENT '마지막 변경 시각'
+        --   -> (설명) 초기값을 현재 시각(초)으로 두어 DB를 다시 만들어도 이전 버전 번호와 겹치지 않게 합니다.
+) COMMENT '캐시 버전';
+
+INSERT IGNORE INTO cache_version (name, version) VALUES ('reference', UNIX_TIMESTAMP()), ('enrollment', UNIX_TIMESTAMP());
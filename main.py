@@ -1,18 +1,57 @@
 import os
 from flask import Flask
-from config import DB_CONFIG
+from config import DB_CONFIG, SESSION_MATERIALIZE_CONFIG
 from app.routes.main_routes import main_bp
 from app.routes.auth_routes import auth_bp
 from app.routes.timetable_routes import timetable_bp
 from app.routes.database_routes import db_bp
 from app.routes.attendance_routes import attendance_bp
 from app.routes.professor_routes import professor_bp
+from app.routes.api_routes import api_bp
+from app.utils.db_helpers import init_db
+from app.utils.checkin_batcher import get_checkin_batcher
+from app.utils.absent_scheduler import get_absent_scheduler
+from app.utils.attendance_window_index import get_attendance_window_index
+from app.utils.class_session_helpers import materialize_upcoming_sessions
+from app.utils.session_helpers import SessionlessPathInterface
 
 # Flask 애플리케이션 생성
 app = Flask(__name__, template_folder='app/templates', static_folder='app/static')
 # 시크릿 키는 환경 변수에서 가져오거나 개발용 기본값 사용
 # 프로덕션 환경에서는 반드시 환경 변수로 설정해야 합니다.
 app.secret_key = os.getenv('SECRET_KEY', 'dev-secret-key-change-in-production')
+# 서버 시간 API 등 가벼운 경로에서는 세션 쿠키를 읽지 않음
+app.session_interface = SessionlessPathInterface()
+
+# 요청 단위 DB 연결 반납 콜백 등록 (커넥션 풀)
+init_db(app)
+
+# 출석 배치 모드인 경우 이전 실행에서 남은 로그를 복구하고 백그라운드 기록 시작
+get_checkin_batcher()
+
+# 설정한 경우에만 시작 시 앞으로의 수업 세션을 미리 생성 (기본값은 cron 작업에 맡김, 개발용)
+if SESSION_MATERIALIZE_CONFIG['on_startup']:
+    try:
+        materialize_upcoming_sessions(SESSION_MATERIALIZE_CONFIG['days'])
+    except Exception as e:
+        # DB가 아직 준비되지 않은 경우에도 애플리케이션은 시작
+        print(f"수업 세션 생성 실패 (cron 작업으로 재시도): {e}")
+
+# 오늘의 출석 가능 시간 인덱스를 미리 읽음 (이후 자정/주기마다 출석 체크 시 다시 읽음)
+window_index = get_attendance_window_index()
+if window_index is not None:
+    try:
+        window_index.reload()
+    except Exception as e:
+        print(f"출석 가능 시간 인덱스 생성 실패 (첫 출석 체크 시 재시도): {e}")
+
+# 수업별 출석 마감 직후 미출석자를 결석 처리하는 스케줄러 시작 (ABSENT_SCHEDULER_ENABLED인 프로세스에서만)
+# 디버그(리로더) 모드에서는 감시(부모) 프로세스에서 시작하지 않고 실제 서버를 실행하는 자식 프로세스에서만 시작
+# (flask run은 FLASK_DEBUG로, python main.py는 아래에서 디버그 모드를 표시함)
+if __name__ == '__main__':
+    app.debug = True
+if os.environ.get('WERKZEUG_RUN_MAIN') == 'true' or not app.debug:
+    get_absent_scheduler()
 
 # Blueprint 등록
 app.register_blueprint(main_bp)
@@ -21,6 +60,7 @@ app.register_blueprint(timetable_bp)
 app.register_blueprint(db_bp, url_prefix='/db')
 app.register_blueprint(attendance_bp)
 app.register_blueprint(professor_bp)
+app.register_blueprint(api_bp, url_prefix='/api')
 
 if __name__ == '__main__':
     # 개발 서버 실행 (프로덕션에서는 WSGI 서버 사용)
@@ -2,29 +2,70 @@
 """
 일일 자동 결석 처리 스크립트
 23시 59분에 실행하여 그날 출석 데이터가 없는 경우 자동으로 결석 처리
+(수업별 결석 처리는 애플리케이션의 자동 결석 스케줄러가 출석 마감 직후 수행하므로,
+ 이 스크립트는 스케줄러가 놓친 세션(서버 중단 등)을 보정하는 용도로 실행합니다)
 
 사용법:
     python scripts/auto_absent_daily.py
-    
+
+    # 백필: cron이 실행되지 않은 기간을 한 번에 처리 (완료된 날짜는 건너뛰므로 중단 후 재실행 가능)
+    python scripts/auto_absent_daily.py --start 2025-09-01 --end 2025-09-30
+    python scripts/auto_absent_daily.py --start 2025-09-01 --end 2025-09-30 --workers 4
+    python scripts/auto_absent_daily.py --date 2025-09-15 --force   # 완료된 날짜도 다시 처리
+
 또는 cron으로 실행:
     59 23 * * * /usr/bin/python3 /path/to/scripts/auto_absent_daily.py
 """
 import sys
+import argparse
+from datetime import date
 from pathlib import Path
 
 # 프로젝트 루트 디렉토리를 sys.path에 추가
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
-from app.utils.auto_absent import run_daily_auto_absent
+from app.utils.auto_absent import run_daily_auto_absent, backfill_auto_absent
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="자동 결석 처리 (기본: 오늘, --start/--end 또는 --date 지정 시 백필)")
+    parser.add_argument('--date', type=date.fromisoformat, help="특정 날짜만 처리 (YYYY-MM-DD)")
+    parser.add_argument('--start', type=date.fromisoformat, help="백필 시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument('--end', type=date.fromisoformat, help="백필 종료 날짜 (YYYY-MM-DD, 기본값: 어제)")
+    parser.add_argument('--workers', type=int, default=1, help="동시에 처리할 작업 프로세스 수 (기본값: 1)")
+    parser.add_argument('--force', action='store_true', help="이미 완료된 날짜도 다시 처리")
+    parser.add_argument('--chunk-size', type=int, help="한 번에 처리할 수업 세션 수 (기본값: AUTO_ABSENT_CHUNK_SIZE)")
+    return parser.parse_args()
 
 
 if __name__ == "__main__":
+    args = parse_args()
     try:
-        processed_count, absent_count = run_daily_auto_absent()
-        print(f"처리 완료: {processed_count}개 세션, {absent_count}명 결석 처리")
-        sys.exit(0)
+        # 날짜 지정이 없으면 기존과 같이 오늘 날짜만 처리
+        if not (args.date or args.start or args.end):
+            processed_count, absent_count = run_daily_auto_absent()
+            print(f"처리 완료: {processed_count}개 세션, {absent_count}명 결석 처리")
+            sys.exit(0)
+
+        if args.date:
+            start_date = end_date = args.date
+        else:
+            start_date = args.start or args.end
+            end_date = args.end or date.fromordinal(date.today().toordinal() - 1)
+        if start_date > end_date:
+            print(f"오류 발생: 시작 날짜({start_date})가 종료 날짜({end_date})보다 늦습니다.")
+            sys.exit(1)
+
+        summary = backfill_auto_absent(
+            start_date, end_date,
+            workers=max(args.workers, 1),
+            force=args.force,
+            chunk_size=args.chunk_size
+        )
+        print(f"처리 완료: {summary['processed_count']}개 세션, {summary['absent_count']}명 결석 처리")
+        # 실패한 날짜가 있으면 cron 등에서 알 수 있도록 오류 코드로 종료
+        sys.exit(1 if summary['failed'] else 0)
     except Exception as e:
         print(f"오류 발생: {e}")
         sys.exit(1)
-
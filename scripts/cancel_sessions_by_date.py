@@ -0,0 +1,43 @@
+#!/usr/bin/env python3
+"""
+날짜 일괄 휴강 스크립트
+공휴일, 시험 기간 등 특정 날짜의 모든 과목 수업을 한 번에 휴강 처리합니다.
+휴강된 수업의 모든 수강생은 '출석'으로 처리됩니다 (교수 화면의 휴강 처리와 동일).
+
+사용법:
+    python scripts/cancel_sessions_by_date.py --date 2025-10-03 --dry-run   # 영향받는 건수만 확인
+    python scripts/cancel_sessions_by_date.py --date 2025-10-03
+    python scripts/cancel_sessions_by_date.py --date 2025-10-20 --date 2025-10-21
+"""
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.class_session_helpers import cancel_sessions_on_date
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="특정 날짜의 모든 수업 일괄 휴강")
+    parser.add_argument('--date', type=date.fromisoformat, action='append', required=True,
+                        help="휴강할 날짜 (YYYY-MM-DD, 여러 번 지정 가능)")
+    parser.add_argument('--dry-run', action='store_true', help="변경하지 않고 영향받는 건수만 출력")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        for class_date in args.date:
+            result = cancel_sessions_on_date(class_date, dry_run=args.dry_run)
+            prefix = "[dry-run] " if args.dry_run else ""
+            print(f"{prefix}{class_date}: {result['subjects']}개 과목, {result['sessions']}개 세션 휴강, "
+                  f"{result['students']}명 출석 처리")
+        sys.exit(0)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        sys.exit(1)
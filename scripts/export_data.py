@@ -0,0 +1,93 @@
+#!/usr/bin/env python3
+"""
+DB 데이터 내보내기 스크립트
+테이블 전체 또는 조건에 맞는 출석 기록을 gzip 압축 CSV/NDJSON 파일로 내보냅니다. (오프라인 분석용)
+버퍼링하지 않는 커서로 DB_EXPORT_BATCH_SIZE행씩 읽어 바로 압축/기록하므로 데이터 크기와 관계없이 메모리 사용량이 일정합니다.
+
+사용법:
+    python scripts/export_data.py                                                   # 전체 출석 기록 -> attendance.csv.gz
+    python scripts/export_data.py --year 2025 --semester 2 --subject-id 3
+    python scripts/export_data.py --from 2025-09-01 --to 2025-09-30 --format ndjson
+    python scripts/export_data.py --table checkin --output checkin.csv.gz
+    python scripts/export_data.py --table student --no-gzip --output -              # 표준 출력
+"""
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.db_helpers import get_db_connection, get_table_names
+from app.utils.db_export import (
+    stream_query_rows, gzip_chunks, build_attendance_export_query, EXPORT_FILE_MIMETYPES
+)
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="테이블 또는 출석 기록을 CSV/NDJSON 파일로 내보내기")
+    parser.add_argument('--table', help="내보낼 테이블 이름 (없으면 출석 기록)")
+    parser.add_argument('--subject-id', type=int, help="출석 기록: 과목 ID")
+    parser.add_argument('--year', type=int, help="출석 기록: 개설 연도")
+    parser.add_argument('--semester', type=int, help="출석 기록: 개설 학기")
+    parser.add_argument('--from', dest='date_from', type=date.fromisoformat, help="출석 기록: 시작 수업일 (YYYY-MM-DD)")
+    parser.add_argument('--to', dest='date_to', type=date.fromisoformat, help="출석 기록: 종료 수업일 (YYYY-MM-DD)")
+    parser.add_argument('--format', choices=sorted(EXPORT_FILE_MIMETYPES), default='csv', help="파일 형식 (기본값: csv)")
+    parser.add_argument('--no-gzip', action='store_true', help="압축하지 않음")
+    parser.add_argument('--output', help="출력 파일 경로 ('-'이면 표준 출력, 기본값: <테이블|attendance>.<형식>[.gz])")
+    return parser.parse_args()
+
+
+def build_export(args):
+    """
+    인자에 맞는 쿼리, 파라미터, 기본 파일 이름을 만듭니다.
+
+    Returns:
+        (query, params, name) 튜플
+    """
+    if args.table:
+        with get_db_connection() as conn:
+            with conn.cursor() as cursor:
+                tables = get_table_names(cursor)
+        # 쿼리에 테이블 이름을 직접 넣으므로 실제 테이블 목록으로 검증
+        if args.table not in tables:
+            raise ValueError(f"테이블을 찾을 수 없습니다: {args.table}")
+        return f"SELECT * FROM `{args.table}`", (), args.table
+
+    query, params = build_attendance_export_query(
+        subject_id=args.subject_id,
+        year=args.year,
+        semester=args.semester,
+        date_from=args.date_from,
+        date_to=args.date_to
+    )
+    return query, params, 'attendance'
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        query, params, name = build_export(args)
+        compress = not args.no_gzip
+        output = args.output or f"{name}.{args.format}{'.gz' if compress else ''}"
+
+        chunks = stream_query_rows(query, params, args.format)
+        chunks = gzip_chunks(chunks) if compress else (chunk.encode('utf-8') for chunk in chunks)
+
+        written = 0
+        out = sys.stdout.buffer if output == '-' else open(output, 'wb')
+        try:
+            for data in chunks:
+                out.write(data)
+                written += len(data)
+        finally:
+            if out is not sys.stdout.buffer:
+                out.close()
+        if output != '-':
+            print(f"내보내기 완료: {output} ({written:,} bytes)")
+        sys.exit(0)
+    except Exception as e:
+        print(f"오류 발생: {e}", file=sys.stderr)
+        sys.exit(1)
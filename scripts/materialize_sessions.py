@@ -0,0 +1,55 @@
+#!/usr/bin/env python3
+"""
+수업 세션 일괄 생성 스크립트
+subject_schedule을 기준으로 기간 내 모든 class_session 행을 미리 생성합니다.
+페이지 조회 시 세션을 생성하지 않도록 매일 자정에 실행합니다.
+
+사용법:
+    python scripts/materialize_sessions.py                      # 오늘부터 14일
+    python scripts/materialize_sessions.py --days 30            # 오늘부터 30일
+    python scripts/materialize_sessions.py --semester 2025-2    # 2025년 2학기 전체
+    python scripts/materialize_sessions.py --start 2025-09-01 --end 2025-12-31 --subject-id 3
+
+또는 cron으로 실행:
+    0 0 * * * /usr/bin/python3 /path/to/scripts/materialize_sessions.py --days 14
+"""
+import sys
+import argparse
+from datetime import date, timedelta
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.class_session_helpers import run_session_materializer
+from app.utils.constants import get_semester_dates
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="수업 세션(class_session) 일괄 생성")
+    parser.add_argument('--start', type=date.fromisoformat, help="시작 날짜 (YYYY-MM-DD)")
+    parser.add_argument('--end', type=date.fromisoformat, help="종료 날짜 (YYYY-MM-DD)")
+    parser.add_argument('--days', type=int, default=14, help="오늘부터 생성할 일수 (기본값: 14)")
+    parser.add_argument('--semester', help="학기 전체 생성 (예: 2025-2)")
+    parser.add_argument('--subject-id', type=int, help="특정 과목만 생성")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        # 학기 지정 시 학기 전체, 날짜 지정 시 해당 기간, 그 외에는 오늘부터 --days일
+        if args.semester:
+            year, semester = (int(value) for value in args.semester.split('-'))
+            start_date, end_date = get_semester_dates(year, semester)
+        else:
+            start_date = args.start or date.today()
+            end_date = args.end or start_date + timedelta(days=max(args.days, 1) - 1)
+
+        created_count = run_session_materializer(start_date, end_date, subject_id=args.subject_id)
+        print(f"처리 완료: {created_count}개 세션 생성")
+        sys.exit(0)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        sys.exit(1)
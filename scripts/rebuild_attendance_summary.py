@@ -0,0 +1,49 @@
+#!/usr/bin/env python3
+"""
+출석 통계 요약 재계산 스크립트
+attendance_summary 테이블을 checkin/class_session/enrollment 원본 데이터와 일치하도록 다시 계산합니다.
+날짜가 바뀌면 진행된 수업 수가 달라지므로 매일 자정 직후에 실행합니다.
+
+사용법:
+    python scripts/rebuild_attendance_summary.py                    # 오늘 기준 전체 재계산
+    python scripts/rebuild_attendance_summary.py --subject-id 3     # 특정 과목만 재계산
+    python scripts/rebuild_attendance_summary.py --as-of 2025-12-31
+
+또는 cron으로 실행:
+    5 0 * * * /usr/bin/python3 /path/to/scripts/rebuild_attendance_summary.py
+"""
+import sys
+import argparse
+from datetime import date
+from pathlib import Path
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+from app.utils.attendance_summary import rebuild_attendance_summary
+from app.utils.constants import ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE
+
+
+def parse_args():
+    parser = argparse.ArgumentParser(description="출석 통계 요약(attendance_summary) 재계산")
+    parser.add_argument('--as-of', type=date.fromisoformat, help="집계 기준일 (YYYY-MM-DD, 기본값: 오늘)")
+    parser.add_argument('--subject-id', type=int, help="특정 과목만 재계산")
+    parser.add_argument('--chunk-size', type=int, default=ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE,
+                        help=f"한 번에 재계산할 과목 수 (기본값: {ATTENDANCE_SUMMARY_REBUILD_CHUNK_SIZE})")
+    return parser.parse_args()
+
+
+if __name__ == "__main__":
+    args = parse_args()
+    try:
+        refreshed_count, removed_count = rebuild_attendance_summary(
+            as_of_date=args.as_of,
+            subject_id=args.subject_id,
+            chunk_size=max(args.chunk_size, 1)
+        )
+        print(f"처리 완료: {refreshed_count}개 갱신, {removed_count}개 삭제")
+        sys.exit(0)
+    except Exception as e:
+        print(f"오류 발생: {e}")
+        sys.exit(1)
@@ -0,0 +1,83 @@
+"""
+테스트 공통 설정
+DB 서버 없이도 모듈을 불러올 수 있도록 필수 환경 변수의 기본값을 지정하고,
+실행한 쿼리를 기록하는 가짜 커서와 (설정한 경우에만) 실제 MySQL 연결을 제공합니다.
+
+실제 MySQL 테스트 실행 방법:
+    db/create.sql로 만든 테스트용 DB를 DB_* 환경 변수(.env)로 지정하고
+    WCHECK_TEST_MYSQL=true python -m pytest
+"""
+import os
+import sys
+from pathlib import Path
+
+import pytest
+from dotenv import load_dotenv
+
+# 프로젝트 루트 디렉토리를 sys.path에 추가
+project_root = Path(__file__).parent.parent
+sys.path.insert(0, str(project_root))
+
+# .env 값을 먼저 읽고, 없는 값만 테스트용 기본값으로 채움
+load_dotenv(project_root / '.env')
+for name, value in {
+    'DB_HOST': 'localhost',
+    'DB_USER': 'test',
+    'DB_PASSWORD': 'test',
+    'DB_NAME': 'wcheck',
+}.items():
+    os.environ.setdefault(name, value)
+
+
+class StubCursor:
+    """
+    실행한 쿼리를 기록하고, 쿼리에 포함된 문자열에 맞춰 미리 지정한 행을 돌려주는 가짜 커서입니다.
+
+    Args:
+        results: (쿼리에 포함된 문자열, 행 리스트) 튜플 리스트 (먼저 일치하는 항목 사용)
+    """
+
+    def __init__(self, results=None):
+        self.results = results or []
+        self.queries = []
+        self.rowcount = 0
+        self._rows = []
+
+    def execute(self, query, params=None):
+        self.queries.append((query, params))
+        self._rows = next((list(rows) for key, rows in self.results if key in query), [])
+        self.rowcount = len(self._rows)
+
+    def fetchone(self):
+        return self._rows.pop(0) if self._rows else None
+
+    def fetchall(self):
+        rows, self._rows = self._rows, []
+        return rows
+
+    def close(self):
+        pass
+
+
+@pytest.fixture
+def stub_cursor():
+    """StubCursor 클래스를 반환합니다. (테스트에서 결과를 지정해 생성)"""
+    return StubCursor
+
+
+@pytest.fixture
+def mysql_connection():
+    """
+    WCHECK_TEST_MYSQL이 켜진 경우에만 DB_* 설정으로 실제 MySQL에 연결합니다.
+    테스트가 끝나면 롤백하므로 테스트 데이터는 남지 않습니다.
+    """
+    from config import DB_CONFIG, get_env_bool
+    if not get_env_bool('WCHECK_TEST_MYSQL', False):
+        pytest.skip("실제 MySQL 테스트는 WCHECK_TEST_MYSQL=true일 때만 실행합니다.")
+    from mysql.connector import connect
+    connection = connect(**DB_CONFIG)
+    try:
+        yield connection
+    finally:
+        connection.rollback()
+        connection.close()
@@ -0,0 +1,44 @@
+"""
+자동 결석 처리(app/utils/auto_absent.py) 테스트
+"""
+from datetime import date, timedelta
+
+from app.utils.auto_absent import mark_absent_for_sessions
+
+
+def test_mark_absent_for_sessions_on_mysql(mysql_connection):
+    """실제 MySQL에서 미출석 수강생만 결석 처리되고, 다시 실행해도 기존 기록이 유지되는지 확인"""
+    with mysql_connection.cursor(dictionary=True) as cursor:
+        cursor.execute("INSERT INTO subject (name, subject_year, subject_semester) VALUES ('자동 결석 테스트', 2025, 2)")
+        subject_id = cursor.lastrowid
+        cursor.execute(
+            "INSERT INTO subject_schedule (subject_id, day_of_week, start_time, end_time) "
+            "VALUES (%s, 'MON', '09:00:00', '10:00:00')", (subject_id,)
+        )
+        schedule_id = cursor.lastrowid
+        # 다른 테스트 데이터와 겹치지 않도록 먼 미래 날짜 사용
+        cursor.execute(
+            "INSERT INTO class_session (schedule_id, class_date) VALUES (%s, %s)",
+            (schedule_id, date(2099, 1, 5) + timedelta(days=7 * (subject_id % 1000)))
+        )
+        session_id = cursor.lastrowid
+        student_ids = []
+        for index in range(2):
+            cursor.execute(
+                "INSERT INTO student (name, student_number) VALUES (%s, %s)",
+                (f"테스트 학생 {index}", f"T-ABSENT-{subject_id}-{index}")
+            )
+            student_ids.append(cursor.lastrowid)
+            cursor.execute("INSERT INTO enrollment (student_id, subject_id) VALUES (%s, %s)",
+                           (cursor.lastrowid, subject_id))
+        cursor.execute("INSERT INTO checkin (session_id, student_id, status) VALUES (%s, %s, 'PRESENT')",
+                       (session_id, student_ids[0]))
+
+        assert mark_absent_for_sessions(cursor, [session_id]) == 1
+        assert mark_absent_for_sessions(cursor, [session_id]) == 0
+
+        cursor.execute("SELECT student_id, status FROM checkin WHERE session_id = %s ORDER BY student_id",
+                       (session_id,))
+        assert [(row['student_id'], row['status']) for row in cursor.fetchall()] == [
+            (student_ids[0], 'PRESENT'), (student_ids[1], 'ABSENT')
+        ]
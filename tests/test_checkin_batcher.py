@@ -0,0 +1,52 @@
+"""
+출석 배처(app/utils/checkin_batcher.py) 테스트
+"""
+from datetime import date
+
+from mysql.connector.errors import InterfaceError, ProgrammingError
+
+from app.utils.checkin_batcher import CheckinBatcher, FAILED_SUFFIX
+
+
+def make_batcher(tmp_path, write):
+    """백그라운드 스레드 없이 DB 기록 함수를 바꾼 배처를 만듭니다."""
+    batcher = CheckinBatcher(tmp_path, flush_interval_ms=60000, max_retries=2)
+    batcher.log_dir.mkdir(parents=True, exist_ok=True)
+    with batcher._lock:
+        batcher._open_segment()
+    batcher._write = write
+    return batcher
+
+
+def test_failing_segment_is_dead_lettered_and_later_segments_are_written(tmp_path):
+    written = []
+
+    def write(entries):
+        if entries[0]['student_number'] == 'bad':
+            raise ProgrammingError("잘못된 요청")
+        written.extend(entry['student_number'] for entry in entries)
+        return len(entries)
+
+    batcher = make_batcher(tmp_path, write)
+    batcher.submit(1, date(2025, 9, 8), 'bad')
+    batcher.flush()
+    batcher.submit(1, date(2025, 9, 8), 'good')
+    batcher.flush()
+
+    assert written == ['good']
+    assert batcher.stats['dead_lettered'] == 1
+    failed = [path.name for path in tmp_path.iterdir() if path.name.endswith(FAILED_SUFFIX)]
+    assert len(failed) == 1
+
+
+def test_connection_errors_keep_segment_for_retry(tmp_path):
+    def write(entries):
+        raise InterfaceError("연결 끊김")
+
+    batcher = make_batcher(tmp_path, write)
+    batcher.submit(1, date(2025, 9, 8), '20250001')
+    for _ in range(5):
+        batcher.flush()
+
+    assert batcher.stats['dead_lettered'] == 0
+    assert len(batcher._pending) == 1
@@ -0,0 +1,20 @@
+"""
+출석 기록 엔진(app/utils/checkin_engine.py) 테스트
+"""
+from app.utils.checkin_engine import save_session_statuses
+
+
+def test_save_session_statuses_writes_absent_for_students_without_checkin(stub_cursor):
+    """출석 기록이 없는 학생을 '결석'으로 저장하면 ABSENT 행을 기록하고, 저장된 상태와 같은 학생은 건너뜀"""
+    cursor = stub_cursor([('FROM class_session cs', [
+        {'student_id': 1, 'status': None},
+        {'student_id': 2, 'status': 'ABSENT'},
+        {'student_id': 3, 'status': 'PRESENT'},
+    ])])
+
+    changed = save_session_statuses(cursor, 10, {'1': 'ABSENT', '2': 'ABSENT', '3': 'LATE', '4': 'PRESENT'})
+
+    assert changed == [1, 3]
+    insert_query, params = cursor.queries[-1]
+    assert insert_query.strip().startswith('INSERT INTO checkin')
+    assert params == [10, 1, 'ABSENT', 10, 3, 'LATE']
@@ -0,0 +1,92 @@
+"""
+오늘 수업 조회(load_today_classes, _load_today_classes) 테스트
+출석 상태 표시와, 수업 수와 관계없이 쿼리 수가 일정한지 확인합니다. (수업마다 세션/출석을 따로 조회하지 않음)
+"""
+from datetime import date, datetime, timedelta
+
+import pytest
+
+import app.utils.timetable_cache as timetable_cache
+from app.routes.attendance_routes import _load_today_classes
+from app.utils.attendance_helpers import format_attendance_status
+from app.utils.db_pool import CountingCursor
+
+CLASS_DATE = date(2025, 9, 8)  # 월요일
+
+
+class QueryCounter:
+    """CountingCursor가 쿼리 수를 더하는 연결 대신 사용하는 객체"""
+
+    def __init__(self):
+        self.query_count = 0
+
+
+def make_class_rows(count):
+    """db_helpers.get_student_today_classes()의 조인 결과 형식으로 수업 count개를 만듭니다."""
+    return [
+        {
+            'schedule_id': index, 'subject_id': index, 'subject_name': f"과목 {index}",
+            'professor_name': "교수", 'location': f"강의실 {index}",
+            'start_time': timedelta(hours=9 + index), 'end_time': timedelta(hours=10 + index),
+            'session_id': 100 + index, 'is_cancelled': False,
+            'checkin_status': 'PRESENT' if index % 2 else None
+        }
+        for index in range(1, count + 1)
+    ]
+
+
+def counting_cursor(stub_cursor, results):
+    """StubCursor를 CountingCursor로 감싸 (커서, 카운터)를 반환합니다."""
+    counter = QueryCounter()
+    return CountingCursor(counter, stub_cursor(results)), counter
+
+
+def test_attendance_page_loader_shows_checkin_status(stub_cursor, monkeypatch):
+    # 조인 결과의 출석 상태 코드를 표시명으로 바꾸고, 출석 기록이 없으면 '미출석'으로 표시
+    monkeypatch.setattr(timetable_cache, 'get_timetable_cache', lambda: None)
+    rows = make_class_rows(3)
+    rows[1]['checkin_status'] = 'LATE'
+    rows[2].update(session_id=None, checkin_status=None)
+    cursor, _ = counting_cursor(stub_cursor, [('FROM enrollment e', rows)])
+
+    today_classes = _load_today_classes(cursor, 1, datetime.combine(CLASS_DATE, datetime.min.time()))
+
+    assert [(c['schedule_id'], c['session_id'], c['status']) for c in today_classes] == [
+        (1, 101, format_attendance_status('PRESENT')),
+        (2, 102, format_attendance_status('LATE')),
+        (3, None, '미출석'),
+    ]
+
+
+@pytest.mark.parametrize('class_count', [1, 5])
+def test_load_today_classes_with_cached_timetable_uses_one_query(stub_cursor, class_count):
+    rows = make_class_rows(class_count)
+    weekly_schedules = [
+        {key: row[key] for key in ('schedule_id', 'subject_id', 'subject_name', 'professor_name',
+                                   'location', 'start_time', 'end_time')}
+        for row in rows
+    ]
+    for schedule in weekly_schedules:
+        schedule['day_of_week'] = 'MON'
+    sessions = [
+        {key: row[key] for key in ('schedule_id', 'session_id', 'is_cancelled', 'checkin_status')}
+        for row in rows
+    ]
+    cursor, counter = counting_cursor(stub_cursor, [('FROM class_session cs', sessions)])
+
+    classes = timetable_cache.load_today_classes(cursor, 'student', 1, CLASS_DATE, weekly_schedules)
+
+    assert [c['session_id'] for c in classes] == [row['session_id'] for row in rows]
+    assert counter.query_count == 1
+
+
+@pytest.mark.parametrize('class_count', [1, 5])
+def test_attendance_page_loader_query_count_is_constant(stub_cursor, monkeypatch, class_count):
+    # 시간표 캐시가 꺼진 경우: 조인 쿼리 한 번으로 수업, 세션, 출석 상태를 함께 조회
+    monkeypatch.setattr(timetable_cache, 'get_timetable_cache', lambda: None)
+    cursor, counter = counting_cursor(stub_cursor, [('FROM enrollment e', make_class_rows(class_count))])
+
+    today_classes = _load_today_classes(cursor, 1, datetime.combine(CLASS_DATE, datetime.min.time()))
+
+    assert len(today_classes) == class_count
+    assert counter.query_count == 1